@@ -0,0 +1,116 @@
+"""
+Stress benchmark of ConfigArgs.parse_json called from several threads on the same ConfigArgs instance.
+
+Each thread count runs for a fixed number of parses per thread, all threads starting together, and every result is
+compared with the result of a single-threaded parse, so races show up as failures rather than as wrong numbers. The
+throughput of each thread count is reported with its speedup over one thread: on free-threaded CPython builds (3.13t
+and later) parsing should scale with the number of cores, while with the GIL the speedup stays close to 1.
+
+Usage::
+
+    python benchmarks/thread_scaling.py --threads 1 2 4 8 --parses 200 --elements 2000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import NamedTuple, List, Dict, Union
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import json_configparser  # noqa: E402
+
+
+class Options(NamedTuple):
+    name: str
+    weights: List[float]
+    routes: Dict[str, List[int]]
+    hosts: List[Dict[str, str]]
+    retries: int = 3
+
+
+def _write_config(directory: str, elements: int) -> str:
+    config = {"name": "service",
+              "weights": [i / elements for i in range(elements)],
+              "routes": {"route-{}".format(i): [i, i + 1, i + 2] for i in range(elements // 10 + 1)},
+              "hosts": [{"host": "host-{}".format(i), "zone": "eu"} for i in range(elements // 10 + 1)]}
+
+    path_to_json = os.path.join(directory, "config.json")
+    with open(path_to_json, "w", encoding="utf-8") as f:
+        json.dump(config, f)
+    return path_to_json
+
+
+def _run(args_object: json_configparser.ConfigArgs, path_to_json: str, expected: dict, threads: int,
+         parses: int) -> float:
+    """
+    :return: The number of parses per second of all threads together.
+    :raises AssertionError: If a thread parsed a different result, or raised an error.
+    """
+    barrier = threading.Barrier(threads + 1)
+    errors = []
+
+    def work():
+        barrier.wait()
+        try:
+            for _ in range(parses):
+                if args_object.parse_json(path_to_json) != expected:
+                    raise AssertionError("A thread parsed a different result")
+        except Exception as e:  # Reported by the main thread
+            errors.append(e)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    if errors:
+        raise AssertionError("{} of {} threads failed, first error: {!r}".format(len(errors), threads, errors[0]))
+    return threads * parses / elapsed
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure how parse_json throughput scales with threads.")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--parses", type=int, default=200, help="parses per thread")
+    parser.add_argument("--elements", type=int, default=2000, help="elements of the weights list")
+    parser.add_argument("--frozen", action="store_true", help="parse frozen results")
+    args = parser.parse_args(argv)
+
+    args_object = json_configparser.ConfigArgs(
+        Options, [json_configparser.Bounds("weights", lower_bound=0, upper_bound=1),
+                  json_configparser.Bounds("retries", lower_bound=0)],
+        frozen=args.frozen,
+        str_constraints_lst=[json_configparser.StringConstraints("hosts", pattern="[a-z0-9-]+")],
+        validators_lst=[json_configparser.Validator("routes", lambda selected: None, ["routes"])])
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    build = "GIL enabled" if gil_enabled else "free-threaded"
+    print("Python {} ({}), {} CPUs".format(sys.version.split()[0], build, os.cpu_count()))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path_to_json = _write_config(directory, args.elements)
+        expected = args_object.parse_json(path_to_json)
+
+        print("{:>8} {:>14} {:>9} {:>11}".format("threads", "parses/s", "speedup", "efficiency"))
+        baseline = None
+        for threads in args.threads:
+            throughput = _run(args_object, path_to_json, expected, threads, args.parses)
+            baseline = throughput / threads if baseline is None else baseline
+            speedup = throughput / baseline
+            print("{:>8} {:>14.1f} {:>8.2f}x {:>10.0%}".format(threads, throughput, speedup, speedup / threads))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
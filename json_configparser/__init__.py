@@ -1,3 +1,15 @@
 # flake8: noqa
 from .config_args import ConfigArgs
 from .bounds import Bounds
+from .collection_constraints import CollectionConstraints
+from .string_constraints import StringConstraints
+from .limits import Limits, LimitExceededError
+from .shared_config import SharedConfig
+from .sources import FileSource, DirectorySource, ZipMemberSource, HttpSource
+from .frozen_dict import FrozenDict
+from .validators import Validator
+from .sampling import SamplingPolicy
+from .path_view import PathView
+from .dispatch import SchemaDispatcher
+from .columnar import ColumnTable
+from .memory import MemoryReport
@@ -0,0 +1,170 @@
+"""
+Implements the validation of many configurations at once, used by ConfigArgs.validate_batch.
+
+The argument names are checked once per distinct set of keys. Each argument is then gathered across all configurations
+into a column, and columns of ints and floats which all have exactly the expected type have their bounds checked on
+the minimum and maximum of the column only, with NumPy if it is installed. Other values are validated one by one.
+"""
+
+import copy
+from collections.abc import Mapping
+from typing import NamedTuple, Dict, Any, List
+
+from . import type_defaults
+from . import validations
+
+# NumPy is optional, and only imported by the first batch with a bounded numeric column, so importing this package
+# does not pay for it. Set to the module, or to None if it is not installed, once imported.
+numpy = _NOT_IMPORTED = object()
+
+_NUMPY_DTYPES = {int: "int64", float: "float64"}
+
+
+class BatchResult(NamedTuple):
+    """
+    NamedTuple representing the outcome of validating one configuration of a batch.
+    Exactly one of args and error is not None.
+    """
+    #: the index of the configuration in the batch
+    index: int
+    #: the dictionary mapping argument name to value, if the configuration is valid
+    args: Dict[str, Any] = None
+    #: the exception raised while validating the configuration, if it is invalid
+    error: Exception = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Flag indicating if the configuration was successfully validated.
+        """
+        return self.error is None
+
+
+def _import_numpy():
+    global numpy
+    if numpy is _NOT_IMPORTED:
+        # Importing twice from two threads is harmless
+        try:
+            import numpy as numpy_module
+        except ImportError:
+            numpy_module = None
+        numpy = numpy_module
+    return numpy
+
+
+def _column_extremes(values: List[Any], type_: type) -> Any:
+    """
+    Returns the minimum and maximum of a column of ints or floats, or None if the column contains NaN, whose
+    comparisons would hide the other values.
+    """
+    numpy_module = _import_numpy()
+    if numpy_module is not None:
+        try:
+            column = numpy_module.array(values, dtype=_NUMPY_DTYPES[type_])
+        except OverflowError:
+            # ints beyond 64 bits are compared by Python
+            pass
+        else:
+            if type_ == float and numpy_module.isnan(column).any():
+                return None
+            return column.min().item(), column.max().item()
+
+    if type_ == float and any(value != value for value in values):
+        return None
+    return min(values), max(values)
+
+
+def validate_column(values: List[Any], arg_type_defaults: type_defaults.TypeDefaultBounds) -> List[Any]:
+    """
+    Validates the values of one argument across configurations.
+
+    :param values: The values of the argument.
+    :param arg_type_defaults: The TypeDefaultBounds of the argument.
+    :return: For each value, the validated value or the exception it raised.
+    """
+    type_ = arg_type_defaults.type_
+    if type_ in _NUMPY_DTYPES and all(type(value) is type_ for value in values):
+        if arg_type_defaults.bound_obj is None:
+            return values
+
+        extremes = _column_extremes(values, type_)
+        if extremes is not None:
+            try:
+                for value in extremes:
+                    arg_type_defaults.bound_obj.validate_value(value)
+                return values
+            except ValueError:
+                # Some values are out of bounds, which are found one by one
+                pass
+
+    results = []
+    for value in values:
+        try:
+            results.append(validations.validate_argument(value, arg_type_defaults))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def validate_configs(config_args, args_dicts: List[Mapping]) -> List[BatchResult]:
+    """
+    Validates many configurations against a ConfigArgs instance, capturing the error of each invalid configuration.
+    The error of a configuration is the one validate_dict would raise for it.
+
+    :param config_args: The ConfigArgs instance.
+    :param args_dicts: The configurations, each a mapping from argument name to value, which are not modified.
+    :return: One BatchResult per configuration, in the same order.
+    """
+    errors = [None] * len(args_dicts)
+    validated_dicts = [None] * len(args_dicts)
+    provided_names = [None] * len(args_dicts)
+
+    # Maps each distinct set of keys to its provided argument names, or to the error it raises
+    key_set_results = {}
+    for i, args_dict in enumerate(args_dicts):
+        if not isinstance(args_dict, Mapping):
+            errors[i] = TypeError("The configuration should be a mapping from argument names to values "
+                                  "(configuration: {})".format(args_dict))
+            continue
+
+        key_set = frozenset(args_dict.keys())
+        if key_set not in key_set_results:
+            try:
+                key_set_results[key_set] = config_args._check_arg_names(key_set)
+            except ValueError as e:
+                key_set_results[key_set] = e
+
+        key_set_result = key_set_results[key_set]
+        if isinstance(key_set_result, Exception):
+            errors[i] = copy.copy(key_set_result)
+        else:
+            provided_names[i] = key_set_result
+            validated_dicts[i] = {}
+
+    # Arguments are validated in the definition order of the options class, so each configuration reports the same
+    # error as validate_dict
+    for arg_name in config_args.options_class._fields:
+        indexes = [i for i, names in enumerate(provided_names) if errors[i] is None and names is not None and
+                   arg_name in args_dicts[i]]
+        if len(indexes) == 0:
+            continue
+
+        column = validate_column([args_dicts[i][arg_name] for i in indexes],
+                                 config_args.type_default_bounds_dict[arg_name])
+        for i, value in zip(indexes, column):
+            if isinstance(value, Exception):
+                errors[i] = value
+            else:
+                validated_dicts[i][arg_name] = value
+
+    results = []
+    for i in range(len(args_dicts)):
+        if errors[i] is None:
+            try:
+                results.append(BatchResult(i, args=config_args._build_result(validated_dicts[i], provided_names[i])))
+                continue
+            except Exception as e:
+                errors[i] = e
+        results.append(BatchResult(i, error=errors[i]))
+
+    return results
@@ -2,15 +2,93 @@
 The Bounds module implements the Bounds class, which can be used to represent bounds for certain arguments.
 """
 
-from typing import Union
+from typing import Union, Callable
 
+from . import frozen_dict
 
-class Bounds(object):
+
+def _compile_validator(lower_bound: Union[int, float, None], lower_inclusive: bool,
+                       upper_bound: Union[int, float, None], upper_inclusive: bool,
+                       report: Callable[[Union[int, float]], None]) -> Callable[[Union[int, float]], None]:
+    """
+    Builds a validation function with a single comparison specialized for the given bounds, which calls report with the
+    values it rejects. Without bounds, the function accepts every value.
+    """
+    lo, hi = lower_bound, upper_bound
+
+    if lo is None and hi is None:
+        def validate(v):
+            pass
+    elif hi is None and lower_inclusive:
+        def validate(v):
+            if not lo <= v:
+                report(v)
+    elif hi is None:
+        def validate(v):
+            if not lo < v:
+                report(v)
+    elif lo is None and upper_inclusive:
+        def validate(v):
+            if not v <= hi:
+                report(v)
+    elif lo is None:
+        def validate(v):
+            if not v < hi:
+                report(v)
+    elif lower_inclusive and upper_inclusive:
+        def validate(v):
+            if not lo <= v <= hi:
+                report(v)
+    elif lower_inclusive:
+        def validate(v):
+            if not lo <= v < hi:
+                report(v)
+    elif upper_inclusive:
+        def validate(v):
+            if not lo < v <= hi:
+                report(v)
+    else:
+        def validate(v):
+            if not lo < v < hi:
+                report(v)
+
+    return validate
+
+
+def _tighter(bound: Union[int, float, None], inclusive: bool, other_bound: Union[int, float, None],
+             other_inclusive: bool, lower: bool) -> tuple:
+    """
+    Returns the tighter of two lower (or upper) bounds and its inclusive flag. None is unbounded.
+    """
+    if bound is None:
+        return other_bound, other_inclusive
+    if other_bound is None or bound == other_bound:
+        return bound, inclusive and (other_bound is None or other_inclusive)
+    return (bound, inclusive) if (bound > other_bound) == lower else (other_bound, other_inclusive)
+
+
+def _looser(bound: Union[int, float, None], inclusive: bool, other_bound: Union[int, float, None],
+            other_inclusive: bool, lower: bool) -> tuple:
+    """
+    Returns the looser of two lower (or upper) bounds and its inclusive flag. None is unbounded.
+    """
+    if bound is None or other_bound is None:
+        return None, True
+    if bound == other_bound:
+        return bound, inclusive or other_inclusive
+    return (bound, inclusive) if (bound < other_bound) == lower else (other_bound, other_inclusive)
+
+
+class Bounds(frozen_dict.ReadOnlyObject):
     """
     Represents the Bounds of an argument.
     A Bounds instance is defined by lower and upper bounds, and flags indicating if the bounds are inclusive or
     exclusive.
     The supported argument types are integer, float, or lists/dictionaries of those types.
+
+    Each instance compiles a single comparison specialized for its bounds (e.g. lo <= v < hi) when it is created, and
+    values within the bounds are accepted by that comparison alone, without checking which bounds are set. Several
+    Bounds of the same argument can be combined with intersection and union.
     """
     def __init__(self, arg_name: str, lower_bound: Union[int, float, None] = None, lower_inclusive: bool = True,
                  upper_bound: Union[int, float, None] = None, upper_inclusive: bool = True):
@@ -31,6 +109,11 @@ class Bounds(object):
         self.upper_bound = upper_bound
         self.upper_inclusive = upper_inclusive
 
+        # Replaces the validate_value method of the class by the compiled comparison
+        self.validate_value = _compile_validator(lower_bound, lower_inclusive, upper_bound, upper_inclusive,
+                                                 self._raise_out_of_bounds)
+        self._seal()
+
     @staticmethod
     def _validate_init_args(arg_name: str, lower_bound: Union[int, float, None], lower_inclusive: bool,
                             upper_bound: Union[int, float, None], upper_inclusive: bool):
@@ -64,10 +147,17 @@ class Bounds(object):
     def validate_value(self, arg_value: Union[int, float]):
         """
         Validates a value against the provided bounds.
+        Each instance replaces this method by a single comparison specialized for its bounds, compiled when it is
+        created, which only checks the bounds one by one for the values it rejects, as this method does.
 
         :param arg_value: The value of the argument to validate.
         :raises ValueError: If the value is out of bounds.
         """
+        self._raise_out_of_bounds(arg_value)
+
+    def _raise_out_of_bounds(self, arg_value: Union[int, float]):
+        # Values rejected by the compiled comparison are checked bound by bound to report the violated one. NaN is
+        # rejected by the comparison but compares false with both bounds here, so it is accepted
         if self.lower_bound is not None:
             if self.lower_inclusive and arg_value < self.lower_bound:
                 raise ValueError("The {name} argument should be greater than or "
@@ -92,6 +182,62 @@ class Bounds(object):
                                                                      ubound=self.upper_bound,
                                                                      value=arg_value))
 
+    def intersection(self, other: "Bounds") -> "Bounds":
+        """
+        Combines two Bounds of the same argument into one, accepting only the values accepted by both.
+
+        :param other: The other Bounds.
+        :return: The Bounds of the intersection.
+        :raises ValueError: If the Bounds are of different arguments, or if their intersection is empty or a single
+                            value.
+        """
+        self._check_same_argument(other)
+        lower_bound, lower_inclusive = _tighter(self.lower_bound, self.lower_inclusive, other.lower_bound,
+                                                other.lower_inclusive, lower=True)
+        upper_bound, upper_inclusive = _tighter(self.upper_bound, self.upper_inclusive, other.upper_bound,
+                                                other.upper_inclusive, lower=False)
+
+        if lower_bound is not None and upper_bound is not None and lower_bound >= upper_bound:
+            raise ValueError("The bounds of the {name} argument have no interval in common "
+                             "(bounds: {first}, {second})".format(name=self.arg_name, first=self, second=other))
+        return Bounds(self.arg_name, lower_bound, lower_inclusive, upper_bound, upper_inclusive)
+
+    def union(self, other: "Bounds") -> "Bounds":
+        """
+        Combines two overlapping or adjacent Bounds of the same argument into one, accepting the values accepted by
+        either.
+
+        :param other: The other Bounds.
+        :return: The Bounds of the union.
+        :raises ValueError: If the Bounds are of different arguments, or if their union is not a single interval.
+        """
+        self._check_same_argument(other)
+        for first, second in [(self, other), (other, self)]:
+            if first.upper_bound is None or second.lower_bound is None:
+                continue
+            touching = first.upper_bound == second.lower_bound and (first.upper_inclusive or second.lower_inclusive)
+            if first.upper_bound < second.lower_bound or (first.upper_bound == second.lower_bound and not touching):
+                raise ValueError("The bounds of the {} argument are disjoint, so their union is not a single interval "
+                                 "(bounds: {}, {})".format(self.arg_name, self, other))
+
+        lower_bound, lower_inclusive = _looser(self.lower_bound, self.lower_inclusive, other.lower_bound,
+                                               other.lower_inclusive, lower=True)
+        upper_bound, upper_inclusive = _looser(self.upper_bound, self.upper_inclusive, other.upper_bound,
+                                               other.upper_inclusive, lower=False)
+        return Bounds(self.arg_name, lower_bound, lower_inclusive, upper_bound, upper_inclusive)
+
+    def _check_same_argument(self, other: "Bounds"):
+        if not isinstance(other, Bounds):
+            raise TypeError("The other parameter should be a Bounds object (other: {})".format(other))
+        if other.arg_name != self.arg_name:
+            raise ValueError("Only Bounds of the same argument can be combined "
+                             "(arg_names: {}, {})".format(self.arg_name, other.arg_name))
+
+    def __reduce__(self):
+        # The compiled comparison cannot be pickled, so it is compiled again
+        return self.__class__, (self.arg_name, self.lower_bound, self.lower_inclusive, self.upper_bound,
+                                self.upper_inclusive)
+
     def __str__(self):
         start = "[" if self.lower_inclusive else "]"
         end = "]" if self.upper_inclusive else "["
@@ -0,0 +1,182 @@
+"""
+The collection_constraints module implements the CollectionConstraints class, which can be used to represent
+constraints on list and dictionary arguments: length limits, uniqueness, sortedness, and required keys.
+"""
+
+from collections.abc import Mapping
+from typing import Union, List, Callable, Any, Iterable, Sequence
+
+from . import frozen_dict
+
+_MISSING = object()
+
+
+class CollectionConstraints(frozen_dict.ReadOnlyObject):
+    """
+    Represents the constraints of a list or dictionary argument.
+    The constraints apply to the argument itself, not to the lists/dictionaries nested in it, and are checked while its
+    elements are validated, in a single pass.
+
+    For lists, unique and sorted_order apply to the elements. For dictionaries, unique applies to the values and
+    sorted_order to the keys, in the order they appear in the JSON.
+    """
+    def __init__(self, arg_name: str, min_length: Union[int, None] = None, max_length: Union[int, None] = None,
+                 unique: bool = False, sorted_order: bool = False, required_keys: Union[List[str], None] = None):
+        """
+        At least one constraint must be provided.
+
+        :param arg_name: The name of the argument.
+        :param min_length: The minimum number of elements (inclusive).
+        :param max_length: The maximum number of elements (inclusive).
+        :param unique: Flag indicating if the elements (or dictionary values) must be unique.
+        :param sorted_order: Flag indicating if the elements (or dictionary keys) must be in non-decreasing order.
+        :param required_keys: Keys which must be present, for dictionary arguments.
+        """
+        self._validate_init_args(arg_name, min_length, max_length, unique, sorted_order, required_keys)
+
+        self.arg_name = arg_name
+        self.min_length = min_length
+        self.max_length = max_length
+        self.unique = unique
+        self.sorted_order = sorted_order
+        self.required_keys = None if required_keys is None else frozenset(required_keys)
+        self._seal()
+
+    @staticmethod
+    def _validate_init_args(arg_name: str, min_length: Union[int, None], max_length: Union[int, None], unique: bool,
+                            sorted_order: bool, required_keys: Union[List[str], None]):
+        if not isinstance(arg_name, str):
+            raise TypeError("The arg_name parameter should be a string "
+                            "(arg_name: {})".format(arg_name))
+        if len(arg_name.strip()) == 0:
+            raise ValueError("The arg_name parameter should be a non-empty string "
+                             "(arg_name: {})".format(arg_name))
+
+        for name, value in [("min_length", min_length), ("max_length", max_length)]:
+            if value is not None and type(value) is not int:
+                raise TypeError("The {name} parameter should be an integer or None "
+                                "({name}: {value})".format(name=name, value=value))
+            if value is not None and value < 0:
+                raise ValueError("The {name} parameter should be a non-negative integer "
+                                 "({name}: {value})".format(name=name, value=value))
+
+        if min_length is not None and max_length is not None and min_length > max_length:
+            raise ValueError("The min_length parameter should be less than or equal to the max_length parameter "
+                             "(min_length: {}, max_length: {})".format(min_length, max_length))
+
+        for name, value in [("unique", unique), ("sorted_order", sorted_order)]:
+            if not isinstance(value, bool):
+                raise TypeError("The {name} parameter should be a boolean value "
+                                "({name}: {value})".format(name=name, value=value))
+
+        if required_keys is not None:
+            if not isinstance(required_keys, (list, tuple, set, frozenset)) or \
+                    not all(isinstance(key, str) for key in required_keys):
+                raise TypeError("The required_keys parameter should be None or a list of strings "
+                                "(required_keys: {})".format(required_keys))
+
+        if min_length is None and max_length is None and not unique and not sorted_order and not required_keys:
+            raise ValueError("At least one constraint should be given (arg_name: {})".format(arg_name))
+
+    def validate_length(self, length: int):
+        """
+        Validates the number of elements of the argument.
+
+        :param length: The number of elements.
+        :raises ValueError: If the number of elements is out of the length limits.
+        """
+        if self.min_length is not None and length < self.min_length:
+            raise ValueError("The {name} argument should have at least {length} elements "
+                             "({name} length: {value})".format(name=self.arg_name, length=self.min_length,
+                                                               value=length))
+        if self.max_length is not None and length > self.max_length:
+            raise ValueError("The {name} argument should have at most {length} elements "
+                             "({name} length: {value})".format(name=self.arg_name, length=self.max_length,
+                                                               value=length))
+
+    def validate_keys(self, keys: Iterable[str]):
+        """
+        Validates that the required keys are present.
+
+        :param keys: The keys of the dictionary argument.
+        :raises ValueError: If a required key is missing.
+        """
+        if self.required_keys:
+            missing_keys = self.required_keys.difference(keys)
+            if missing_keys:
+                raise ValueError("The {name} argument is missing the required keys {keys}".format(
+                    name=self.arg_name, keys=sorted(missing_keys)))
+
+    def element_checker(self) -> Union[Callable[[Any, Any], None], None]:
+        """
+        Creates a function which checks the uniqueness and order of the elements of one argument value, one element at
+        a time. The function receives the order key (the element for lists, the key for dictionaries) and the element.
+        Uniqueness is checked through hashing, so the whole check is linear in the number of elements.
+
+        :return: The checking function, or None if neither unique nor sorted_order is set.
+        :raises ValueError: (from the returned function) If an element is repeated or out of order.
+        """
+        if not self.unique and not self.sorted_order:
+            return None
+
+        seen = set()
+        last = [_MISSING]
+
+        def check(order_key: Any, value: Any):
+            if self.unique:
+                hashable_value = frozen_dict.freeze(value)
+                if hashable_value in seen:
+                    raise ValueError("The {name} argument should not contain repeated elements "
+                                     "(repeated: {value})".format(name=self.arg_name, value=value))
+                seen.add(hashable_value)
+
+            if self.sorted_order:
+                if last[0] is not _MISSING and order_key < last[0]:
+                    raise ValueError("The {name} argument should be sorted "
+                                     "({value} is after {previous})".format(name=self.arg_name, value=order_key,
+                                                                            previous=last[0]))
+                last[0] = order_key
+
+        return check
+
+    def validate_changes(self, value: Union[Sequence, Mapping], changed_keys: Iterable[Any]):
+        """
+        Validates an argument which met the constraints before some of its elements were set, inserted, or removed,
+        checking only the changed elements against the others, e.g. after a patch.
+
+        :param value: The changed list or dictionary argument, whose nested lists and dictionaries are all frozen or
+                      all not frozen, so equal elements compare equal.
+        :param changed_keys: For lists, the indexes of the elements set or inserted and of the elements following the
+                             removed ones, after every change. For dictionaries, the keys set, added, or removed.
+        :raises ValueError: If the argument breaks a constraint.
+        """
+        self.validate_length(len(value))
+
+        is_mapping = isinstance(value, Mapping)
+        if is_mapping:
+            if self.required_keys and any(key not in value for key in changed_keys if key in self.required_keys):
+                self.validate_keys(value)
+            changed_keys = [key for key in changed_keys if key in value]
+        else:
+            changed_keys = sorted(index for index in changed_keys if index < len(value))
+
+        if self.unique:
+            elements = list(value.values()) if is_mapping else value
+            for key in changed_keys:
+                if elements.count(value[key]) > 1:
+                    raise ValueError("The {name} argument should not contain repeated elements "
+                                     "(repeated: {value})".format(name=self.arg_name, value=value[key]))
+
+        if self.sorted_order and changed_keys:
+            order_keys = list(value) if is_mapping else value
+            for key in changed_keys:
+                index = order_keys.index(key) if is_mapping else key
+                for previous, current in ((index - 1, index), (index, index + 1)):
+                    if previous >= 0 and current < len(order_keys) and order_keys[current] < order_keys[previous]:
+                        raise ValueError("The {name} argument should be sorted ({value} is after {previous})".format(
+                            name=self.arg_name, value=order_keys[current], previous=order_keys[previous]))
+
+    def __str__(self):
+        return "CollectionConstraints(min_length={}, max_length={}, unique={}, sorted_order={}, " \
+               "required_keys={})".format(self.min_length, self.max_length, self.unique, self.sorted_order,
+                                          None if self.required_keys is None else sorted(self.required_keys))
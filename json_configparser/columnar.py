@@ -0,0 +1,234 @@
+"""
+Implements the ColumnTable class, a columnar (struct-of-arrays) representation of List[Dict[str, X]] arguments whose
+rows all have the same keys, used for the arguments given in the columnar_args parameter of ConfigArgs.
+"""
+
+import array
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+def _pack(column: Sequence) -> Sequence:
+    """
+    Stores columns of ints or floats in typed arrays, which take a fraction of the memory of lists of Python objects.
+    """
+    if all(type(value) is float for value in column):
+        return array.array("d", column)
+    if all(type(value) is int for value in column):
+        try:
+            return array.array("q", column)
+        except OverflowError:
+            pass
+    return column if isinstance(column, list) else list(column)
+
+
+def _fits(column: array.array, value: Any) -> bool:
+    """
+    Checks if a value can be stored in a typed array column without changing its type.
+    """
+    if column.typecode == "d":
+        return type(value) is float
+    return type(value) is int and -(1 << 63) <= value < (1 << 63)
+
+
+class ColumnTable(Sequence):
+    """
+    A read-only table of records stored by column. It behaves as a sequence of rows, each a new dictionary, and compares
+    equal to lists of dictionaries with the same items. Columns of ints and floats are stored in typed arrays.
+    """
+    __slots__ = ("_keys", "_columns", "_length", "_hash")
+
+    def __init__(self, columns: Dict[str, Sequence]):
+        """
+        :param columns: A dictionary mapping each key to its column of values, all columns having the same length.
+        """
+        if not isinstance(columns, Mapping) or len(columns) == 0:
+            raise ValueError("The columns parameter should be a non-empty dictionary (columns: {})".format(columns))
+
+        self._keys = tuple(columns)
+        self._columns = tuple(_pack(columns[key]) for key in self._keys)
+        self._length = len(self._columns[0])
+        self._hash = None
+
+        if any(len(column) != self._length for column in self._columns):
+            raise ValueError("All columns should have the same length (lengths: {})".format(
+                {key: len(column) for key, column in zip(self._keys, self._columns)}))
+
+    @classmethod
+    def from_rows(cls, rows: Sequence) -> "ColumnTable":
+        """
+        Builds a table from a non-empty sequence of dictionaries which all have the keys of the first one.
+
+        :param rows: The rows.
+        :return: The ColumnTable of the rows.
+        :raises ValueError: If there are no rows, or if a row does not have the same keys as the first one.
+        """
+        if len(rows) == 0 or not isinstance(rows[0], Mapping):
+            raise ValueError("The rows should be a non-empty list of dictionaries (rows: {})".format(rows))
+
+        keys = tuple(rows[0])
+        key_set = set(keys)
+        for i, row in enumerate(rows):
+            if not isinstance(row, Mapping) or len(row) != len(keys) or row.keys() != key_set:
+                raise ValueError("All rows should have the keys {} (row {}: {})".format(list(keys), i, row))
+
+        return cls({key: [row[key] for row in rows] for key in keys})
+
+    @classmethod
+    def _from_columns(cls, keys: Tuple[str, ...], columns: Sequence[Sequence]) -> "ColumnTable":
+        """
+        Builds a table from columns which are already packed, sharing them.
+        """
+        table = cls.__new__(cls)
+        table._keys = keys
+        table._columns = tuple(columns)
+        table._length = len(table._columns[0])
+        table._hash = None
+        return table
+
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        """
+        The keys shared by all rows, in the order of the first row.
+        """
+        return self._keys
+
+    def column(self, key: str) -> Sequence:
+        """
+        :param key: A key of the rows.
+        :return: The values of the key in all rows, as a new array or list, so the table is not changed by modifying it.
+        :raises KeyError: If the key is unknown.
+        """
+        try:
+            return self._columns[self._keys.index(key)][:]
+        except ValueError:
+            raise KeyError(key)
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """
+        :return: The rows as a new list of dictionaries.
+        """
+        return [dict(zip(self._keys, values)) for values in zip(*self._columns)]
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        return {key: column[index] for key, column in zip(self._keys, self._columns)}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for values in zip(*self._columns):
+            yield dict(zip(self._keys, values))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def count(self, value: Any) -> int:
+        if not isinstance(value, Mapping) or len(value) != len(self._keys) or value.keys() != set(self._keys):
+            return 0
+
+        # Narrows the matching rows column by column, without building the rows
+        indexes = range(self._length)
+        for key, column in zip(self._keys, self._columns):
+            target = value[key]
+            indexes = [i for i in indexes if column[i] == target]
+        return len(indexes)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ColumnTable):
+            return self._keys == other._keys and \
+                all(list(column) == list(other_column) for column, other_column in zip(self._columns, other._columns))
+        if isinstance(other, (list, tuple)):
+            return self.to_rows() == list(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self._keys, tuple(tuple(column) for column in self._columns)))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "ColumnTable(keys={}, length={})".format(list(self._keys), self._length)
+
+    def __reduce__(self):
+        return self.__class__, (dict(zip(self._keys, self._columns)),)
+
+
+class TableEditor(object):
+    """
+    A copy of a ColumnTable which is modified row by row or cell by cell, used to patch columnar arguments. Each column
+    is copied when it is first modified, and the new table shares the other columns without packing them again.
+    """
+    def __init__(self, table: ColumnTable):
+        """
+        :param table: The table to copy, which is not modified.
+        """
+        self.keys = table.keys
+        self._columns = list(table._columns)
+        self._copied = [False] * len(self._columns)
+        self._length = len(table)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _writable_column(self, position: int, values: Sequence) -> Sequence:
+        """
+        Returns the column at a position, copied once, and moved to a list if it is a typed array which cannot store
+        the given values.
+        """
+        column = self._columns[position]
+        if isinstance(column, array.array) and not all(_fits(column, value) for value in values):
+            column = list(column)
+        elif not self._copied[position]:
+            column = column[:]
+        else:
+            return column
+
+        self._columns[position] = column
+        self._copied[position] = True
+        return column
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        :param index: The index of the row.
+        :return: The row as a new dictionary.
+        """
+        return {key: column[index] for key, column in zip(self.keys, self._columns)}
+
+    def set_cell(self, index: int, key: str, value: Any):
+        """
+        :param index: The index of the row.
+        :param key: A key of the rows.
+        :param value: The new value.
+        """
+        self._writable_column(self.keys.index(key), (value,))[index] = value
+
+    def set_row(self, index: int, row: Mapping):
+        """
+        :param index: The index of the row.
+        :param row: The new row, with the keys of the table.
+        """
+        for position, key in enumerate(self.keys):
+            self._writable_column(position, (row[key],))[index] = row[key]
+
+    def insert_row(self, index: int, row: Mapping):
+        """
+        :param index: The index of the new row, at most the number of rows.
+        :param row: The new row, with the keys of the table.
+        """
+        for position, key in enumerate(self.keys):
+            self._writable_column(position, (row[key],)).insert(index, row[key])
+        self._length += 1
+
+    def delete_row(self, index: int):
+        """
+        :param index: The index of the row.
+        """
+        for position in range(len(self.keys)):
+            del self._writable_column(position, ())[index]
+        self._length -= 1
+
+    def to_table(self) -> ColumnTable:
+        """
+        :return: The new ColumnTable, sharing the columns which were not modified with the copied table.
+        """
+        return ColumnTable._from_columns(self.keys, self._columns)
@@ -3,43 +3,146 @@ Implements the ConfigArgs class which is the main class for parsing options clas
 a JSON file.
 """
 
+import collections
 import copy
 import inspect
 import json
-from typing import List, Callable, Union, Dict, Any, Set
+import os
+import threading
+import types
+import weakref
+from concurrent.futures import Executor
+from typing import List, Callable, Union, Dict, Any, Set, Iterator, Iterable, Tuple, Mapping, TYPE_CHECKING
 
+from . import batch
 from . import bounds
+from . import collection_constraints
+from . import frozen_dict
+from . import jsonl
+from . import limits
+from . import memory
+from . import parallel
+from . import patch
+from . import path_view
+from . import sampling
+from . import string_constraints
 from . import type_defaults
 from . import validations
+from . import validators
+from . import writer
 
+if TYPE_CHECKING:
+    from . import sources
 
-class ConfigArgs(object):
+
+class ConfigArgs(frozen_dict.ReadOnlyObject):
     """
     Parses the Arguments NamedTuple class to extract information about argument names, types, and defaults.
     Also holds information about Bounds and extra validations.
 
     The parse_json method can be used to parse a JSON file and validate it against the known information.
+
+    Instances can be shared by any number of threads. Their attributes cannot be set after construction, the
+    type_default_bounds_dict is a read-only mapping, and the Bounds and constraints objects are read-only too. The only
+    state changed by parsing are caches: the last successful inputs of the named validators, which are read and
+    replaced one key at a time without locks, and the results of parse_source, which are guarded by a lock.
     """
     # TODO: Improve names
     def __init__(self, options_class: type, bounds_lst: Union[List[bounds.Bounds], None] = None,
-                 extra_validations: Union[Callable, None] = None):
+                 extra_validations: Union[Callable, None] = None, limits_obj: Union[limits.Limits, None] = None,
+                 frozen: bool = False,
+                 str_constraints_lst: Union[List[string_constraints.StringConstraints], None] = None,
+                 collection_constraints_lst: Union[List[collection_constraints.CollectionConstraints], None] = None,
+                 validators_lst: Union[List[validators.Validator], None] = None,
+                 columnar_args: Union[List[str], None] = None, fill_defaults: bool = False):
         """
         :param options_class: The NamedTuple class which defines all arguments, types, and defaults.
-        :param bounds_lst: A list of Bounds objects, which defines bounds for arguments.
+        :param bounds_lst: A list of Bounds objects, which defines bounds for arguments. Several Bounds of the same
+                           argument are combined by their intersection.
         :param extra_validations: A function which contains extra validations. Should receive a dictionary mapping from
                                   argument name to value and should return a dictionary of the same type.
+        :param limits_obj: A Limits object, which defines resource limits enforced when parsing JSON files.
+        :param frozen: Flag indicating if results are immutable and hashable: lists become tuples, dictionaries become
+                       FrozenDict instances, and the result itself is a FrozenDict including every argument, with
+                       frozen copies of the defaults for arguments missing from the JSON.
+        :param str_constraints_lst: A list of StringConstraints objects, which defines constraints for string arguments
+                                    or dictionary keys.
+        :param collection_constraints_lst: A list of CollectionConstraints objects, which defines constraints for list
+                                           and dictionary arguments.
+        :param validators_lst: A list of named Validator objects, each receiving only the arguments it declares. They
+                               run before extra_validations, and only when their arguments changed since their last
+                               successful run.
+        :param columnar_args: The names of List[Dict[str, X]] arguments, with X a bool, int, float, str, or choice
+                              type, which are validated column by column and returned as ColumnTable objects. All rows
+                              of these arguments must have the same keys.
+        :param fill_defaults: Flag indicating if results include every argument, with the defaults of the arguments
+                              missing from the JSON. Lists and dictionaries of the defaults are copied for each result,
+                              unless the results are frozen, which always include the defaults and share them.
         """
-        self._validate_init_args(options_class, bounds_lst, extra_validations)
+        self._validate_init_args(options_class, bounds_lst, extra_validations, limits_obj, frozen, str_constraints_lst,
+                                 collection_constraints_lst, validators_lst, columnar_args, fill_defaults)
 
+        # The lists are copied to tuples, so changing them after construction does not change this instance
         self.options_class = options_class
-        self.bounds_lst = bounds_lst
+        self.bounds_lst = None if bounds_lst is None else tuple(bounds_lst)
         self.extra_validations = extra_validations
+        self.limits_obj = limits_obj
+        self.frozen = frozen
+        self.str_constraints_lst = None if str_constraints_lst is None else tuple(str_constraints_lst)
+        self.collection_constraints_lst = None if collection_constraints_lst is None \
+            else tuple(collection_constraints_lst)
+        self.validators_lst = None if validators_lst is None else tuple(validators_lst)
+        self.columnar_args = None if columnar_args is None else tuple(columnar_args)
+        self.fill_defaults = fill_defaults
+
+        arg_names, type_default_bounds_dict = self._create_type_default_bounds_dict()
+        self.arg_names = frozenset(arg_names)
+        self.type_default_bounds_dict = types.MappingProxyType(type_default_bounds_dict)
+
+        self._validator_runner = None
+        if self.validators_lst:
+            self._check_validators(self.validators_lst, self.arg_names)
+            self._validator_runner = validators.ValidatorRunner(self.validators_lst, frozen)
+
+        # The validated defaults added to every result, built once
+        self._defaults_template = None
+        if frozen or fill_defaults:
+            self._defaults_template = types.MappingProxyType(self._create_defaults_template())
+
+        # Maps each source to the version and the validated arguments of its last parsed content
+        self._source_cache = weakref.WeakKeyDictionary()
+        # WeakKeyDictionary is not thread-safe; the lock is only held to read or replace an entry, not while parsing
+        self._source_cache_lock = threading.Lock()
+        self._seal()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks, weak dictionaries and mapping proxies cannot be pickled (e.g. to send the instance to a
+        # ProcessPoolExecutor), so the caches are dropped and the read-only mappings are pickled as dictionaries
+        state = dict(self.__dict__)
+        del state["_source_cache"], state["_source_cache_lock"]
+        state["type_default_bounds_dict"] = dict(self.type_default_bounds_dict)
+        if self._defaults_template is not None:
+            state["_defaults_template"] = dict(self._defaults_template)
+        return state
 
-        self.arg_names, self.type_default_bounds_dict = self._create_type_default_bounds_dict()
+    def __setstate__(self, state: Dict[str, Any]):
+        state["type_default_bounds_dict"] = types.MappingProxyType(state["type_default_bounds_dict"])
+        if state["_defaults_template"] is not None:
+            state["_defaults_template"] = types.MappingProxyType(state["_defaults_template"])
+        state["_source_cache"] = weakref.WeakKeyDictionary()
+        state["_source_cache_lock"] = threading.Lock()
+        # The instance is already sealed, so its attributes are restored directly
+        self.__dict__.update(state)
 
     @staticmethod
     def _validate_init_args(options_class: type, bounds_lst: Union[List[bounds.Bounds], None] = None,
-                            extra_validations: Union[Callable, None] = None):
+                            extra_validations: Union[Callable, None] = None,
+                            limits_obj: Union[limits.Limits, None] = None, frozen: bool = False,
+                            str_constraints_lst: Union[List[string_constraints.StringConstraints], None] = None,
+                            collection_constraints_lst: Union[List[collection_constraints.CollectionConstraints],
+                                                              None] = None,
+                            validators_lst: Union[List[validators.Validator], None] = None,
+                            columnar_args: Union[List[str], None] = None, fill_defaults: bool = False):
         # Cannot check if NamedTuple directly
         if not isinstance(options_class, type):
             raise TypeError("The options_class parameter should be the typing NamedTuple Class itself "
@@ -68,20 +171,57 @@ class ConfigArgs(object):
                 raise ValueError("The extra_validations parameters should be a function of a single parameter "
                                  "(extra_validations parameters: {})".format(sig.parameters))
 
+        if limits_obj is not None and not isinstance(limits_obj, limits.Limits):
+            raise TypeError("The limits_obj parameter should be None or a Limits object "
+                            "(limits_obj: {})".format(limits_obj))
+
+        if not isinstance(frozen, bool):
+            raise TypeError("The frozen parameter should be a boolean value (frozen: {})".format(frozen))
+        if not isinstance(fill_defaults, bool):
+            raise TypeError("The fill_defaults parameter should be a boolean value "
+                            "(fill_defaults: {})".format(fill_defaults))
+
+        if str_constraints_lst is not None:
+            if not isinstance(str_constraints_lst, list) or \
+                    not all(isinstance(el, string_constraints.StringConstraints) for el in str_constraints_lst):
+                raise TypeError("The str_constraints_lst parameter should be None or a list of StringConstraints "
+                                "objects (str_constraints_lst: {})".format(str_constraints_lst))
+
+        if collection_constraints_lst is not None:
+            if not isinstance(collection_constraints_lst, list) or \
+                    not all(isinstance(el, collection_constraints.CollectionConstraints)
+                            for el in collection_constraints_lst):
+                raise TypeError("The collection_constraints_lst parameter should be None or a list of "
+                                "CollectionConstraints objects "
+                                "(collection_constraints_lst: {})".format(collection_constraints_lst))
+
+        if validators_lst is not None:
+            if not isinstance(validators_lst, list) or \
+                    not all(isinstance(el, validators.Validator) for el in validators_lst):
+                raise TypeError("The validators_lst parameter should be None or a list of Validator objects "
+                                "(validators_lst: {})".format(validators_lst))
+
+        if columnar_args is not None:
+            if not isinstance(columnar_args, list) or not all(isinstance(el, str) for el in columnar_args):
+                raise TypeError("The columnar_args parameter should be None or a list of argument names "
+                                "(columnar_args: {})".format(columnar_args))
+
     def _create_type_default_bounds_dict(self) -> (Set[str], Dict[str, type_defaults.TypeDefaultBounds]):
         """
         Parses the provided Arguments class and creates a set of argument names and a dictionary holding information
-        about the type, default, and bounds of all arguments.
+        about the type, default, bounds, and constraints of all arguments.
 
         :return: The set of all argument names and a dictionary mapping from argument name to TypeDefaultBounds
                  instance.
-        :raises ValueError: If a bound is specified for an unknown argument. Or if a default value is out of bounds.
-        :raises TypeError: If a bound is specified for an invalid type. Or if an argument has an invalid type.
-                           Or if the default value is of the wrong type.
+        :raises ValueError: If a bound or constraint is specified for an unknown argument, or more than once for the
+                            same argument. Or if a default value is out of bounds or does not satisfy the constraints.
+        :raises TypeError: If a bound or constraint is specified for an invalid type. Or if an argument has an invalid
+                           type. Or if the default value is of the wrong type.
         """
         arg_types_dict = self.options_class.__annotations__
         arg_names = set(arg_types_dict.keys())
-        arg_bounds_dict = {}
+        # Maps argument name to the keyword arguments of its TypeDefaultBounds holding the bounds and constraints
+        arg_constraints_dict = {arg_name: {} for arg_name in arg_names}
 
         # Check if the Options have supported types
         self._check_supported_types(arg_types_dict)
@@ -94,12 +234,62 @@ class ConfigArgs(object):
                 elif not self._validate_can_have_bounds(arg_types_dict[bound.arg_name]):
                     raise TypeError("Bounds can only be defined for ints, floats, or Lists/Dicts of ints or floats "
                                     "({}: {})".format(bound.arg_name, arg_types_dict[bound.arg_name]))
+                elif "bound_obj" in arg_constraints_dict[bound.arg_name]:
+                    # Several Bounds of an argument collapse into a single check
+                    arg_constraints_dict[bound.arg_name]["bound_obj"] = \
+                        arg_constraints_dict[bound.arg_name]["bound_obj"].intersection(bound)
                 else:
-                    arg_bounds_dict[bound.arg_name] = bound
+                    arg_constraints_dict[bound.arg_name]["bound_obj"] = bound
+
+        if self.str_constraints_lst is not None:
+            for constraints in self.str_constraints_lst:
+                field = "key_constraints_obj" if constraints.keys else "str_constraints_obj"
+                if constraints.arg_name not in arg_names:
+                    raise ValueError("String constraints specified for unknown argument "
+                                     "{}".format(constraints.arg_name))
+                elif not self._validate_can_have_str_constraints(arg_types_dict[constraints.arg_name],
+                                                                 constraints.keys):
+                    raise TypeError("String constraints can only be defined for strs or Lists/Dicts of strs, or for "
+                                    "the keys of Dicts ({}: {})".format(constraints.arg_name,
+                                                                        arg_types_dict[constraints.arg_name]))
+                elif field in arg_constraints_dict[constraints.arg_name]:
+                    raise ValueError("String constraints specified more than once for the {} of argument "
+                                     "{}".format("keys" if constraints.keys else "values", constraints.arg_name))
+                else:
+                    arg_constraints_dict[constraints.arg_name][field] = constraints
+
+        if self.collection_constraints_lst is not None:
+            for constraints in self.collection_constraints_lst:
+                if constraints.arg_name not in arg_names:
+                    raise ValueError("Collection constraints specified for unknown argument "
+                                     "{}".format(constraints.arg_name))
+                elif not self._validate_can_have_collection_constraints(arg_types_dict[constraints.arg_name],
+                                                                        constraints):
+                    raise TypeError("Collection constraints can only be defined for Lists/Dicts, required keys only "
+                                    "for Dicts, and sorted order only for Dicts or Lists of ints, floats, or strs "
+                                    "({}: {})".format(constraints.arg_name, arg_types_dict[constraints.arg_name]))
+                elif "collection_constraints_obj" in arg_constraints_dict[constraints.arg_name]:
+                    raise ValueError("Collection constraints specified more than once for argument "
+                                     "{}".format(constraints.arg_name))
+                else:
+                    arg_constraints_dict[constraints.arg_name]["collection_constraints_obj"] = constraints
+
+        if self.columnar_args is not None:
+            for arg_name in self.columnar_args:
+                if arg_name not in arg_names:
+                    raise ValueError("Columnar mode specified for unknown argument {}".format(arg_name))
+                elif not self._validate_can_be_columnar(arg_types_dict[arg_name]):
+                    raise TypeError("Columnar mode can only be used for List[Dict[str, X]] arguments, with X a bool, "
+                                    "int, float, str, or a Literal or Enum "
+                                    "({}: {})".format(arg_name, arg_types_dict[arg_name]))
+                elif "columnar" in arg_constraints_dict[arg_name]:
+                    raise ValueError("Columnar mode specified more than once for argument {}".format(arg_name))
+                else:
+                    arg_constraints_dict[arg_name]["columnar"] = True
 
         # Get the default values from the class and validate them
         arg_defaults_dict = self.options_class._field_defaults
-        self._check_valid_default(arg_defaults_dict, arg_types_dict, arg_bounds_dict)
+        self._check_valid_default(arg_defaults_dict, arg_types_dict, arg_constraints_dict)
 
         arg_type_defaults_dict = {}
         for arg_name in arg_names:
@@ -110,25 +300,45 @@ class ConfigArgs(object):
                 arg_type_defaults_dict[arg_name] = \
                     type_defaults.TypeDefaultBounds(arg_name, type_, has_default=True,
                                                     default_value=default_value,
-                                                    bound_obj=arg_bounds_dict.get(arg_name, None))
+                                                    **arg_constraints_dict[arg_name])
             else:
                 arg_type_defaults_dict[arg_name] = \
-                    type_defaults.TypeDefaultBounds(arg_name, type_, bound_obj=arg_bounds_dict.get(arg_name, None))
+                    type_defaults.TypeDefaultBounds(arg_name, type_, **arg_constraints_dict[arg_name])
 
         return arg_names, arg_type_defaults_dict
 
+    @staticmethod
+    def _check_validators(validators_lst: List[validators.Validator], arg_names: Set[str]):
+        """
+        Checks that validator names are unique and that validators only read known arguments.
+
+        :param validators_lst: The list of validators.
+        :param arg_names: The names of all arguments.
+        :raises ValueError: If two validators have the same name or if a validator reads an unknown argument.
+        """
+        validator_names = set()
+        for validator in validators_lst:
+            if validator.name in validator_names:
+                raise ValueError("Validator name {} is used more than once".format(validator.name))
+            validator_names.add(validator.name)
+
+            unknown_arg_names = [arg_name for arg_name in validator.arg_names if arg_name not in arg_names]
+            if unknown_arg_names:
+                raise ValueError("Validator {} reads unknown arguments {}".format(validator.name, unknown_arg_names))
+
     @staticmethod
     def _check_supported_types(arg_types_dict: Dict[str, type]):
         """
         Check if the provided argument type is valid.
-        Valid types are ints, floats, strs, bools, and lists/dicts of those types.
+        Valid types are ints, floats, strs, bools, Literals and Enums of those types, and lists/dicts of those types.
+        The indexes of the allowed values of Literals and Enums are built here, once.
 
         :param arg_types_dict: Dictionary mapping from argument name to type.
         :raises TypeError: If the provided argument type is not supported.
         """
         for arg, type_ in arg_types_dict.items():
             actual_inner_type = type_
-            while hasattr(actual_inner_type, "__origin__"):
+            while hasattr(actual_inner_type, "__origin__") and not validations.is_choice_type(actual_inner_type):
                 # Check list (v3.7) and typing.List (3.6)
                 if actual_inner_type.__origin__ not in [list, dict, List, Dict]:
                     raise TypeError("The type of the {name} argument is not supported "
@@ -143,7 +353,9 @@ class ConfigArgs(object):
 
                     actual_inner_type = actual_inner_type.__args__[1]
 
-            if actual_inner_type not in [bool, int, float, str]:
+            if validations.is_choice_type(actual_inner_type):
+                validations.choice_index(actual_inner_type)
+            elif actual_inner_type not in [bool, int, float, str]:
                 raise TypeError("The type of the {name} argument is not supported "
                                 "({name}: {type_})".format(name=arg, type_=type_))
 
@@ -157,35 +369,115 @@ class ConfigArgs(object):
         :return: Boolean value indicating if the type can have bounds.
         """
         actual_inner_type = type_
-        while hasattr(actual_inner_type, "__origin__"):
+        while hasattr(actual_inner_type, "__origin__") and not validations.is_choice_type(actual_inner_type):
             # Already checked that it is a list or dict
             i = 0 if actual_inner_type.__origin__ in [list, List] else 1
             actual_inner_type = actual_inner_type.__args__[i]
 
         return actual_inner_type in [int, float]
 
+    @staticmethod
+    def _validate_can_have_str_constraints(type_: type, keys: bool) -> bool:
+        """
+        Validate if a specific type can have string constraints.
+        Valid types are strings and lists/dicts of strings, or any type containing a dict if the constraints apply to
+        dictionary keys.
+
+        :param type_: The type to validate.
+        :param keys: Flag indicating if the constraints apply to dictionary keys.
+        :return: Boolean value indicating if the type can have string constraints.
+        """
+        actual_inner_type = type_
+        has_dict = False
+        while hasattr(actual_inner_type, "__origin__") and not validations.is_choice_type(actual_inner_type):
+            # Already checked that it is a list or dict
+            i = 0 if actual_inner_type.__origin__ in [list, List] else 1
+            has_dict = has_dict or i == 1
+            actual_inner_type = actual_inner_type.__args__[i]
+
+        return has_dict if keys else actual_inner_type == str
+
+    @staticmethod
+    def _validate_can_have_collection_constraints(type_: type,
+                                                  constraints: collection_constraints.CollectionConstraints) -> bool:
+        """
+        Validate if a specific type can have the given collection constraints.
+        Valid types are lists and dicts. Required keys can only be defined for dicts, and sorted order for dicts (whose
+        keys are sorted) or lists of ints, floats, or strs.
+
+        :param type_: The type to validate.
+        :param constraints: The collection constraints.
+        :return: Boolean value indicating if the type can have the collection constraints.
+        """
+        origin = getattr(type_, "__origin__", None)
+        if origin in [list, List]:
+            return not constraints.required_keys and \
+                (not constraints.sorted_order or type_.__args__[0] in [int, float, str])
+
+        return origin in [dict, Dict]
+
+    @staticmethod
+    def _validate_can_be_columnar(type_: type) -> bool:
+        """
+        Validate if a specific type can be validated in columnar mode, i.e. if it is a List of Dicts of scalar values.
+
+        :param type_: The type to validate.
+        :return: Boolean value indicating if the type can be columnar.
+        """
+        if getattr(type_, "__origin__", None) not in [list, List]:
+            return False
+
+        row_type = type_.__args__[0]
+        if getattr(row_type, "__origin__", None) not in [dict, Dict]:
+            return False
+
+        value_type = row_type.__args__[1]
+        return value_type in [bool, int, float, str] or validations.is_choice_type(value_type)
+
+    def _create_defaults_template(self) -> Dict[str, Any]:
+        """
+        Validates the defaults once, as they would be validated in a JSON file, e.g. converting 10 to 10.0 for float
+        arguments and returning ColumnTable objects for columnar arguments. The defaults are frozen if the results are.
+
+        :return: A dictionary mapping the name of every argument with a default to its validated default.
+        """
+        defaults_template = {}
+        for arg_name, type_default_bounds in self.type_default_bounds_dict.items():
+            if not type_default_bounds.has_default:
+                continue
+
+            default_value = type_default_bounds.default_value
+            try:
+                default_value = validations.validate_argument(default_value, type_default_bounds)
+            except TypeError:
+                # None and empty lists are accepted as defaults of lists and dicts, and kept as they are
+                pass
+            defaults_template[arg_name] = frozen_dict.freeze(default_value) if self.frozen else default_value
+
+        return defaults_template
+
     @staticmethod
     def _check_valid_default(arg_defaults_dict: Dict[str, Any], arg_types_dict: Dict[str, type],
-                             arg_bounds_dict: Dict[str, bounds.Bounds]):
+                             arg_constraints_dict: Dict[str, Dict[str, Any]]):
         """
-        Checks if the provided default arguments are valid, considering the types and bounds.
+        Checks if the provided default arguments are valid, considering the types, bounds, and constraints.
 
         :param arg_defaults_dict: Dictionary mapping from argument name to default value.
         :param arg_types_dict: Dictionary mapping from argument name to type.
-        :param arg_bounds_dict: Dictionary mapping from argument name to Bounds object.
-        :raises ValueError: If the default value is out of bounds.
+        :param arg_constraints_dict: Dictionary mapping from argument name to the keyword arguments of its
+                                     TypeDefaultBounds holding the bounds and constraints.
+        :raises ValueError: If the default value is out of bounds or does not satisfy the constraints.
         :raises TypeError: If the default argument is of the wrong type (None is accepted for lists and dicts).
         """
         for arg_name, default_value in arg_defaults_dict.items():
             # Use the validations module to validate default has if it was the real value
             type_def = type_defaults.TypeDefaultBounds(arg_name, arg_types_dict[arg_name],
-                                                       bound_obj=arg_bounds_dict.get(arg_name, None))
+                                                       **arg_constraints_dict[arg_name])
             try:
                 validations.validate_argument(default_value, type_def)
-            except ValueError:
-                raise ValueError("Invalid default value for {name} argument with bound {bound} "
-                                 "(default: {value})".format(name=arg_name, bound=arg_bounds_dict[arg_name],
-                                                             value=default_value))
+            except ValueError as e:
+                raise ValueError("Invalid default value for {name} argument: {error} "
+                                 "(default: {value})".format(name=arg_name, error=e, value=default_value))
             except TypeError:
                 # allow none or empty for lists and dicts
                 if hasattr(arg_types_dict[arg_name], "__origin__"):
@@ -200,39 +492,586 @@ class ConfigArgs(object):
                                 "(default value: {}, expected_type: {})".format(arg_name, default_value,
                                                                                 arg_types_dict[arg_name]))
 
-    def parse_json(self, path_to_json: str, encoding: str = "utf-8") -> Dict[str, Any]:
+    def parse_json(self, path_to_json: str, encoding: str = "utf-8", executor: Union[Executor, None] = None,
+                   parallel_min_size: int = parallel.DEFAULT_MIN_PARALLEL_SIZE) -> Dict[str, Any]:
         """
         Parses a JSON file, reads the arguments, validates them, and returns a dictionary with them.
 
+        If an executor is given (see parallel.create_executor), arguments with an estimated size of at least
+        parallel_min_size elements are validated concurrently on it, while the others are validated in the calling
+        thread, and the named validators which need to run are run concurrently on it. Errors are deterministic: the
+        reported error is always the one of the first invalid argument, in the order in which arguments are defined in
+        the options class.
+
         :param path_to_json: Path to JSON configuration file.
         :param encoding: The encoding to use when loading the JSON file.
+        :param executor: An optional concurrent.futures Executor used to validate large arguments in parallel.
+        :param parallel_min_size: The estimated number of elements from which an argument is validated on the executor.
         :return: A Dictionary mapping argument name to value.
         :raises ValueError: If an argument is an empty string, if an argument with no default is missing from the JSON,
                             or if the JSON contains an unknown argument.
         :raises TypeError: If an argument is of the wrong type.
+        :raises LimitExceededError: If the file exceeds one of the limits of the limits_obj.
         """
+        tracker = None if self.limits_obj is None else self.limits_obj.start()
+
         with open(path_to_json, "r", encoding=encoding) as f:
-            loaded_args = json.load(f)
+            if tracker is None:
+                loaded_args = json.load(f)
+            else:
+                tracker.check_file_size(os.fstat(f.fileno()).st_size)
+                loaded_args = self._decode_json(f.read(), tracker)
+
+        return self._validate_loaded_args(loaded_args, executor, parallel_min_size, tracker)
+
+    def validate_dict(self, args_dict: Mapping[str, Any], executor: Union[Executor, None] = None,
+                      parallel_min_size: int = parallel.DEFAULT_MIN_PARALLEL_SIZE) -> Dict[str, Any]:
+        """
+        Validates an already decoded configuration, e.g. loaded from another format or built in code, and returns a
+        dictionary with the arguments, as parse_json does for a JSON file.
+
+        The given mapping is not modified. Lists and dictionaries in which no element needed to be converted (e.g. 10.0
+        for an int) are returned as they are instead of being copied, so the result may share them with args_dict.
+        The limits of the limits_obj are enforced, except max_file_bytes which only applies to files.
+
+        :param args_dict: A mapping from argument name to value.
+        :param executor: An optional concurrent.futures Executor used to validate large arguments in parallel.
+        :param parallel_min_size: The estimated number of elements from which an argument is validated on the executor.
+        :return: A Dictionary mapping argument name to value.
+        :raises ValueError: If an argument is an empty string, if an argument with no default is missing, or if
+                            args_dict contains an unknown argument.
+        :raises TypeError: If an argument is of the wrong type, or if args_dict is not a mapping.
+        :raises LimitExceededError: If args_dict exceeds one of the limits of the limits_obj.
+        """
+        if not isinstance(args_dict, Mapping):
+            raise TypeError("The args_dict parameter should be a mapping from argument names to values "
+                            "(args_dict: {})".format(args_dict))
+
+        tracker = None if self.limits_obj is None else self.limits_obj.start()
+        return self._validate_loaded_args(dict(args_dict), executor, parallel_min_size, tracker)
+
+    def validate_batch(self, args_dicts: List[Mapping[str, Any]]) -> List[batch.BatchResult]:
+        """
+        Validates many already decoded configurations, e.g. the candidates of a hyperparameter sweep, as validate_dict
+        does for each of them, capturing the errors instead of raising them.
+
+        The missing and unknown arguments are checked once per distinct set of keys. Each argument is gathered across
+        all configurations into a column, and columns of ints or floats which all have exactly the expected type have
+        their bounds checked on the minimum and maximum only, with NumPy if it is installed. Other values, and the
+        columns with values out of bounds, are validated one by one. The named validators and extra validations run
+        for each configuration.
+        If the limits_obj is set, each configuration is validated by validate_dict, so that its limits are enforced.
+
+        :param args_dicts: The configurations, each a mapping from argument name to value, which are not modified.
+        :return: One BatchResult per configuration, in the same order, holding either the validated arguments or the
+                 error validate_dict would raise.
+        :raises TypeError: If args_dicts is not a list.
+        """
+        if not isinstance(args_dicts, list):
+            raise TypeError("The args_dicts parameter should be a list of mappings from argument names to values "
+                            "(args_dicts: {})".format(args_dicts))
 
-        json_arg_names = set(loaded_args.keys())
+        if self.limits_obj is None:
+            return batch.validate_configs(self, args_dicts)
 
-        for arg_name in self.arg_names:
+        results = []
+        for i, args_dict in enumerate(args_dicts):
+            try:
+                results.append(batch.BatchResult(i, args=self.validate_dict(args_dict)))
+            except Exception as e:
+                results.append(batch.BatchResult(i, error=e))
+        return results
+
+    def apply_patch(self, result: Union[tuple, Mapping[str, Any]], operations: List[Mapping[str, Any]],
+                    executor: Union[Executor, None] = None) -> Dict[str, Any]:
+        """
+        Applies JSON Patch (RFC 6902) add, replace, and remove operations to a result, e.g.
+        [{"op": "replace", "path": "/routing/eu/weights/0", "value": 3}], and returns the new result.
+        Paths are JSON Pointers whose first token is the argument name. Removing an argument with a default restores
+        the default.
+
+        Only the values of the operations are validated, against the type, bounds, and constraints of their path, so
+        the cost depends on the size of the patch rather than the size of the configuration. The lists and
+        dictionaries along the paths are copied, and every other value is shared with the given result, which is not
+        modified. The changed elements are checked against the collection constraints of their arguments, and the
+        named validators whose arguments changed and the extra validations are run again.
+
+        :param result: A result of this instance, or an instance of the options class built from one.
+        :param operations: The list of operations, applied in order. Either all or none of them are applied.
+        :param executor: An optional concurrent.futures Executor used to run the named validators in parallel.
+        :return: A Dictionary mapping argument name to value.
+        :raises ValueError: If an operation is malformed or its path does not exist, or if a value is out of bounds.
+        :raises TypeError: If result is of the wrong type, if a value is of the wrong type, or if a list or dictionary
+                           becomes empty.
+        """
+        if isinstance(result, self.options_class):
+            args_dict = result._asdict()
+        elif isinstance(result, Mapping):
+            args_dict = result
+        else:
+            raise TypeError("The result parameter should be an instance of the options class or a dictionary "
+                            "(result: {})".format(result))
+
+        patched_args = patch.apply_operations(args_dict, operations, self.type_default_bounds_dict,
+                                              self._defaults_template, self.frozen)
+        return self._run_extra_validations(patched_args, executor)
+
+    def create_path_view(self, result: Union[tuple, Mapping[str, Any]]) -> path_view.PathView:
+        """
+        Builds a PathView of a result, indexing every argument and every value nested in dictionaries by its dotted
+        path, so hot-path reads such as view["routing.eu.weights"] are a single lookup. Paths can be checked against
+        the options class once with PathView.getter. Arguments missing from the result are included with their
+        defaults, validated as in a JSON file (e.g. converted to Enum members, or from 10 to 10.0 for float arguments).
+
+        :param result: A result of this instance, or an instance of the options class built from one.
+        :return: The PathView of the result.
+        :raises TypeError: If result is of the wrong type.
+        """
+        if isinstance(result, self.options_class):
+            result = result._asdict()
+        elif not isinstance(result, Mapping):
+            raise TypeError("The result parameter should be an instance of the options class or a dictionary "
+                            "(result: {})".format(result))
+
+        defaults_dict = self._defaults_template
+        if defaults_dict is None:
+            defaults_dict = self._create_defaults_template()
+        return path_view.PathView(result, self.type_default_bounds_dict, defaults_dict)
+
+    def parse_json_sampled(self, path_to_json: str, sampling_policy: sampling.SamplingPolicy,
+                           encoding: str = "utf-8") -> Tuple[Dict[str, Any], sampling.SamplingReport]:
+        """
+        Parses a trusted JSON file, e.g. generated by a pipeline which already validated it, validating only a sample
+        of the elements of large lists and dictionaries (see sampling.SamplingPolicy).
+        The top-level structure, missing and unknown arguments, scalar arguments, and the length and required keys
+        collection constraints are still fully validated, as are the named validators and extra validations.
+        Elements which are not sampled are returned as they are, without int/float conversions.
+        Use parse_json for full validation.
+
+        :param path_to_json: Path to JSON configuration file.
+        :param sampling_policy: The SamplingPolicy which selects the validated elements.
+        :param encoding: The encoding to use when loading the JSON file.
+        :return: A Dictionary mapping argument name to value, and a SamplingReport of the sampled containers.
+        :raises ValueError: If an argument is an empty string, if an argument with no default is missing from the JSON,
+                            or if the JSON contains an unknown argument.
+        :raises TypeError: If an argument is of the wrong type.
+        :raises LimitExceededError: If the file exceeds one of the limits of the limits_obj.
+        """
+        if not isinstance(sampling_policy, sampling.SamplingPolicy):
+            raise TypeError("The sampling_policy parameter should be a SamplingPolicy object "
+                            "(sampling_policy: {})".format(sampling_policy))
+
+        tracker = None if self.limits_obj is None else self.limits_obj.start()
+        sampler = sampling_policy.start()
+
+        with open(path_to_json, "r", encoding=encoding) as f:
+            if tracker is None:
+                loaded_args = json.load(f)
+            else:
+                tracker.check_file_size(os.fstat(f.fileno()).st_size)
+                loaded_args = self._decode_json(f.read(), tracker)
+
+        validated_args = self._validate_loaded_args(loaded_args, tracker=tracker, sampler=sampler)
+        return validated_args, sampler.report()
+
+    def parse_json_memory(self, path_to_json: str,
+                          encoding: str = "utf-8") -> Tuple[Dict[str, Any], memory.MemoryReport]:
+        """
+        Parses a JSON file as parse_json does, and reports the memory it took (see memory.MemoryReport): the peak traced
+        allocation while decoding, while validating, and while copying the arguments for the extra validations, and the
+        deep retained size of each argument of the result.
+        Allocations are traced with tracemalloc, which slows parsing down several times, so this method is meant for
+        sizing and checking configurations rather than for loading them in production.
+
+        :param path_to_json: Path to JSON configuration file.
+        :param encoding: The encoding to use when loading the JSON file.
+        :return: A Dictionary mapping argument name to value, and the MemoryReport.
+        :raises ValueError: If an argument is an empty string, if an argument with no default is missing from the JSON,
+                            or if the JSON contains an unknown argument.
+        :raises TypeError: If an argument is of the wrong type.
+        :raises LimitExceededError: If the file exceeds one of the limits of the limits_obj.
+        :raises RuntimeError: If tracemalloc is already tracing, on Python versions before 3.9.
+        """
+        tracker = None if self.limits_obj is None else self.limits_obj.start()
+        tracer = memory.MemoryTracer()
+        tracer.start()
+        try:
+            tracer.enter_phase(memory.DECODE_PHASE)
+            with open(path_to_json, "r", encoding=encoding) as f:
+                file_size = os.fstat(f.fileno()).st_size
+                if tracker is None:
+                    loaded_args = json.load(f)
+                else:
+                    tracker.check_file_size(file_size)
+                    loaded_args = self._decode_json(f.read(), tracker)
+
+            tracer.enter_phase(memory.VALIDATION_PHASE)
+            validated_args = self._validate_loaded_args(loaded_args, tracker=tracker, tracer=tracer)
+        finally:
+            tracer.stop()
+
+        return validated_args, memory.create_report(file_size, tracer, validated_args)
+
+    def parse_source(self, source: "sources.ConfigSource", encoding: str = "utf-8",
+                     executor: Union[Executor, None] = None) -> Dict[str, Any]:
+        """
+        Parses the configuration of a source (see the sources module), validates it, and returns a dictionary with the
+        arguments.
+        The version of the content is remembered for each source: if the source did not change since it was last
+        parsed by this instance, a copy of the previously validated arguments is returned without reading or validating
+        the content again.
+        Sources made of several documents (e.g. a DirectorySource) are merged into a single configuration.
+        When the content did change, only the named validators whose arguments changed are run again.
+
+        :param source: The ConfigSource to read the configuration from.
+        :param encoding: The encoding of the documents of the source.
+        :param executor: An optional concurrent.futures Executor used to run the named validators concurrently.
+        :return: A Dictionary mapping argument name to value.
+        :raises ValueError: If an argument is an empty string, if an argument with no default is missing, if the
+                            configuration contains an unknown argument, or if an argument is defined in more than one
+                            document of the source.
+        :raises TypeError: If an argument is of the wrong type.
+        :raises LimitExceededError: If the content exceeds one of the limits of the limits_obj.
+        :raises OSError: If the content cannot be fetched, or if the source reports unchanged content which was never
+                         parsed by this instance.
+        """
+        # Imported here, so importing this module does not import the HTTP and zip modules used by the sources
+        from . import sources
+
+        if not isinstance(source, sources.ConfigSource):
+            raise TypeError("The source parameter should be a ConfigSource object (source: {})".format(source))
+
+        with self._source_cache_lock:
+            cached = self._source_cache.get(source, None)
+        fetched = source.fetch(None if cached is None else cached[0])
+        if fetched is None:
+            if cached is None:
+                # E.g. an HTTP server answering 304 Not Modified to a request which was not conditional
+                raise OSError("The source reported unchanged content, but this instance never parsed it "
+                              "(source: {})".format(source))
+            return self._copy_cached_result(cached[1])
+
+        tracker = None if self.limits_obj is None else self.limits_obj.start()
+        if tracker is not None:
+            tracker.check_file_size(sum(len(document) for document in fetched.documents))
+
+        loaded_args = {}
+        for document in fetched.documents:
+            loaded_document = self._decode_json(document.decode(encoding), tracker)
+            if not isinstance(loaded_document, dict):
+                raise TypeError("Each document of the source should contain an object mapping argument names to "
+                                "values (document: {})".format(loaded_document))
+
+            for arg_name in loaded_document:
+                if arg_name in loaded_args:
+                    raise ValueError("Argument {} is defined in more than one document of the source".format(arg_name))
+            loaded_args.update(loaded_document)
+
+        validated_args = self._validate_loaded_args(loaded_args, executor, tracker=tracker)
+        with self._source_cache_lock:
+            self._source_cache[source] = (fetched.version, validated_args)
+
+        return self._copy_cached_result(validated_args)
+
+    def dump_json(self, result: Union[tuple, Mapping[str, Any]], path_to_json: str, encoding: str = "utf-8",
+                  sort_keys: bool = False, indent: Union[int, None] = None, validate: bool = True,
+                  chunk_size: int = writer.DEFAULT_CHUNK_SIZE):
+        """
+        Writes arguments to a JSON file which can be parsed again with parse_json.
+        The output is streamed in chunks and written atomically, see writer.write_json.
+
+        When the results of this instance include the defaults (frozen or fill_defaults), arguments equal to their
+        default are left out of the file, since parsing adds them back. Otherwise, only the arguments equal to a default
+        which cannot be parsed from a JSON file (e.g. None or an empty list) are left out, so the file parses back to
+        the same result. By default the other arguments are validated before writing, and the named validators and the
+        extra validations run on all arguments. Results returned by this instance, or options class instances built
+        from them, are already valid, so validate can be set to False to skip this step.
+        Float arguments which are not finite are written as NaN, Infinity, and -Infinity, as parse_json reads them.
+
+        :param result: An instance of the options class or a dictionary mapping argument name to value.
+        :param path_to_json: Path to the JSON file to write.
+        :param encoding: The encoding to use when writing the JSON file.
+        :param sort_keys: Flag indicating if dictionary keys are sorted, which makes the output deterministic (e.g.
+                          for content hashing).
+        :param indent: The indentation of the output, or None for the most compact output.
+        :param validate: Flag indicating if the arguments are validated before writing.
+        :param chunk_size: The number of characters buffered before they are written to the file.
+        :raises ValueError: If an argument is invalid, missing, or unknown.
+        :raises TypeError: If result is of the wrong type or if an argument is of the wrong type.
+        """
+        if isinstance(result, self.options_class):
+            args_dict = result._asdict()
+        elif isinstance(result, Mapping):
+            args_dict = dict(result)
+        else:
+            raise TypeError("The result parameter should be an instance of the options class or a dictionary "
+                            "(result: {})".format(result))
+
+        if validate:
+            provided_arg_names = self._check_arg_names(args_dict.keys())
+            for arg_name in provided_arg_names:
+                if not self._equals_default(arg_name, args_dict[arg_name]):
+                    args_dict[arg_name] = validations.validate_argument(args_dict[arg_name],
+                                                                        self.type_default_bounds_dict[arg_name])
+            args_dict = dict(self._build_result(args_dict, provided_arg_names))
+
+        args_dict = {arg_name: arg_value for arg_name, arg_value in args_dict.items()
+                     if not self._omitted_from_json(arg_name, arg_value)}
+        writer.write_json(args_dict, path_to_json, encoding, sort_keys, indent, chunk_size)
+
+    def iter_jsonl(self, path_to_jsonl: str, encoding: str = "utf-8",
+                   executor: Union[Executor, None] = None,
+                   max_pending: int = 64) -> Iterator[jsonl.LineResult]:
+        """
+        Parses a JSON Lines file, where each non-blank line holds one configuration object, and validates every line
+        against the known information.
+        The file is streamed line by line, so memory usage is bounded by the size of a single line (times the number of
+        pending lines when an executor is used).
+
+        If an executor is given, lines are validated concurrently, but results are still yielded in file order.
+        A ProcessPoolExecutor requires the options class and the extra validations function to be picklable.
+
+        :param path_to_jsonl: Path to JSON Lines configuration file.
+        :param encoding: The encoding to use when loading the JSON Lines file.
+        :param executor: An optional concurrent.futures Executor used to validate lines in parallel.
+        :param max_pending: Maximum number of lines submitted to the executor and not yet yielded.
+        :return: An iterator of LineResult instances, one per non-blank line, in file order.
+        :raises TypeError: If max_pending is not an integer.
+        :raises ValueError: If max_pending is not positive.
+        """
+        if not isinstance(max_pending, int) or isinstance(max_pending, bool):
+            raise TypeError("The max_pending parameter should be an integer "
+                            "(max_pending: {})".format(max_pending))
+        if max_pending < 1:
+            raise ValueError("The max_pending parameter should be a positive integer "
+                             "(max_pending: {})".format(max_pending))
+
+        # The arguments are checked before the generator is created, so errors are raised by the call itself
+        return self._iter_jsonl(path_to_jsonl, encoding, executor, max_pending)
+
+    def _iter_jsonl(self, path_to_jsonl: str, encoding: str, executor: Union[Executor, None],
+                    max_pending: int) -> Iterator[jsonl.LineResult]:
+        with open(path_to_jsonl, "r", encoding=encoding) as f:
+            lines = ((line_number, line) for line_number, line in enumerate(f, start=1) if line.strip())
+
+            if executor is None:
+                for line_number, line in lines:
+                    yield jsonl.validate_line(self, line_number, line)
+                return
+
+            pending = collections.deque()
+            try:
+                for line_number, line in lines:
+                    pending.append(executor.submit(jsonl.validate_line, self, line_number, line))
+                    if len(pending) >= max_pending:
+                        yield pending.popleft().result()
+
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                # Lines submitted but not yielded, e.g. when the caller closes the iterator early, are not validated
+                for future in pending:
+                    future.cancel()
+
+    def _equals_default(self, arg_name: str, arg_value: Any) -> bool:
+        """
+        Checks if a value is equal to the default of its argument, either as given in the options class or as
+        validated in the defaults template (e.g. frozen).
+        """
+        type_default_bounds = self.type_default_bounds_dict.get(arg_name, None)
+        if type_default_bounds is None or not type_default_bounds.has_default:
+            return False
+
+        return arg_value == type_default_bounds.default_value or \
+            (self._defaults_template is not None and arg_value == self._defaults_template[arg_name])
+
+    def _omitted_from_json(self, arg_name: str, arg_value: Any) -> bool:
+        """
+        Checks if dump_json leaves an argument out of the file: if it is equal to its default and either parsing adds
+        the defaults back, or the default cannot be parsed from a JSON file.
+        """
+        if not self._equals_default(arg_name, arg_value):
+            return False
+        if self._defaults_template is not None:
+            return True
+
+        try:
+            validations.validate_argument(arg_value, self.type_default_bounds_dict[arg_name])
+        except TypeError:
+            # None and empty lists are accepted as defaults of lists and dicts, but not in JSON files
+            return True
+        return False
+
+    def _copy_cached_result(self, cached_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copies the lists and dictionaries of a cached result, so callers modifying their result never change the cache.
+        Frozen results are immutable and returned as they are.
+        """
+        return cached_result if self.frozen else frozen_dict.copy_containers(cached_result)
+
+    @staticmethod
+    def _decode_json(json_text: str, tracker: Union[limits.LimitsTracker, None] = None) -> Any:
+        """
+        Decodes a JSON document, enforcing the limits of the tracker while decoding.
+
+        :param json_text: The JSON document.
+        :param tracker: An optional LimitsTracker.
+        :return: The decoded JSON object.
+        """
+        if tracker is None:
+            return json.loads(json_text)
+
+        tracker.check_json_text(json_text)
+        return json.loads(json_text, object_pairs_hook=tracker.object_pairs_hook)
+
+    def _validate_loaded_args(self, loaded_args: Any, executor: Union[Executor, None] = None,
+                              parallel_min_size: int = parallel.DEFAULT_MIN_PARALLEL_SIZE,
+                              tracker: Union[limits.LimitsTracker, None] = None,
+                              sampler: Union[sampling.Sampler, None] = None,
+                              tracer: Union[memory.MemoryTracer, None] = None) -> Dict[str, Any]:
+        """
+        Validates an already decoded JSON object against the known information.
+
+        :param loaded_args: The decoded JSON object, which should be a dictionary mapping argument name to value.
+        :param executor: An optional concurrent.futures Executor used to validate large arguments and run the named
+                         validators in parallel.
+        :param parallel_min_size: The estimated number of elements from which an argument is validated on the executor.
+        :param tracker: An optional LimitsTracker, enforcing resource limits during validation.
+        :param sampler: An optional Sampler, selecting the elements validated in large lists and dictionaries. It is
+                        only used for arguments validated in the calling thread.
+        :param tracer: An optional MemoryTracer, recording the copy of the arguments for the extra validations as a
+                       separate phase.
+        :return: A Dictionary mapping argument name to value.
+        :raises ValueError: If an argument is an empty string, if an argument with no default is missing from the JSON,
+                            or if the JSON contains an unknown argument.
+        :raises TypeError: If an argument is of the wrong type, or if the JSON does not contain an object.
+        """
+        if not isinstance(loaded_args, dict):
+            raise TypeError("The JSON file should contain an object mapping argument names to values "
+                            "(JSON: {})".format(loaded_args))
+
+        provided_arg_names = self._check_arg_names(loaded_args.keys())
+
+        arg_trackers = {}
+        if tracker is not None:
+            arg_trackers = {arg_name: tracker.for_argument(arg_name) for arg_name in provided_arg_names}
+
+        futures = {}
+        if executor is not None:
+            for arg_name in provided_arg_names:
+                if parallel.estimate_size(loaded_args[arg_name]) >= parallel_min_size:
+                    futures[arg_name] = executor.submit(_validate_argument_tracked, loaded_args[arg_name],
+                                                        self.type_default_bounds_dict[arg_name],
+                                                        arg_trackers.get(arg_name, None))
+
+        try:
+            for arg_name in provided_arg_names:
+                if arg_name in futures:
+                    loaded_args[arg_name], arg_tracker = futures[arg_name].result()
+                else:
+                    arg_tracker = arg_trackers.get(arg_name, None)
+                    loaded_args[arg_name] = validations.validate_argument(loaded_args[arg_name],
+                                                                          self.type_default_bounds_dict[arg_name],
+                                                                          arg_tracker, sampler)
+                if tracker is not None:
+                    tracker.merge(arg_tracker)
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+        if tracker is not None:
+            tracker.check_deadline()
+
+        return self._build_result(loaded_args, provided_arg_names, executor, tracer)
+
+    def _check_arg_names(self, json_arg_names: Iterable[str]) -> List[str]:
+        """
+        Checks that the provided arguments include all arguments without defaults and no unknown arguments.
+
+        :param json_arg_names: The names of the provided arguments.
+        :return: The names of the provided arguments, in the definition order of the options class.
+        :raises ValueError: If an argument with no default is missing, or if an argument is unknown.
+        """
+        json_arg_names = set(json_arg_names)
+
+        # Follow the definition order of the options class, so the reported error does not depend on set ordering
+        provided_arg_names = []
+        for arg_name in self.options_class._fields:
             if arg_name not in json_arg_names and not self.type_default_bounds_dict[arg_name].has_default:
                 raise ValueError("Argument {} was not provided in the JSON file and no default "
                                  "was given".format(arg_name))
 
             elif arg_name in json_arg_names:
                 json_arg_names.remove(arg_name)
-                loaded_args[arg_name] = validations.validate_argument(loaded_args[arg_name],
-                                                                      self.type_default_bounds_dict[arg_name])
+                provided_arg_names.append(arg_name)
 
         if len(json_arg_names) > 0:
             raise ValueError("Unknown arguments provided in the JSON file: {}".format(json_arg_names))
 
-        # Check extra validations
+        return provided_arg_names
+
+    def _build_result(self, loaded_args: Dict[str, Any], provided_arg_names: List[str],
+                      executor: Union[Executor, None] = None,
+                      tracer: Union[memory.MemoryTracer, None] = None) -> Dict[str, Any]:
+        """
+        Freezes validated arguments if the results are frozen, adds the defaults of the missing arguments if the
+        results are frozen or fill_defaults is set, then runs the named validators and the extra validations.
+
+        :param loaded_args: The validated arguments, mapping argument name to value, which is modified.
+        :param provided_arg_names: The names of the arguments which were provided, rather than defaults.
+        :param executor: An optional concurrent.futures Executor used to run the named validators in parallel.
+        :param tracer: An optional MemoryTracer, recording the copy of the arguments for the extra validations.
+        :return: A Dictionary mapping argument name to value.
+        """
+        if self.frozen:
+            for arg_name in provided_arg_names:
+                loaded_args[arg_name] = frozen_dict.freeze(loaded_args[arg_name])
+
+        if self._defaults_template is not None:
+            for arg_name, default_value in self._defaults_template.items():
+                if arg_name not in loaded_args:
+                    # Frozen defaults are shared, others are copied so results never share mutable values
+                    loaded_args[arg_name] = default_value if self.frozen else \
+                        frozen_dict.copy_containers(default_value)
+
+        return self._run_extra_validations(loaded_args, executor, tracer)
+
+    def _run_extra_validations(self, loaded_args: Dict[str, Any],
+                               executor: Union[Executor, None] = None,
+                               tracer: Union[memory.MemoryTracer, None] = None) -> Dict[str, Any]:
+        """
+        Runs the named validators and the extra validations on validated arguments, and builds the final result.
+
+        :param loaded_args: The validated arguments, mapping argument name to value.
+        :param executor: An optional concurrent.futures Executor used to run the named validators in parallel.
+        :param tracer: An optional MemoryTracer, recording the copy of the arguments for the extra validations.
+        :return: A Dictionary mapping argument name to value.
+        """
+        # Check named validators, then extra validations
+        if self._validator_runner is not None:
+            self._validator_runner.run(loaded_args, executor)
+
         if self.extra_validations is not None:
-            returned_args = self.extra_validations(copy.deepcopy(loaded_args))
+            if tracer is not None:
+                tracer.enter_phase(memory.COPY_PHASE)
+            # Frozen values cannot be modified, so they do not need to be copied
+            args_copy = dict(loaded_args) if self.frozen else copy.deepcopy(loaded_args)
+            if tracer is not None:
+                tracer.enter_phase(memory.VALIDATION_PHASE)
+            returned_args = self.extra_validations(args_copy)
             if returned_args is not None and isinstance(returned_args, dict):
                 loaded_args = returned_args
 
+        if self.frozen:
+            return frozen_dict.FrozenDict((arg_name, frozen_dict.freeze(arg_value))
+                                          for arg_name, arg_value in loaded_args.items())
+
         return loaded_args
+
+
+def _validate_argument_tracked(arg_value: Any, arg_type_defaults: type_defaults.TypeDefaultBounds,
+                               tracker: Union[limits.LimitsTracker, None]) -> Tuple[Any, limits.LimitsTracker]:
+    """
+    Validates an argument on an executor, returning the tracker too, since process pools validate copies of it.
+    """
+    return validations.validate_argument(arg_value, arg_type_defaults, tracker), tracker
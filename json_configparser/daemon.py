@@ -0,0 +1,265 @@
+"""
+Implements an optional validation daemon for short-lived processes, such as pre-commit hooks and build steps, which
+would otherwise spend most of their run time importing options classes and creating ConfigArgs instances.
+
+The daemon listens on a Unix domain socket, loads each schema once, and keeps the validated arguments of recent files,
+which are only read and validated again when they change. Clients send batches of (schema, path) requests, one JSON
+line per batch, and receive one JSON line with a result per request. The daemon exits once it is idle.
+
+A schema is given as "module:attribute", where the attribute is either an options class or a ConfigArgs instance
+(e.g. with bounds and extra validations). Modules are imported with the sys.path of the daemon, which includes the
+directory it was started from, and are imported again when their file changes. Only Unix platforms are supported.
+
+The client is the json_configparser_client module, which only imports the standard library, so that clients do not
+import this package. Its validate_files and shutdown functions are also available from this module.
+
+Usage::
+
+    python -m json_configparser.daemon serve /tmp/configparser.sock
+    python -m json_configparser_client check /tmp/configparser.sock my_package.options:Arguments config.json
+"""
+
+import argparse
+import collections
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+from typing import List, Dict, Any, Tuple, Union
+
+from json_configparser_client import validate_files, shutdown  # noqa: F401
+
+from . import config_args
+from . import sources
+from . import writer
+from .schema_loader import load_schema
+
+#: the number of seconds without requests after which the daemon exits
+DEFAULT_IDLE_TIMEOUT = 600.0
+#: the maximum number of files whose validated arguments are kept
+DEFAULT_MAX_CACHED_FILES = 1024
+# The maximum size of a request line, which only holds schemas and paths
+_MAX_REQUEST_BYTES = 1 << 20
+# The number of seconds a connection may wait for the client before it is dropped, since connections are served one at
+# a time and the idle timeout is only checked between them
+_CONNECTION_TIMEOUT = 5.0
+
+
+def _module_mtime(module_name: str) -> Union[int, None]:
+    """
+    Returns the modification time of the file of an imported module, or None if it has no file.
+    """
+    module_file = getattr(sys.modules.get(module_name, None), "__file__", None)
+    try:
+        return None if module_file is None else os.stat(module_file).st_mtime_ns
+    except OSError:
+        return None
+
+
+class ValidationServer(object):
+    """
+    Serves validation requests over a Unix domain socket, one connection at a time.
+    """
+    def __init__(self, socket_path: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 max_cached_files: int = DEFAULT_MAX_CACHED_FILES):
+        """
+        :param socket_path: Path of the Unix domain socket to listen on.
+        :param idle_timeout: The number of seconds without requests after which serve returns.
+        :param max_cached_files: The maximum number of files whose validated arguments are kept.
+        """
+        if not isinstance(idle_timeout, (int, float)) or isinstance(idle_timeout, bool) or idle_timeout <= 0:
+            raise ValueError("The idle_timeout parameter should be a positive number "
+                             "(idle_timeout: {})".format(idle_timeout))
+        if not isinstance(max_cached_files, int) or isinstance(max_cached_files, bool) or max_cached_files < 1:
+            raise ValueError("The max_cached_files parameter should be a positive integer "
+                             "(max_cached_files: {})".format(max_cached_files))
+
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.max_cached_files = max_cached_files
+
+        # Maps each schema to the modification time of its module file when it was loaded, and its ConfigArgs
+        self._schemas = {}
+        # Maps the name of each module imported for a schema to the modification time of its file when imported
+        self._module_mtimes = {}
+        # Maps (schema, path, encoding) to a FileSource, whose validated arguments are cached by its ConfigArgs
+        self._file_sources = collections.OrderedDict()
+        self._stopped = False
+
+    def validate(self, schema: str, path: str, encoding: str = "utf-8") -> Dict[str, Any]:
+        """
+        Validates a file against a schema, reusing the loaded schema and the arguments of the file if it did not
+        change.
+
+        :param schema: The schema specification, see load_schema.
+        :param path: Absolute path to the JSON file.
+        :param encoding: The encoding of the JSON file.
+        :return: A Dictionary mapping argument name to value.
+        """
+        args_object = self._load_schema(schema)
+
+        key = (schema, path, encoding)
+        source = self._file_sources.pop(key, None)
+        if source is None:
+            source = sources.FileSource(path)
+        self._file_sources[key] = source
+        while len(self._file_sources) > self.max_cached_files:
+            self._file_sources.popitem(last=False)
+
+        return args_object.parse_source(source, encoding)
+
+    def _load_schema(self, schema: str) -> config_args.ConfigArgs:
+        """
+        Loads a schema once, and again after the file of its module changed, in which case the module is imported
+        again. Other modules imported by that module are not.
+        """
+        module_name = schema.partition(":")[0]
+        loaded_mtime = self._module_mtimes.get(module_name, None)
+        if loaded_mtime is not None:
+            mtime = _module_mtime(module_name)
+            if mtime != loaded_mtime:
+                importlib.reload(sys.modules[module_name])
+                self._module_mtimes[module_name] = mtime
+
+        cached = self._schemas.get(schema, None)
+        if cached is not None and cached[0] == self._module_mtimes[module_name]:
+            return cached[1]
+
+        try:
+            args_object = load_schema(schema)
+        finally:
+            # Modules are tracked even if the attribute is missing, so adding it to the module is noticed
+            if module_name not in self._module_mtimes and module_name in sys.modules:
+                self._module_mtimes[module_name] = _module_mtime(module_name)
+
+        self._schemas[schema] = (self._module_mtimes[module_name], args_object)
+        return args_object
+
+    def handle_batch(self, requests: List[Dict[str, Any]], include_args: bool = True) -> List[Dict[str, Any]]:
+        """
+        Validates a batch of requests, each a dictionary with the schema, path, and optionally encoding keys.
+        An invalid request or file does not prevent the other requests from being validated.
+
+        :param requests: The requests.
+        :param include_args: Flag indicating if the results of valid files include their validated arguments.
+        :return: One result per request: {"ok": True, "args": ...} (or {"ok": True} without include_args) or
+                 {"ok": False, "error": ..., "message": ...}.
+        """
+        results = []
+        for request in requests:
+            try:
+                if not isinstance(request, dict) or not isinstance(request.get("schema", None), str) or \
+                        not isinstance(request.get("path", None), str):
+                    raise ValueError("Each request should be an object with schema and path strings "
+                                     "(request: {})".format(request))
+                args = self.validate(request["schema"], request["path"], request.get("encoding", "utf-8"))
+                results.append({"ok": True, "args": args} if include_args else {"ok": True})
+            except Exception as e:
+                results.append({"ok": False, "error": type(e).__name__, "message": str(e)})
+
+        return results
+
+    def _handle_line(self, line: bytes) -> Tuple[bytes, bool]:
+        """
+        Handles one request line, returning the response line and a flag indicating if the server should stop.
+        """
+        try:
+            message = json.loads(line.decode("utf-8"))
+            if not isinstance(message, dict):
+                raise ValueError("The request should be a JSON object")
+
+            if message.get("op", None) == "shutdown":
+                response, stop = {"ok": True}, True
+            elif message.get("op", None) == "validate" and isinstance(message.get("requests", None), list):
+                results = self.handle_batch(message["requests"], message.get("include_args", True) is not False)
+                response, stop = {"ok": True, "results": results}, False
+            else:
+                raise ValueError("Unknown request (request: {})".format(message))
+        except Exception as e:
+            response, stop = {"ok": False, "error": type(e).__name__, "message": str(e)}, False
+
+        return json.dumps(response, default=writer._encode_default).encode("utf-8") + b"\n", stop
+
+    def serve(self):
+        """
+        Listens on the socket and serves requests until the server is idle for idle_timeout seconds or a shutdown
+        request is received. The socket file is only accessible by the current user and is removed on exit.
+
+        :raises OSError: If another server is already listening on the socket.
+        """
+        if os.path.exists(self.socket_path):
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                    probe.connect(self.socket_path)
+            except OSError:
+                # Stale socket file left by a server which did not exit cleanly
+                os.remove(self.socket_path)
+            else:
+                raise OSError("A server is already listening on {}".format(self.socket_path))
+
+        validation_server = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            timeout = min(_CONNECTION_TIMEOUT, self.idle_timeout)
+
+            def handle(self):
+                try:
+                    line = self.rfile.readline(_MAX_REQUEST_BYTES)
+                except socket.timeout:
+                    return
+                if not line:
+                    return
+                response, stop = validation_server._handle_line(line)
+                try:
+                    self.wfile.write(response)
+                except socket.timeout:
+                    pass
+                if stop:
+                    validation_server._stopped = True
+
+        class _Server(socketserver.UnixStreamServer):
+            def handle_timeout(self):
+                validation_server._stopped = True
+
+        self._stopped = False
+        # The socket file is created by bind, so the umask keeps it from being accessible by other users at any time
+        previous_umask = os.umask(0o177)
+        try:
+            server = _Server(self.socket_path, _Handler)
+        finally:
+            os.umask(previous_umask)
+        with server:
+            try:
+                server.timeout = self.idle_timeout
+                while not self._stopped:
+                    server.handle_request()
+            finally:
+                os.remove(self.socket_path)
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    """
+    Command line entry point, see the module documentation.
+
+    :param argv: The command line arguments, or None to use sys.argv.
+    :return: The exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m json_configparser.daemon",
+                                     description="Run a daemon which validates JSON configuration files for the "
+                                                 "json_configparser_client module.")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    serve_parser = subparsers.add_parser("serve", help="run the daemon")
+    serve_parser.add_argument("socket_path")
+    serve_parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+
+    args = parser.parse_args(argv)
+    ValidationServer(args.socket_path, args.idle_timeout).serve()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Implements the SchemaDispatcher class, which validates configurations against one of several ConfigArgs instances,
+selected by a discriminator field such as "version" or "kind", decoding and validating each file only once.
+"""
+
+import json
+import os
+from typing import NamedTuple, Dict, Any, Callable, Union, Iterable
+
+from . import config_args
+from . import limits
+from . import validations
+
+_SCALAR_TYPES = (bool, int, float, str)
+
+
+class DispatchResult(NamedTuple):
+    """
+    NamedTuple representing a configuration validated by a SchemaDispatcher.
+    """
+    #: the discriminator value of the selected schema, after migrations
+    discriminator_value: Any
+    #: the ConfigArgs instance of the selected schema, whose options_class can be instantiated with args
+    config_args: config_args.ConfigArgs
+    #: the validated arguments, mapping argument name to value
+    args: Dict[str, Any]
+
+
+def _strictest_limits(limits_objs: Iterable[Union[limits.Limits, None]]) -> Union[limits.Limits, None]:
+    """
+    Combines Limits objects into one holding the lowest value of each limit, or None if no limits are given.
+    """
+    limits_objs = [limits_obj for limits_obj in limits_objs if limits_obj is not None]
+    if len(limits_objs) == 0:
+        return None
+
+    values = {}
+    for name in ["max_file_bytes", "max_elements", "max_arg_elements", "max_depth", "time_budget"]:
+        set_values = [getattr(limits_obj, name) for limits_obj in limits_objs if getattr(limits_obj, name) is not None]
+        values[name] = min(set_values) if len(set_values) > 0 else None
+    return limits.Limits(**values)
+
+
+class SchemaDispatcher(object):
+    """
+    Holds several schemas (ConfigArgs instances), each selected by a value of the discriminator field.
+    Migrations can convert configurations of older discriminator values, e.g. versions without a schema, into newer
+    ones before they are validated.
+
+    The discriminator field is kept if it is an argument of the selected options class, and removed otherwise.
+
+    Since the schema of a file is only known once it is decoded, parse_json decodes files with the limits of the
+    dispatcher, by default the strictest limits of all schemas. The selected schema then enforces its own limits while
+    validating.
+    """
+    def __init__(self, discriminator: str, schemas: Dict[Any, config_args.ConfigArgs],
+                 migrations: Union[Dict[Any, Callable[[Dict[str, Any]], Dict[str, Any]]], None] = None,
+                 limits_obj: Union[limits.Limits, None] = None):
+        """
+        :param discriminator: The name of the field which selects the schema.
+        :param schemas: A dictionary mapping each discriminator value (a bool, int, float, or str) to its ConfigArgs.
+                        As for choice arguments, equal ints and floats are the same value, while bools are not.
+        :param migrations: A dictionary mapping discriminator values to functions which receive a decoded
+                           configuration with that value and return it converted to another discriminator value.
+        :param limits_obj: A Limits object enforced by parse_json while reading and decoding files. If None, each
+                           limit is the lowest one of the limits_obj of the schemas.
+        """
+        self._validate_init_args(discriminator, schemas, migrations, limits_obj)
+
+        self.discriminator = discriminator
+        self.schemas = schemas
+        self.migrations = {} if migrations is None else migrations
+        self.limits_obj = limits_obj if limits_obj is not None else \
+            _strictest_limits(args_object.limits_obj for args_object in schemas.values())
+
+        self._schema_table = {validations._choice_key(value): args_object for value, args_object in schemas.items()}
+        self._migration_table = {validations._choice_key(value): migration
+                                 for value, migration in self.migrations.items()}
+
+    @staticmethod
+    def _validate_init_args(discriminator: str, schemas: Dict[Any, config_args.ConfigArgs],
+                            migrations: Union[Dict[Any, Callable[[Dict[str, Any]], Dict[str, Any]]], None],
+                            limits_obj: Union[limits.Limits, None]):
+        if not isinstance(discriminator, str):
+            raise TypeError("The discriminator parameter should be a string "
+                            "(discriminator: {})".format(discriminator))
+        if len(discriminator.strip()) == 0:
+            raise ValueError("The discriminator parameter should be a non-empty string "
+                             "(discriminator: {})".format(discriminator))
+
+        if not isinstance(schemas, dict) or \
+                not all(isinstance(args_object, config_args.ConfigArgs) for args_object in schemas.values()):
+            raise TypeError("The schemas parameter should be a dictionary mapping discriminator values to ConfigArgs "
+                            "objects (schemas: {})".format(schemas))
+        if len(schemas) == 0:
+            raise ValueError("The schemas parameter should have at least one schema")
+
+        if migrations is not None:
+            if not isinstance(migrations, dict) or not all(callable(migration) for migration in migrations.values()):
+                raise TypeError("The migrations parameter should be None or a dictionary mapping discriminator values "
+                                "to functions (migrations: {})".format(migrations))
+
+        if limits_obj is not None and not isinstance(limits_obj, limits.Limits):
+            raise TypeError("The limits_obj parameter should be None or a Limits object "
+                            "(limits_obj: {})".format(limits_obj))
+
+        for name, values in [("schemas", schemas), ("migrations", migrations or {})]:
+            for value in values:
+                if type(value) not in _SCALAR_TYPES:
+                    raise TypeError("The discriminator values of the {name} parameter should be bools, ints, floats, "
+                                    "or strs (value: {value})".format(name=name, value=value))
+
+    def select(self, loaded_args: Any) -> DispatchResult:
+        """
+        Applies the migrations to a decoded configuration, selects its schema, and validates it.
+
+        :param loaded_args: The decoded configuration, a dictionary which may be modified by the migrations.
+        :return: A DispatchResult with the selected schema and the validated arguments.
+        :raises ValueError: If the discriminator field is missing or has no schema, if the migrations loop, or if the
+                            configuration is invalid.
+        :raises TypeError: If the configuration is not a dictionary or an argument is of the wrong type.
+        """
+        seen_keys = set()
+        while True:
+            if not isinstance(loaded_args, dict):
+                raise TypeError("The configuration should be an object mapping argument names to values "
+                                "(configuration: {})".format(loaded_args))
+            if self.discriminator not in loaded_args:
+                raise ValueError("The {} discriminator field was not provided".format(self.discriminator))
+
+            value = loaded_args[self.discriminator]
+            key = validations._choice_key(value) if type(value) in _SCALAR_TYPES else None
+            migration = self._migration_table.get(key, None)
+            if migration is None:
+                break
+
+            if key in seen_keys:
+                raise ValueError("The migrations of the {} discriminator loop at {}".format(self.discriminator, value))
+            seen_keys.add(key)
+            loaded_args = migration(loaded_args)
+
+        args_object = self._schema_table.get(key, None)
+        if args_object is None:
+            raise ValueError("No schema for {name} {value} (known values: {known})".format(
+                name=self.discriminator, value=value, known=sorted(self.schemas, key=str)))
+
+        if self.discriminator not in args_object.options_class._fields:
+            loaded_args = {arg_name: arg_value for arg_name, arg_value in loaded_args.items()
+                           if arg_name != self.discriminator}
+
+        return DispatchResult(value, args_object, args_object.validate_dict(loaded_args))
+
+    def parse_json(self, path_to_json: str, encoding: str = "utf-8") -> DispatchResult:
+        """
+        Parses a JSON file once, selects its schema by the discriminator field, and validates it against that schema
+        only.
+
+        :param path_to_json: Path to JSON configuration file.
+        :param encoding: The encoding to use when loading the JSON file.
+        :return: A DispatchResult with the selected schema and the validated arguments.
+        :raises ValueError: If the discriminator field is missing or has no schema, or if the configuration is invalid.
+        :raises TypeError: If the JSON does not contain an object or an argument is of the wrong type.
+        :raises LimitExceededError: If the file exceeds one of the limits of the dispatcher, or of the selected schema.
+        """
+        tracker = None if self.limits_obj is None else self.limits_obj.start()
+
+        with open(path_to_json, "r", encoding=encoding) as f:
+            if tracker is None:
+                loaded_args = json.load(f)
+            else:
+                tracker.check_file_size(os.fstat(f.fileno()).st_size)
+                loaded_args = config_args.ConfigArgs._decode_json(f.read(), tracker)
+
+        return self.select(loaded_args)
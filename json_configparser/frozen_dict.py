@@ -0,0 +1,111 @@
+"""
+Implements the FrozenDict class and the freeze function, which convert validated arguments into immutable and hashable
+values that can be shared between threads and caches without defensive copies, and the ReadOnlyObject class, the base
+of the objects shared by the threads which use a ConfigArgs instance.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Iterator
+
+
+class FrozenDict(Mapping):
+    """
+    An immutable and hashable mapping.
+    Instances compare equal to dictionaries with the same items, and are hashable if all values are hashable.
+    """
+    __slots__ = ("_dict", "_hash")
+
+    def __init__(self, *args, **kwargs):
+        self._dict = dict(*args, **kwargs)
+        self._hash = None
+
+    def __getitem__(self, key: str) -> Any:
+        return self._dict[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._dict
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._dict)
+
+    def __len__(self) -> int:
+        return len(self._dict)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FrozenDict):
+            return self._dict == other._dict
+        if isinstance(other, Mapping):
+            return self._dict == dict(other.items())
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # Computing the hash twice from two threads is harmless
+        if self._hash is None:
+            self._hash = hash(frozenset(self._dict.items()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "FrozenDict({!r})".format(self._dict)
+
+    def __reduce__(self):
+        return self.__class__, (self._dict,)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively converts lists and tuples to tuples, and mappings (e.g. dictionaries or read-only mapping proxies) to
+    FrozenDict instances. Tuples and FrozenDict instances whose values are all frozen already are returned unchanged,
+    as are all other values.
+
+    :param value: The value to freeze.
+    :return: The immutable version of the value.
+    """
+    if isinstance(value, list):
+        return tuple(freeze(el) for el in value)
+    if isinstance(value, tuple):
+        frozen_els = tuple(freeze(el) for el in value)
+        return value if all(frozen_el is el for frozen_el, el in zip(frozen_els, value)) else frozen_els
+    if isinstance(value, FrozenDict):
+        frozen_items = [(key, freeze(el)) for key, el in value.items()]
+        return value if all(frozen_el is value[key] for key, frozen_el in frozen_items) else FrozenDict(frozen_items)
+    if isinstance(value, Mapping):
+        return FrozenDict((key, freeze(el)) for key, el in value.items())
+    return value
+
+
+def copy_containers(value: Any) -> Any:
+    """
+    Recursively copies lists and dictionaries, sharing every other value, which is much faster than copy.deepcopy for
+    decoded JSON. Immutable values, including FrozenDict instances and tuples, are returned unchanged.
+
+    :param value: The value to copy.
+    :return: The copy of the value.
+    """
+    if isinstance(value, list):
+        return [copy_containers(el) for el in value]
+    if isinstance(value, dict):
+        return {key: copy_containers(el) for key, el in value.items()}
+    return value
+
+
+class ReadOnlyObject(object):
+    """
+    Base class of objects whose attributes cannot be set or deleted once they are sealed, at the end of __init__.
+    Their attributes can then be read from any number of threads without locks.
+    """
+    _sealed = False
+
+    def _seal(self):
+        object.__setattr__(self, "_sealed", True)
+
+    def __setattr__(self, name: str, value: Any):
+        if self._sealed:
+            raise AttributeError("{} objects are read-only after construction (attribute: {})".format(
+                type(self).__name__, name))
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str):
+        if self._sealed:
+            raise AttributeError("{} objects are read-only after construction (attribute: {})".format(
+                type(self).__name__, name))
+        object.__delattr__(self, name)
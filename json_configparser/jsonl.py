@@ -0,0 +1,47 @@
+"""
+Implements the validation of single JSON Lines entries, used by ConfigArgs.iter_jsonl to validate multi-document files.
+"""
+
+from typing import NamedTuple, Dict, Any
+
+
+class LineResult(NamedTuple):
+    """
+    NamedTuple representing the outcome of validating one line of a JSON Lines file.
+    Exactly one of args and error is not None.
+    """
+    #: the line number in the file, starting at 1
+    line_number: int
+    #: the dictionary mapping argument name to value, if the line is valid
+    args: Dict[str, Any] = None
+    #: the exception raised while decoding or validating the line, if the line is invalid
+    error: Exception = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Flag indicating if the line was successfully validated.
+        """
+        return self.error is None
+
+
+def validate_line(config_args, line_number: int, line: str) -> LineResult:
+    """
+    Decodes and validates a single line of a JSON Lines file.
+    Decoding and validation errors are captured in the returned LineResult instead of being raised.
+    The limits of the ConfigArgs, if any, are enforced separately for each line, with max_file_bytes applying to the
+    UTF-8 encoded size of the line.
+
+    :param config_args: The ConfigArgs instance to validate the line against.
+    :param line_number: The line number in the file.
+    :param line: The content of the line.
+    :return: A LineResult holding either the validated arguments or the error.
+    """
+    try:
+        tracker = None if config_args.limits_obj is None else config_args.limits_obj.start()
+        if tracker is not None:
+            tracker.check_file_size(len(line.encode("utf-8")))
+        loaded_args = config_args._decode_json(line, tracker)
+        return LineResult(line_number, args=config_args._validate_loaded_args(loaded_args, tracker=tracker))
+    except Exception as e:
+        return LineResult(line_number, error=e)
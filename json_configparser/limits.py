@@ -0,0 +1,264 @@
+"""
+The limits module implements the Limits class, which represents resource limits for parsing untrusted configuration
+files, and the LimitsTracker class, which enforces them while a file is decoded and validated.
+"""
+
+import re
+import time
+from typing import Union, List, Tuple, Any, Dict
+
+from . import frozen_dict
+
+
+class LimitExceededError(ValueError):
+    """
+    Raised when a configuration exceeds one of the configured resource limits.
+    """
+    def __init__(self, limit_name: str, limit: Union[int, float], message: str):
+        """
+        :param limit_name: The name of the exceeded limit, e.g. max_depth.
+        :param limit: The value of the exceeded limit.
+        :param message: The error message.
+        """
+        super().__init__(message)
+        self.limit_name = limit_name
+        self.limit = limit
+
+    def __reduce__(self):
+        return self.__class__, (self.limit_name, self.limit, self.args[0])
+
+
+class Limits(frozen_dict.ReadOnlyObject):
+    """
+    Represents the resource limits to enforce when parsing a configuration file.
+    Every limit is optional and is disabled when set to None.
+    """
+    def __init__(self, max_file_bytes: Union[int, None] = None, max_elements: Union[int, None] = None,
+                 max_arg_elements: Union[int, None] = None, max_depth: Union[int, None] = None,
+                 time_budget: Union[int, float, None] = None):
+        """
+        :param max_file_bytes: The maximum size of the JSON file, in bytes.
+        :param max_elements: The maximum number of list and dictionary elements in the whole configuration.
+        :param max_arg_elements: The maximum number of list and dictionary elements in a single argument.
+        :param max_depth: The maximum nesting depth of lists and dictionaries (the top-level object has depth 1).
+        :param time_budget: The maximum wall-clock time, in seconds, spent decoding and validating a file.
+        """
+        self._validate_init_args(max_file_bytes, max_elements, max_arg_elements, max_depth, time_budget)
+
+        self.max_file_bytes = max_file_bytes
+        self.max_elements = max_elements
+        self.max_arg_elements = max_arg_elements
+        self.max_depth = max_depth
+        self.time_budget = time_budget
+        self._seal()
+
+    @staticmethod
+    def _validate_init_args(max_file_bytes: Union[int, None], max_elements: Union[int, None],
+                            max_arg_elements: Union[int, None], max_depth: Union[int, None],
+                            time_budget: Union[int, float, None]):
+        for name, value in [("max_file_bytes", max_file_bytes), ("max_elements", max_elements),
+                            ("max_arg_elements", max_arg_elements), ("max_depth", max_depth)]:
+            if value is not None and type(value) is not int:
+                raise TypeError("The {name} parameter should be an integer or None "
+                                "({name}: {value})".format(name=name, value=value))
+            if value is not None and value < 1:
+                raise ValueError("The {name} parameter should be a positive integer "
+                                 "({name}: {value})".format(name=name, value=value))
+
+        if time_budget is not None and type(time_budget) not in [int, float]:
+            raise TypeError("The time_budget parameter should be an integer, float, or None "
+                            "(time_budget: {})".format(time_budget))
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError("The time_budget parameter should be a positive number "
+                             "(time_budget: {})".format(time_budget))
+
+    def start(self) -> "LimitsTracker":
+        """
+        Starts tracking the resources used to parse a single file. The time budget starts counting now.
+
+        :return: A new LimitsTracker instance.
+        """
+        deadline = None if self.time_budget is None else time.monotonic() + self.time_budget
+        return LimitsTracker(self, deadline)
+
+    def __str__(self):
+        return "Limits(max_file_bytes={}, max_elements={}, max_arg_elements={}, max_depth={}, " \
+               "time_budget={})".format(self.max_file_bytes, self.max_elements, self.max_arg_elements,
+                                        self.max_depth, self.time_budget)
+
+
+# Matches JSON strings, so the brackets and commas they contain are skipped, empty containers as a single token, and
+# the other brackets one by one
+_JSON_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[{]\s*[\]}]|[\[\]{}]', re.DOTALL)
+
+
+class LimitsTracker(object):
+    """
+    Tracks the resources used while decoding and validating a single file, raising a LimitExceededError as soon as one
+    of the limits is exceeded.
+    Containers are accounted for when they are entered, before their elements are validated.
+    """
+    def __init__(self, limits: Limits, deadline: Union[float, None], arg_name: Union[str, None] = None,
+                 base_elements: int = 0):
+        """
+        Instances should be created with Limits.start and LimitsTracker.for_argument.
+
+        :param limits: The limits to enforce.
+        :param deadline: The time.monotonic value after which parsing must abort, or None.
+        :param arg_name: The name of the tracked argument, for trackers of a single argument.
+        :param base_elements: The number of elements already accounted for in other arguments.
+        """
+        self.limits = limits
+        self.deadline = deadline
+        self.arg_name = arg_name
+        self.base_elements = base_elements
+        self.elements = 0
+        self.depth = 0
+
+    def check_file_size(self, size: int):
+        """
+        :param size: The size of the file, in bytes.
+        :raises LimitExceededError: If the file is larger than max_file_bytes.
+        """
+        if self.limits.max_file_bytes is not None and size > self.limits.max_file_bytes:
+            raise LimitExceededError("max_file_bytes", self.limits.max_file_bytes,
+                                     "The JSON file exceeds the maximum size of {} bytes "
+                                     "(size: {})".format(self.limits.max_file_bytes, size))
+
+    def check_json_text(self, text: str):
+        """
+        Scans a JSON document before it is decoded, so that oversized documents are rejected before memory is spent on
+        them: checks its nesting depth, and counts the elements of its lists and dictionaries as validation would
+        (i.e. without the top-level object of arguments). The time budget is checked once the document is scanned.
+
+        :param text: The JSON document.
+        :raises LimitExceededError: If the document is nested deeper than max_depth, has more than max_elements
+                                    elements or an argument with more than max_arg_elements elements, or if the time
+                                    budget is exhausted.
+        """
+        max_depth, max_elements = self.limits.max_depth, self.limits.max_elements
+        max_arg_elements = self.limits.max_arg_elements
+        if max_depth is None and max_elements is None and max_arg_elements is None:
+            self.check_deadline()
+            return
+
+        # Elements are counted in the containers nested in the top-level object, or in a top-level list
+        counted_depth = None
+        depth = 0
+        elements = 0
+        arg_elements = 0
+        position = 0
+        # The document is scanned in a single pass without being copied: strings are matched as tokens, so the text
+        # between two tokens holds no string and its commas separate elements of the same container
+        for token_match in _JSON_TOKEN.finditer(text):
+            if counted_depth is not None and depth >= counted_depth:
+                arg_elements += text.count(",", position, token_match.start())
+            position = token_match.end()
+            if text[token_match.start()] == '"':
+                continue
+
+            token = token_match.group()
+            opening = token[0] in "[{"
+            if counted_depth is None:
+                counted_depth = 2 if token[0] == "{" else 1
+            if opening and max_depth is not None and depth + 1 > max_depth:
+                raise LimitExceededError("max_depth", max_depth,
+                                         "The JSON file exceeds the maximum nesting depth of {}".format(max_depth))
+
+            # Empty containers are matched as a single token, other containers have one more element than commas
+            non_empty_container = opening and len(token) == 1
+            if non_empty_container and depth + 1 >= counted_depth:
+                arg_elements += 1
+
+            if max_arg_elements is not None and arg_elements > max_arg_elements:
+                raise LimitExceededError("max_arg_elements", max_arg_elements,
+                                         "An argument of the JSON file exceeds the maximum of {} elements "
+                                         "per argument".format(max_arg_elements))
+            if max_elements is not None and elements + arg_elements > max_elements:
+                self._raise_max_elements()
+
+            if non_empty_container:
+                depth += 1
+            elif not opening:
+                depth -= 1
+                if depth == counted_depth - 1:
+                    elements += arg_elements
+                    arg_elements = 0
+
+        self.check_deadline()
+
+    def check_deadline(self):
+        """
+        :raises LimitExceededError: If the time budget is exhausted.
+        """
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise LimitExceededError("time_budget", self.limits.time_budget,
+                                     "Parsing the JSON file exceeded the time budget of "
+                                     "{} seconds".format(self.limits.time_budget))
+
+    def object_pairs_hook(self, pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        """
+        Hook for json.load, which checks the time budget each time a dictionary is decoded.
+        Lists of other values are decoded without interruption, but check_json_text bounds their size beforehand.
+
+        :param pairs: The key value pairs of a decoded JSON object.
+        :return: The dictionary built from the pairs.
+        """
+        self.check_deadline()
+        return dict(pairs)
+
+    def for_argument(self, arg_name: str) -> "LimitsTracker":
+        """
+        Creates a tracker for the validation of a single argument, which shares the deadline of this tracker.
+        The elements it accounts for must be added back to this tracker with merge.
+
+        :param arg_name: The name of the argument.
+        :return: A new LimitsTracker instance.
+        """
+        return LimitsTracker(self.limits, self.deadline, arg_name, self.elements)
+
+    def merge(self, arg_tracker: "LimitsTracker"):
+        """
+        Adds the elements accounted for by an argument tracker to this tracker.
+
+        :param arg_tracker: A tracker created by for_argument.
+        :raises LimitExceededError: If the total number of elements exceeds max_elements.
+        """
+        self.elements += arg_tracker.elements
+        self._check_elements()
+
+    def enter_container(self, length: int):
+        """
+        Accounts for a list or dictionary, before its elements are validated.
+
+        :param length: The number of elements of the container.
+        :raises LimitExceededError: If one of the limits is exceeded.
+        """
+        self.depth += 1
+        self.elements += length
+
+        # The argument itself is nested in the top-level object
+        if self.limits.max_depth is not None and self.depth + 1 > self.limits.max_depth:
+            raise LimitExceededError("max_depth", self.limits.max_depth,
+                                     "The {} argument exceeds the maximum nesting depth of "
+                                     "{}".format(self.arg_name, self.limits.max_depth))
+        if self.limits.max_arg_elements is not None and self.elements > self.limits.max_arg_elements:
+            raise LimitExceededError("max_arg_elements", self.limits.max_arg_elements,
+                                     "The {} argument exceeds the maximum of {} elements "
+                                     "per argument".format(self.arg_name, self.limits.max_arg_elements))
+        self._check_elements()
+        self.check_deadline()
+
+    def exit_container(self):
+        """
+        Marks the end of the validation of the last entered container.
+        """
+        self.depth -= 1
+
+    def _check_elements(self):
+        if self.limits.max_elements is not None and self.base_elements + self.elements > self.limits.max_elements:
+            self._raise_max_elements()
+
+    def _raise_max_elements(self):
+        raise LimitExceededError("max_elements", self.limits.max_elements,
+                                 "The JSON file exceeds the maximum of {} elements".format(self.limits.max_elements))
@@ -0,0 +1,182 @@
+"""
+Implements memory accounting for parsing and validation, used by ConfigArgs.parse_json_memory: the MemoryTracer class,
+which records the peak traced allocations (tracemalloc) of each phase, the deep_sizeof function, which estimates the
+memory retained by a validated value, and the MemoryReport NamedTuple which holds the figures.
+
+The memory_report module runs ConfigArgs.parse_json_memory from the command line.
+"""
+
+import array
+import sys
+import tracemalloc
+from typing import NamedTuple, Dict, Any, List, Union
+
+#: The phases recorded by a MemoryTracer during ConfigArgs.parse_json_memory
+DECODE_PHASE = "decode"
+VALIDATION_PHASE = "validation"
+COPY_PHASE = "copy"
+
+
+class MemoryReport(NamedTuple):
+    """
+    NamedTuple representing the memory used to parse and validate a configuration file, in bytes.
+    Peaks are measured with tracemalloc, relative to the memory traced when the phase started.
+    """
+    #: the size of the file
+    file_size: int
+    #: the peak allocation while reading and decoding the file
+    decode_peak: int
+    #: the peak allocation while validating the decoded arguments, including the named validators
+    validation_peak: int
+    #: the peak allocation while copying the arguments given to the extra validations (0 without extra validations)
+    copy_peak: int
+    #: the deep retained size of each argument of the result, including the defaults of frozen results
+    argument_sizes: Dict[str, int]
+    #: the deep retained size of the whole result, counting values shared between arguments once
+    total_size: int
+
+    @property
+    def peak(self) -> int:
+        """
+        The highest peak allocation of all phases.
+        """
+        return max(self.decode_peak, self.validation_peak, self.copy_peak)
+
+    @property
+    def amplification(self) -> float:
+        """
+        The ratio between the highest of the peak allocation and retained size, and the size of the file.
+        """
+        return max(self.peak, self.total_size) / max(self.file_size, 1)
+
+    def summary(self) -> str:
+        """
+        :return: A human readable summary of the report, one figure per line, with arguments from largest to smallest.
+        """
+        lines = ["file size: {} bytes".format(self.file_size),
+                 "decode peak: {} bytes".format(self.decode_peak),
+                 "validation peak: {} bytes".format(self.validation_peak),
+                 "extra validations copy peak: {} bytes".format(self.copy_peak),
+                 "retained size: {} bytes".format(self.total_size),
+                 "amplification: {:.1f}x".format(self.amplification)]
+        for arg_name, size in sorted(self.argument_sizes.items(), key=lambda item: (-item[1], item[0])):
+            lines.append("  {}: {} bytes".format(arg_name, size))
+
+        return "\n".join(lines)
+
+
+def _slot_values(obj: Any) -> List[Any]:
+    values = []
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for slot in ([slots] if isinstance(slots, str) else slots):
+            if slot not in ("__dict__", "__weakref__") and hasattr(obj, slot):
+                values.append(getattr(obj, slot))
+    return values
+
+
+def deep_sizeof(value: Any, seen: Union[set, None] = None) -> int:
+    """
+    Estimates the memory retained by a value: the sys.getsizeof of the value and of everything it contains, i.e. the
+    keys and values of dictionaries, the elements of lists, tuples and sets, and the slots of objects such as
+    FrozenDict and ColumnTable. Each object is counted once.
+
+    :param value: The value.
+    :param seen: The ids of the objects already counted, which is updated; used to count several values together.
+    :return: The estimated size in bytes.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [value]
+    while len(stack) > 0:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif not isinstance(obj, (str, bytes, int, float, array.array)):
+            # The buffer of an array is part of its sys.getsizeof
+            stack.extend(_slot_values(obj))
+
+    return total
+
+
+class MemoryTracer(object):
+    """
+    Records the peak traced allocation of consecutive phases with tracemalloc. A phase may be entered several times,
+    in which case its highest peak is kept.
+
+    tracemalloc is started by start and stopped by stop if it was not already tracing. Python versions before 3.9
+    cannot reset the traced peak, so they require tracemalloc to not be tracing already.
+    """
+    def __init__(self):
+        #: maps each phase to its peak allocation, in bytes
+        self.peaks = {}
+        self._phase = None
+        self._baseline = 0
+        self._started = False
+
+    def start(self):
+        """
+        Starts tracing, if tracemalloc is not already tracing.
+
+        :raises RuntimeError: If tracemalloc is already tracing, on Python versions before 3.9.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        elif not hasattr(tracemalloc, "reset_peak"):
+            raise RuntimeError("Memory reports require tracemalloc to not be tracing already before Python 3.9")
+
+    def enter_phase(self, phase: str):
+        """
+        Ends the current phase, if any, and starts recording the given one.
+
+        :param phase: The name of the phase.
+        """
+        self._end_phase()
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+            self._baseline = tracemalloc.get_traced_memory()[0]
+        else:
+            # Only possible if this tracer started tracemalloc, so no other traces are lost
+            tracemalloc.clear_traces()
+            self._baseline = 0
+        self._phase = phase
+
+    def stop(self):
+        """
+        Ends the current phase, if any, and stops tracing if start started it.
+        """
+        self._end_phase()
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def _end_phase(self):
+        if self._phase is None:
+            return
+
+        peak = max(tracemalloc.get_traced_memory()[1] - self._baseline, 0)
+        self.peaks[self._phase] = max(self.peaks.get(self._phase, 0), peak)
+        self._phase = None
+
+
+def create_report(file_size: int, tracer: MemoryTracer, result: Dict[str, Any]) -> MemoryReport:
+    """
+    Builds the MemoryReport of a validated result.
+
+    :param file_size: The size of the configuration file, in bytes.
+    :param tracer: The MemoryTracer which recorded the decode, validation, and copy phases.
+    :param result: The validated arguments, mapping argument name to value.
+    :return: The MemoryReport.
+    """
+    argument_sizes = {arg_name: deep_sizeof(arg_value) for arg_name, arg_value in result.items()}
+    return MemoryReport(file_size, tracer.peaks.get(DECODE_PHASE, 0), tracer.peaks.get(VALIDATION_PHASE, 0),
+                        tracer.peaks.get(COPY_PHASE, 0), argument_sizes, deep_sizeof(result))
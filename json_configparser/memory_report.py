@@ -0,0 +1,53 @@
+"""
+Reports the memory used to parse and validate a configuration file (see ConfigArgs.parse_json_memory), to find files
+whose memory cost is far out of proportion to their size before they reach production.
+
+The schema is given as "module:attribute", where the attribute is either an options class or a ConfigArgs instance (see
+the schema_loader module). The exit code is 1 if the file is invalid or exceeds the given amplification.
+
+Usage::
+
+    python -m json_configparser.memory_report my_package.options:Arguments config.json --max-amplification 50
+"""
+
+import argparse
+import sys
+from typing import List, Union
+
+from . import schema_loader
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    """
+    Command line entry point, see the module documentation.
+
+    :param argv: The command line arguments, or None to use sys.argv.
+    :return: The exit code: 0 if the file is valid and within the amplification, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog="python -m json_configparser.memory_report",
+                                     description="Report the memory used to parse and validate a JSON configuration "
+                                                 "file.")
+    parser.add_argument("schema")
+    parser.add_argument("path")
+    parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument("--max-amplification", type=float, default=None,
+                        help="fail if the peak allocation or retained size exceeds this multiple of the file size")
+    args = parser.parse_args(argv)
+
+    try:
+        _, report = schema_loader.load_schema(args.schema).parse_json_memory(args.path, args.encoding)
+    except (ValueError, TypeError) as e:
+        print("{}: {}: {}".format(args.path, type(e).__name__, e), file=sys.stderr)
+        return 1
+
+    print(report.summary())
+    if args.max_amplification is not None and report.amplification > args.max_amplification:
+        print("{}: the amplification {:.1f}x exceeds {}x".format(args.path, report.amplification,
+                                                                 args.max_amplification), file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Implements helpers for validating large arguments concurrently: a cheap size heuristic and the creation of a suitable
+executor.
+"""
+
+import sys
+from concurrent.futures import Executor
+from typing import Any, Union
+
+#: arguments with an estimated number of elements below this value are always validated in the calling thread
+DEFAULT_MIN_PARALLEL_SIZE = 100000
+
+
+def gil_enabled() -> bool:
+    """
+    Checks if the running interpreter has the global interpreter lock enabled.
+
+    :return: False on free-threaded builds of Python with the GIL disabled, True otherwise.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def create_executor(max_workers: Union[int, None] = None) -> Executor:
+    """
+    Creates an executor suitable for validating arguments in parallel.
+    Validation is CPU bound pure Python code, so a ProcessPoolExecutor is used unless the interpreter runs without the
+    global interpreter lock, in which case threads are used and no pickling is needed.
+
+    :param max_workers: The maximum number of workers. Defaults to the executor's own default.
+    :return: A ThreadPoolExecutor on free-threaded Python, a ProcessPoolExecutor otherwise.
+    """
+    # Imported here, since importing concurrent.futures.process also imports multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if gil_enabled():
+        return ProcessPoolExecutor(max_workers=max_workers)
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def estimate_size(arg_value: Any) -> int:
+    """
+    Estimates the number of leaf elements of a value, by following the first element of each nested list or dictionary.
+    The cost is proportional to the nesting depth, not to the size of the value.
+
+    :param arg_value: The value of the argument.
+    :return: The estimated number of leaf elements (1 for scalars).
+    """
+    size = 1
+    while isinstance(arg_value, (list, dict)) and len(arg_value) > 0:
+        size *= len(arg_value)
+        arg_value = arg_value[0] if isinstance(arg_value, list) else next(iter(arg_value.values()))
+
+    return size
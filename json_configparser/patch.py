@@ -0,0 +1,335 @@
+"""
+Implements the application of JSON Patch (RFC 6902) add, replace, and remove operations to validated arguments, used by
+ConfigArgs.apply_patch.
+
+Paths are JSON Pointers (RFC 6901) whose first token is the argument name, e.g. "/routing/eu/weights/0". Only the
+values given in the operations are validated. The lists and dictionaries along the path of each operation are copied,
+at most once per patch, and every other value is shared with the patched arguments. The columns of columnar arguments
+are copied the same way, and only the changed elements are checked against the collection constraints.
+"""
+
+import copy
+from collections.abc import Mapping
+from typing import Any, Dict, List, Union
+
+from . import columnar
+from . import frozen_dict
+from . import type_defaults
+from . import validations
+
+_OPERATIONS = ("add", "replace", "remove")
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """
+    Splits a JSON Pointer into its unescaped tokens.
+
+    :param pointer: The JSON Pointer, e.g. "/routing/eu~1west".
+    :return: The tokens, e.g. ["routing", "eu/west"].
+    :raises ValueError: If the pointer is not a string starting with "/".
+    """
+    if not isinstance(pointer, str) or not pointer.startswith("/"):
+        raise ValueError("The path should be a JSON Pointer starting with / (path: {})".format(pointer))
+
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _is_list_type(type_: Any) -> bool:
+    return getattr(type_, "__origin__", None) in [list, List]
+
+
+def _is_dict_type(type_: Any) -> bool:
+    return getattr(type_, "__origin__", None) in [dict, Dict]
+
+
+def _child_type_defaults(parent: type_defaults.TypeDefaultBounds, key: Union[int, str],
+                         path: str) -> type_defaults.TypeDefaultBounds:
+    """
+    Returns the TypeDefaultBounds of an element of a list or dictionary, as validations.validate_argument builds them.
+    """
+    if _is_list_type(parent.type_):
+        name = "element of " + parent.arg_name + " list"
+    elif _is_dict_type(parent.type_):
+        name = "element of " + parent.arg_name + " dictionary with key " + key
+    else:
+        raise ValueError("The path {} goes past {}, which is not a list or dictionary".format(path, parent.arg_name))
+
+    return type_defaults.TypeDefaultBounds(name, parent.type_.__args__[-1], bound_obj=parent.bound_obj,
+                                           str_constraints_obj=parent.str_constraints_obj,
+                                           key_constraints_obj=parent.key_constraints_obj)
+
+
+class _Patcher(object):
+    """
+    Applies operations to a copy of the top-level arguments dictionary, copying each container along the paths once.
+    """
+    def __init__(self, args_dict: Dict[str, Any], type_default_bounds_dict: Dict[str, type_defaults.TypeDefaultBounds],
+                 defaults_template: Union[Mapping, None], frozen: bool):
+        self.args_dict = args_dict
+        self.type_default_bounds_dict = type_default_bounds_dict
+        self.defaults_template = defaults_template
+        self.frozen = frozen
+
+        # Maps id to the containers copied by this patch, which can be modified in place
+        self._copies = {}
+        # The copied containers whose length changed, with their TypeDefaultBounds
+        self._resized = []
+        # Maps each touched argument to its top-level keys or indexes changed by element operations
+        self._touched_keys = {}
+
+    def _writable(self, value: Any, value_type_defaults: type_defaults.TypeDefaultBounds, path: str) -> Any:
+        if id(value) in self._copies:
+            return value
+
+        if value is None:
+            raise ValueError("The path {} does not exist ({} is None)".format(path, value_type_defaults.arg_name))
+        if _is_list_type(value_type_defaults.type_):
+            writable_value = list(value)
+        elif _is_dict_type(value_type_defaults.type_):
+            writable_value = dict(value)
+        else:
+            raise ValueError("The path {} goes past {}, which is not a list or "
+                             "dictionary".format(path, value_type_defaults.arg_name))
+
+        self._copies[id(writable_value)] = writable_value
+        return writable_value
+
+    def _validate_value(self, value: Any, value_type_defaults: type_defaults.TypeDefaultBounds) -> Any:
+        # The operation keeps its value, so later changes to it cannot reach the validated arguments
+        validated_value = validations.validate_argument(copy.deepcopy(value), value_type_defaults)
+        return frozen_dict.freeze(validated_value) if self.frozen else validated_value
+
+    def apply(self, operation: Mapping):
+        if not isinstance(operation, Mapping) or operation.get("op", None) not in _OPERATIONS:
+            raise ValueError("Each operation should be an object with an op of {} "
+                             "(operation: {})".format(", ".join(_OPERATIONS), operation))
+        if operation["op"] != "remove" and "value" not in operation:
+            raise ValueError("The {} operation requires a value (operation: {})".format(operation["op"], operation))
+
+        op = operation["op"]
+        path = operation.get("path", None)
+        tokens = parse_pointer(path)
+
+        arg_name = tokens[0]
+        arg_type_defaults = self.type_default_bounds_dict.get(arg_name, None)
+        if arg_type_defaults is None:
+            raise ValueError("Unknown argument {} in path {}".format(arg_name, path))
+        changed_keys = self._touched_keys.setdefault(arg_name, set())
+
+        if len(tokens) == 1:
+            # The new value is validated with the collection constraints of the argument
+            changed_keys.clear()
+            self._apply_argument(op, arg_type_defaults, operation.get("value", None))
+            return
+
+        if arg_name in self.args_dict:
+            arg_value = self.args_dict[arg_name]
+        elif self.defaults_template is not None and arg_name in self.defaults_template:
+            arg_value = self.defaults_template[arg_name]
+        elif arg_type_defaults.has_default:
+            arg_value = arg_type_defaults.default_value
+        else:
+            raise ValueError("The path {} does not exist".format(path))
+
+        if arg_type_defaults.columnar and isinstance(arg_value, (list, tuple)):
+            # Defaults missing from the results are lists of rows
+            arg_value = validations.validate_argument(arg_value, arg_type_defaults)
+        if isinstance(arg_value, columnar.ColumnTable):
+            arg_value = columnar.TableEditor(arg_value)
+            self.args_dict[arg_name] = arg_value
+        if isinstance(arg_value, columnar.TableEditor):
+            self._apply_table(op, arg_value, arg_type_defaults, tokens, operation.get("value", None), path)
+            return
+
+        container = self._writable(arg_value, arg_type_defaults, path)
+        self.args_dict[arg_name] = container
+        container_type_defaults = arg_type_defaults
+
+        for depth, token in enumerate(tokens[1:-1]):
+            key = self._resolve_key(container, token, path, must_exist=True)
+            if depth == 0:
+                self._touch_key(arg_name, key, 0)
+            child_type_defaults = _child_type_defaults(container_type_defaults, key, path)
+            child = self._writable(container[key], child_type_defaults, path)
+            container[key] = child
+            container, container_type_defaults = child, child_type_defaults
+
+        self._apply_element(op, container, container_type_defaults, tokens[-1], operation.get("value", None), path,
+                            arg_name if len(tokens) == 2 else None)
+
+    def _touch_key(self, arg_name: str, key: Union[int, str], shift: int):
+        """
+        Records a top-level key or index changed by an operation. The recorded list indexes are shifted when an element
+        is inserted (shift 1) or removed (shift -1) at the index, and the index of a removed element is recorded as the
+        one of the element following it.
+        """
+        changed_keys = self._touched_keys[arg_name]
+        if shift > 0:
+            changed_keys = {index + 1 if index >= key else index for index in changed_keys}
+        elif shift < 0:
+            changed_keys = {index - 1 if index > key else index for index in changed_keys if index != key}
+        changed_keys.add(key)
+        self._touched_keys[arg_name] = changed_keys
+
+    def _apply_argument(self, op: str, arg_type_defaults: type_defaults.TypeDefaultBounds, value: Any):
+        arg_name = arg_type_defaults.arg_name
+        if op != "remove":
+            self.args_dict[arg_name] = self._validate_value(value, arg_type_defaults)
+        elif not arg_type_defaults.has_default:
+            raise ValueError("Argument {} has no default and cannot be removed".format(arg_name))
+        elif self.defaults_template is not None:
+            # Frozen results, and results with fill_defaults, include every argument
+            default_value = self.defaults_template[arg_name]
+            self.args_dict[arg_name] = default_value if self.frozen else frozen_dict.copy_containers(default_value)
+        else:
+            self.args_dict.pop(arg_name, None)
+
+    def _resolve_key(self, container: Union[list, dict], token: str, path: str, must_exist: bool) -> Union[int, str]:
+        if isinstance(container, dict):
+            if must_exist and token not in container:
+                raise ValueError("The path {} does not exist (missing key: {})".format(path, token))
+            return token
+
+        if token == "-" and not must_exist:
+            return len(container)
+        # RFC 6901 array indexes have no sign and no leading zeros
+        if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+            raise ValueError("The path {} has an invalid list index {}".format(path, token))
+
+        index = int(token)
+        if index > len(container) or (must_exist and index == len(container)):
+            raise ValueError("The path {} does not exist (list index out of range: {})".format(path, index))
+        return index
+
+    def _apply_element(self, op: str, container: Union[list, dict],
+                       container_type_defaults: type_defaults.TypeDefaultBounds, token: str, value: Any, path: str,
+                       arg_name: Union[str, None]):
+        key = self._resolve_key(container, token, path, must_exist=op != "add")
+        if arg_name is not None:
+            self._touch_key(arg_name, key, 0 if isinstance(container, dict) or op == "replace" else
+                            1 if op == "add" else -1)
+        if isinstance(container, dict) and op == "add" and key not in container:
+            key_type_defaults = type_defaults.TypeDefaultBounds("key of " + container_type_defaults.arg_name +
+                                                                " dictionary", str,
+                                                                str_constraints_obj=container_type_defaults.
+                                                                key_constraints_obj)
+            validations.validate_argument(key, key_type_defaults)
+            self._resized.append((container, container_type_defaults))
+
+        if op == "remove":
+            del container[key]
+            self._resized.append((container, container_type_defaults))
+            return
+
+        validated_value = self._validate_value(value, _child_type_defaults(container_type_defaults, key, path))
+        if isinstance(container, list) and op == "add":
+            container.insert(key, validated_value)
+            self._resized.append((container, container_type_defaults))
+        else:
+            container[key] = validated_value
+
+    def _apply_table(self, op: str, editor: columnar.TableEditor, arg_type_defaults: type_defaults.TypeDefaultBounds,
+                     tokens: List[str], value: Any, path: str):
+        """
+        Applies an operation to the rows or cells of a columnar argument. The rows keep the keys of the table.
+        """
+        arg_name = arg_type_defaults.arg_name
+        index = self._resolve_key(editor, tokens[1], path, must_exist=len(tokens) > 2 or op != "add")
+        row_type_defaults = _child_type_defaults(arg_type_defaults, index, path)
+
+        if len(tokens) == 2:
+            if op == "remove":
+                editor.delete_row(index)
+                self._resized.append((editor, arg_type_defaults))
+                self._touch_key(arg_name, index, -1)
+                return
+
+            row = self._validate_value(value, row_type_defaults)
+            if len(row) != len(editor.keys) or row.keys() != set(editor.keys):
+                raise ValueError("The rows of the columnar {name} argument should all have the keys {keys} "
+                                 "(row {i}: {row})".format(name=arg_name, keys=list(editor.keys), i=index, row=row))
+            if op == "add":
+                editor.insert_row(index, row)
+            else:
+                editor.set_row(index, row)
+            self._touch_key(arg_name, index, 1 if op == "add" else 0)
+            return
+
+        key = tokens[2]
+        cell_type_defaults = _child_type_defaults(row_type_defaults, key, path)
+        if len(tokens) > 3:
+            raise ValueError("The path {} goes past {}, which is not a list or "
+                             "dictionary".format(path, cell_type_defaults.arg_name))
+        if key not in editor.keys and op != "add":
+            raise ValueError("The path {} does not exist (missing key: {})".format(path, key))
+        if key not in editor.keys or op == "remove":
+            raise ValueError("The rows of the columnar {name} argument should all have the keys {keys} "
+                             "(path: {path})".format(name=arg_name, keys=list(editor.keys), path=path))
+
+        editor.set_cell(index, key, self._validate_value(value, cell_type_defaults))
+        self._touch_key(arg_name, index, 0)
+
+    def _refreeze(self, value: Any) -> Any:
+        """
+        Freezes the containers copied by this patch, sharing every other value.
+        """
+        if id(value) not in self._copies:
+            return value
+        if isinstance(value, list):
+            return tuple(self._refreeze(el) for el in value)
+        return frozen_dict.FrozenDict((key, self._refreeze(el)) for key, el in value.items())
+
+    def finish(self) -> Dict[str, Any]:
+        """
+        Checks the containers whose length changed, freezes the copied containers if the results are frozen, and checks
+        the changed elements of the touched arguments against their collection constraints.
+        """
+        for container, container_type_defaults in self._resized:
+            if len(container) == 0:
+                raise TypeError("The {name} argument should be a {kind} of {type_}, but it is an empty {kind}.".format(
+                    name=container_type_defaults.arg_name, kind="dict" if isinstance(container, dict) else "list",
+                    type_=container_type_defaults.type_.__args__[-1]))
+
+        for arg_name in self._touched_keys:
+            if isinstance(self.args_dict.get(arg_name, None), columnar.TableEditor):
+                self.args_dict[arg_name] = self.args_dict[arg_name].to_table()
+
+        if self.frozen:
+            for arg_name in self._touched_keys:
+                if arg_name in self.args_dict:
+                    self.args_dict[arg_name] = self._refreeze(self.args_dict[arg_name])
+
+        # The elements are checked once frozen, so that they compare equal to the untouched elements
+        for arg_name, changed_keys in self._touched_keys.items():
+            constraints = self.type_default_bounds_dict[arg_name].collection_constraints_obj
+            if constraints is not None and changed_keys and arg_name in self.args_dict:
+                constraints.validate_changes(self.args_dict[arg_name], changed_keys)
+
+        return self.args_dict
+
+
+def apply_operations(args_dict: Mapping, operations: List[Mapping],
+                     type_default_bounds_dict: Dict[str, type_defaults.TypeDefaultBounds],
+                     defaults_template: Union[Mapping, None] = None, frozen: bool = False) -> Dict[str, Any]:
+    """
+    Applies JSON Patch operations to validated arguments, without modifying them.
+    Operations are applied in order, and the given values are validated against the type, bounds, and constraints of
+    their path. Removing an argument with a default restores the default.
+
+    :param args_dict: The validated arguments, mapping argument name to value.
+    :param operations: The add, replace, and remove operations, e.g. {"op": "replace", "path": "/a1", "value": 1}.
+    :param type_default_bounds_dict: The TypeDefaultBounds of every argument.
+    :param defaults_template: The validated defaults of every argument, if the results include the defaults, or None.
+    :param frozen: Flag indicating if the arguments are frozen, in which case the defaults_template is frozen too.
+    :return: The patched arguments, sharing every value outside the paths of the operations with args_dict.
+    :raises ValueError: If an operation is malformed, its path does not exist, or its value is out of bounds.
+    :raises TypeError: If a value is of the wrong type, or if a list or dictionary becomes empty.
+    """
+    if not isinstance(operations, list):
+        raise TypeError("The operations parameter should be a list of operations (operations: {})".format(operations))
+
+    patcher = _Patcher(dict(args_dict), type_default_bounds_dict, defaults_template, frozen)
+    for operation in operations:
+        patcher.apply(operation)
+
+    return patcher.finish()
@@ -0,0 +1,165 @@
+"""
+Implements the PathView class, a read-only view of validated arguments with a flat index from paths to values, for
+code which reads nested values many times, e.g. "routing.eu.weights" from a Dict[str, Dict[str, ...]] argument.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Tuple, Union, Iterator, Callable
+
+from . import type_defaults
+
+_MISSING = object()
+#: the type of paths: a dotted string, e.g. "routing.eu", or a tuple of names, e.g. ("routing", "eu")
+Path = Union[str, Tuple[str, ...]]
+
+
+def _to_tuple(path: Path) -> Tuple[str, ...]:
+    if isinstance(path, str):
+        return tuple(path.split("."))
+    if isinstance(path, tuple) and len(path) > 0 and all(isinstance(name, str) for name in path):
+        return path
+
+    raise TypeError("The path should be a dotted string or a non-empty tuple of strings (path: {})".format(path))
+
+
+class PathView(object):
+    """
+    A read-only view of validated arguments, indexing every argument and every value nested in dictionaries by its path,
+    so each read is a single dictionary lookup however deep the value is.
+    Lists are not descended into: a list is the value of its path. Arguments missing from the result are included with
+    their default values. Dictionary keys containing dots can only be read with tuple paths.
+
+    The values are shared with the result, so they must not be modified.
+    """
+    def __init__(self, args_dict: Mapping, type_default_bounds_dict: Dict[str, type_defaults.TypeDefaultBounds],
+                 defaults_dict: Mapping[str, Any]):
+        """
+        Instances should be created with ConfigArgs.create_path_view.
+
+        :param args_dict: The validated arguments, mapping argument name to value.
+        :param type_default_bounds_dict: The TypeDefaultBounds of every argument, used to check paths against the
+                                         schema.
+        :param defaults_dict: The validated default of every argument with a default, mapping argument name to value,
+                              included for the arguments missing from args_dict.
+        """
+        self._type_default_bounds_dict = type_default_bounds_dict
+        self._index = {}
+
+        for arg_name in type_default_bounds_dict:
+            if arg_name in args_dict:
+                self._add((arg_name,), args_dict[arg_name])
+            elif arg_name in defaults_dict:
+                self._add((arg_name,), defaults_dict[arg_name])
+
+    def _add(self, path: Tuple[str, ...], value: Any):
+        # Iterative, so deeply nested dictionaries cannot exceed the recursion limit
+        stack = [(path, value)]
+        while stack:
+            path, value = stack.pop()
+            self._index[path] = value
+            if isinstance(value, Mapping):
+                stack.extend((path + (key,), el) for key, el in value.items())
+
+    def check_path(self, path: Path) -> type:
+        """
+        Checks that a path is allowed by the schema: it must start with an argument name and may only continue while
+        the values are dictionaries. The path does not need to exist in this particular result.
+
+        :param path: A dotted string or a tuple of names.
+        :return: The type of the values at the path.
+        :raises KeyError: If the path starts with an unknown argument or continues past a non-dictionary type.
+        """
+        path = _to_tuple(path)
+        if path[0] not in self._type_default_bounds_dict:
+            raise KeyError("Unknown argument {} in path {}".format(path[0], path))
+
+        type_ = self._type_default_bounds_dict[path[0]].type_
+        for depth in range(1, len(path)):
+            if getattr(type_, "__origin__", None) not in [dict, Dict]:
+                raise KeyError("The path {} continues past {}, which is of type {} and not a dictionary".format(
+                    path, ".".join(path[:depth]), type_))
+            type_ = type_.__args__[1]
+
+        return type_
+
+    def getter(self, path: Path) -> Callable[[], Any]:
+        """
+        Checks a path against the schema once, and returns a function which reads its value, for hot paths.
+
+        :param path: A dotted string or a tuple of names.
+        :return: A function without parameters returning the value at the path (raising KeyError if it is missing).
+        :raises KeyError: If the path is not allowed by the schema.
+        """
+        self.check_path(path)
+        key = _to_tuple(path)
+        index = self._index
+        return lambda: index[key]
+
+    def get(self, path: Path, default: Any = None) -> Any:
+        """
+        :param path: A dotted string or a tuple of names.
+        :param default: The value to return if the path does not exist.
+        :return: The value at the path, or the default.
+        """
+        return self._index.get(_to_tuple(path), default)
+
+    def __getitem__(self, path: Path) -> Any:
+        return self._index[_to_tuple(path)]
+
+    def __contains__(self, path: Any) -> bool:
+        try:
+            return _to_tuple(path) in self._index
+        except TypeError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def iter_prefix(self, prefix: Path) -> Iterator[Tuple[Tuple[str, ...], Any]]:
+        """
+        Iterates over the leaves (the values which are not dictionaries) at or below a path, in the order of the
+        dictionaries.
+
+        :param prefix: A dotted string or a tuple of names.
+        :return: An iterator of (path, value) tuples, with tuple paths.
+        :raises KeyError: If the prefix does not exist.
+        """
+        prefix = _to_tuple(prefix)
+        stack = [(prefix, self._index[prefix])]
+        while stack:
+            path, value = stack.pop()
+            if isinstance(value, Mapping):
+                stack.extend(reversed([(path + (key,), el) for key, el in value.items()]))
+            else:
+                yield path, value
+
+    @property
+    def attrs(self) -> "_PathNode":
+        """
+        An attribute-style accessor, e.g. view.attrs.routing.eu.weights. Dictionaries are returned as accessors of
+        their values, and other values as they are.
+        """
+        return _PathNode(self._index, ())
+
+
+class _PathNode(object):
+    __slots__ = ("_index", "_path")
+
+    def __init__(self, index: Dict[Tuple[str, ...], Any], path: Tuple[str, ...]):
+        self._index = index
+        self._path = path
+
+    def __getattr__(self, name: str) -> Any:
+        path = self._path + (name,)
+        value = self._index.get(path, _MISSING)
+        if value is _MISSING:
+            raise AttributeError("No value at path {}".format(".".join(path)))
+
+        return _PathNode(self._index, path) if isinstance(value, Mapping) else value
+
+    def __dir__(self):
+        value = self._index[self._path] if self._path else {path[0]: None for path in self._index}
+        return list(value)
+
+    def __repr__(self):
+        return "<PathNode {}>".format(".".join(self._path))
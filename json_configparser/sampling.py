@@ -0,0 +1,130 @@
+"""
+The sampling module implements the SamplingPolicy class, which represents how large lists and dictionaries of trusted
+configurations are sampled instead of fully validated, and the Sampler class, which selects the sampled elements and
+records what was sampled.
+"""
+
+import random
+from typing import NamedTuple, Union, List
+
+from . import frozen_dict
+
+
+class SampledContainer(NamedTuple):
+    """
+    NamedTuple representing a list or dictionary of which only a sample of elements was validated.
+    """
+    #: the name of the container, as used in error messages (e.g. "element of a1 list" for nested containers)
+    name: str
+    #: the number of elements of the container
+    length: int
+    #: the number of validated elements
+    checked: int
+
+
+class SamplingReport(NamedTuple):
+    """
+    NamedTuple representing what was sampled while validating a configuration.
+    """
+    #: the policy used to sample
+    policy: "SamplingPolicy"
+    #: the sampled containers, in validation order
+    containers: List[SampledContainer]
+
+    @property
+    def fully_validated(self) -> bool:
+        """
+        Flag indicating if every element was validated, i.e. if no container was large enough to be sampled.
+        """
+        return len(self.containers) == 0
+
+
+class SamplingPolicy(frozen_dict.ReadOnlyObject):
+    """
+    Represents how the elements of large lists and dictionaries are sampled.
+    Containers with at least min_size elements only have sample_size of their elements validated: always the first and
+    the last, plus evenly spaced elements (a stride) or, if a seed is given, a seeded random subset. The sample is
+    deterministic: the same configuration and policy always validate the same elements.
+    """
+    def __init__(self, min_size: int = 10000, sample_size: int = 1000, seed: Union[int, None] = None):
+        """
+        :param min_size: The number of elements from which a container is sampled.
+        :param sample_size: The number of elements validated in a sampled container.
+        :param seed: The seed of the random subset, or None to use a stride.
+        """
+        self._validate_init_args(min_size, sample_size, seed)
+
+        self.min_size = min_size
+        self.sample_size = sample_size
+        self.seed = seed
+        self._seal()
+
+    @staticmethod
+    def _validate_init_args(min_size: int, sample_size: int, seed: Union[int, None]):
+        for name, value in [("min_size", min_size), ("sample_size", sample_size)]:
+            if type(value) is not int:
+                raise TypeError("The {name} parameter should be an integer "
+                                "({name}: {value})".format(name=name, value=value))
+
+        if sample_size < 2:
+            raise ValueError("The sample_size parameter should be at least 2, to include the first and last elements "
+                             "(sample_size: {})".format(sample_size))
+        if min_size <= sample_size:
+            raise ValueError("The min_size parameter should be greater than the sample_size parameter "
+                             "(min_size: {}, sample_size: {})".format(min_size, sample_size))
+
+        if seed is not None and type(seed) is not int:
+            raise TypeError("The seed parameter should be an integer or None (seed: {})".format(seed))
+
+    def start(self) -> "Sampler":
+        """
+        Starts sampling a single configuration.
+
+        :return: A new Sampler instance.
+        """
+        return Sampler(self)
+
+    def __str__(self):
+        return "SamplingPolicy(min_size={}, sample_size={}, seed={})".format(self.min_size, self.sample_size,
+                                                                             self.seed)
+
+
+class Sampler(object):
+    """
+    Selects the elements to validate in the containers of a single configuration, and records the sampled containers.
+    Containers must be sampled in a deterministic order, which the validation of a configuration guarantees.
+    """
+    def __init__(self, policy: SamplingPolicy):
+        """
+        :param policy: The SamplingPolicy to apply.
+        """
+        self.policy = policy
+        self.containers = []
+        self._random = None if policy.seed is None else random.Random(policy.seed)
+
+    def sample_indexes(self, name: str, length: int) -> Union[List[int], None]:
+        """
+        Selects the elements of a container to validate.
+
+        :param name: The name of the container, for the report.
+        :param length: The number of elements of the container.
+        :return: The sorted indexes of the elements to validate, or None if the container is fully validated.
+        """
+        if length < self.policy.min_size:
+            return None
+
+        sample_size = self.policy.sample_size
+        if self._random is None:
+            step = (length - 1) / (sample_size - 1)
+            indexes = [int(round(i * step)) for i in range(sample_size)]
+        else:
+            indexes = [0] + sorted(self._random.sample(range(1, length - 1), sample_size - 2)) + [length - 1]
+
+        self.containers.append(SampledContainer(name, length, len(indexes)))
+        return indexes
+
+    def report(self) -> SamplingReport:
+        """
+        :return: The SamplingReport of the containers sampled so far.
+        """
+        return SamplingReport(self.policy, list(self.containers))
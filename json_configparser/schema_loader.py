@@ -0,0 +1,37 @@
+"""
+Implements the loading of schemas given as "module:attribute" by the command line tools, such as the daemon and
+memory_report modules. The attribute is either an options class or a ConfigArgs instance (e.g. with bounds and extra
+validations).
+"""
+
+import importlib
+
+from . import config_args
+
+
+def load_schema(schema: str) -> config_args.ConfigArgs:
+    """
+    Loads a schema given as "module:attribute", where the attribute may be dotted (e.g. "module:Class.attribute").
+
+    :param schema: The schema specification.
+    :return: The ConfigArgs instance of the attribute, or a new one if the attribute is an options class.
+    :raises ValueError: If the schema is not of the form "module:attribute".
+    :raises TypeError: If the attribute is neither an options class nor a ConfigArgs instance.
+    :raises ImportError: If the module cannot be imported.
+    :raises AttributeError: If the attribute does not exist.
+    """
+    module_name, _, attr_path = schema.partition(":")
+    if not module_name or not attr_path:
+        raise ValueError("The schema should be of the form module:attribute (schema: {})".format(schema))
+
+    obj = importlib.import_module(module_name)
+    for attr_name in attr_path.split("."):
+        obj = getattr(obj, attr_name)
+
+    if isinstance(obj, config_args.ConfigArgs):
+        return obj
+    if isinstance(obj, type) and hasattr(obj, "_fields"):
+        return config_args.ConfigArgs(obj)
+
+    raise TypeError("The schema should be an options class or a ConfigArgs instance "
+                    "(schema: {}, type: {})".format(schema, type(obj)))
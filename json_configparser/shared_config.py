@@ -0,0 +1,285 @@
+"""
+Implements the SharedConfig class, which publishes a validated configuration into shared memory so that several
+processes (e.g. forked workers) can read it without parsing or validating the JSON file again.
+"""
+
+import array
+import json
+import os
+import struct
+import sys
+import types
+import weakref
+from typing import Dict, Any, List, Mapping
+
+from . import writer
+from .frozen_dict import FrozenDict
+
+try:
+    from multiprocessing import shared_memory
+    from multiprocessing import resource_tracker
+except ImportError:  # Python < 3.8
+    shared_memory = None
+    resource_tracker = None
+
+_MAGIC = b"JSONCFG2"
+# magic, length of the JSON index
+_HEADER = struct.Struct("<8sQ")
+_ALIGNMENT = 8
+# The typecodes of the buffers, for floats and ints
+_TYPECODES = ("d", "q")
+# The tags of the nodes of the index, which are the only JSON arrays it contains: [tag, payload]
+_BUFFER, _LIST, _DICT = "b", "l", "d"
+# Names of the blocks published by this process, which must stay registered with its resource tracker
+_published_names = set()
+
+
+class SharedConfig(object):
+    """
+    Represents a validated configuration stored in a shared memory block.
+
+    The parent process creates the block with publish and the workers attach to it by name with attach.
+    Lists of integers or floats, at any depth, are stored as raw native buffers and exposed to every process as
+    read-only memoryviews, without copying. All other values (strings, booleans, single numbers, and the structure of
+    nested lists and dicts) are stored in a JSON index, which is decoded once per process into immutable tuples and
+    FrozenDict instances, and never validated again: these values are copied into each process, so only the numeric
+    lists are shared. Enum members and column tables are stored as they are written by dump_json, i.e. as their values
+    and as lists of rows. The index is never unpickled, so attaching to a block written by another user cannot run code.
+
+    The process which published the configuration owns the block: the block is unlinked when that instance is closed,
+    garbage collected, or when the owning process exits. Forked children never unlink the block of their parent.
+    """
+    def __init__(self, shm, owner: bool):
+        """
+        Instances should be created with the publish and attach class methods.
+
+        :param shm: The SharedMemory instance holding the configuration.
+        :param owner: Flag indicating if this instance is responsible for unlinking the shared memory block.
+        """
+        self._shm = shm
+        self._args = None
+        self._finalizer = weakref.finalize(self, _release, shm, os.getpid() if owner else None)
+
+    @classmethod
+    def publish(cls, args_dict: Dict[str, Any], name: str = None) -> "SharedConfig":
+        """
+        Publishes a validated configuration into a new shared memory block.
+
+        :param args_dict: A dictionary mapping argument name to value, e.g. the result of ConfigArgs.parse_json.
+        :param name: Optional name for the shared memory block. A unique name is generated if not given.
+        :return: The owning SharedConfig instance.
+        :raises RuntimeError: If shared memory is not supported by the running Python version.
+        :raises TypeError: If args_dict is not a dictionary, or if a value cannot be written as JSON.
+        """
+        _check_shared_memory_support()
+        if not isinstance(args_dict, Mapping):
+            raise TypeError("The args_dict parameter should be a dictionary mapping argument name to value "
+                            "(args_dict: {})".format(args_dict))
+
+        buffers = []
+        values = {arg_name: _extract_buffers(arg_value, buffers) for arg_name, arg_value in args_dict.items()}
+
+        buffer_index = []
+        offset = 0
+        for buffer in buffers:
+            buffer_index.append((offset, len(buffer), buffer.typecode))
+            offset += _aligned(len(buffer) * buffer.itemsize)
+        index = json.dumps({"values": values, "buffers": buffer_index}, separators=(",", ":")).encode("utf-8")
+        data_start = _aligned(_HEADER.size + len(index))
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(data_start + offset, 1))
+        try:
+            _HEADER.pack_into(shm.buf, 0, _MAGIC, len(index))
+            shm.buf[_HEADER.size:_HEADER.size + len(index)] = index
+            for (buffer_offset, _, _), buffer in zip(buffer_index, buffers):
+                start = data_start + buffer_offset
+                raw = memoryview(buffer).cast("B")
+                shm.buf[start:start + len(raw)] = raw
+                raw.release()
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+        _published_names.add(shm.name)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedConfig":
+        """
+        Attaches to a configuration previously published by another process.
+
+        :param name: The name of the shared memory block.
+        :return: A non-owning SharedConfig instance.
+        :raises RuntimeError: If shared memory is not supported by the running Python version.
+        :raises ValueError: If the shared memory block does not hold a published configuration.
+        """
+        _check_shared_memory_support()
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            if shm.name not in _published_names:
+                # Attaching registers the block with the resource tracker of this process, which would unlink it on exit
+                resource_tracker.unregister(shm._name, "shared_memory")
+
+        magic, _ = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC:
+            shm.close()
+            raise ValueError("The shared memory block does not hold a published configuration (name: {})".format(name))
+
+        return cls(shm, owner=False)
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the shared memory block, which workers should pass to attach.
+        """
+        return self._shm.name
+
+    @property
+    def args(self) -> Mapping[str, Any]:
+        """
+        A read-only mapping from argument name to value.
+        Lists of integers or floats are read-only memoryviews over the shared memory block, other lists are tuples and
+        dicts are FrozenDict instances.
+        """
+        if self._args is None:
+            buf = self._shm.buf
+            _, index_length = _HEADER.unpack_from(buf, 0)
+            data_start = _aligned(_HEADER.size + index_length)
+            try:
+                index = json.loads(bytes(buf[_HEADER.size:_HEADER.size + index_length]).decode("utf-8"))
+                values, buffer_index = index["values"], index["buffers"]
+                if not isinstance(values, dict) or not isinstance(buffer_index, list):
+                    raise ValueError("Unexpected index")
+
+                views = []
+                for buffer_offset, length, typecode in buffer_index:
+                    if typecode not in _TYPECODES or not _is_size(buffer_offset) or not _is_size(length):
+                        raise ValueError("Unexpected buffer")
+                    start = data_start + buffer_offset
+                    end = start + length * array.array(typecode).itemsize
+                    if end > len(buf):
+                        raise ValueError("Buffer out of the block")
+                    views.append(buf[start:end].toreadonly().cast(typecode))
+
+                self._args = types.MappingProxyType({arg_name: _restore_buffers(arg_value, views)
+                                                     for arg_name, arg_value in values.items()})
+            except (ValueError, TypeError, KeyError, IndexError) as e:
+                raise ValueError("The shared memory block holds a malformed configuration "
+                                 "(name: {}, error: {})".format(self.name, e))
+
+        return self._args
+
+    def close(self):
+        """
+        Releases this process' mapping of the shared memory block and, if this instance is the owner, unlinks it.
+        Views previously returned by args must not be used afterwards.
+        """
+        self._args = None
+        self._finalizer()
+
+    def __enter__(self) -> "SharedConfig":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _release(shm, owner_pid):
+    try:
+        shm.close()
+    except BufferError:
+        # Views over the block are still alive, the mapping is released when they are
+        pass
+    if owner_pid is not None and owner_pid == os.getpid():
+        _published_names.discard(shm.name)
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _check_shared_memory_support():
+    if shared_memory is None:
+        raise RuntimeError("SharedConfig requires multiprocessing.shared_memory (Python 3.8 or newer)")
+
+
+def _aligned(size: int) -> int:
+    return (size + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _to_buffer(arg_value: Any):
+    """
+    Converts a non-empty flat list or tuple of integers (excluding booleans) or floats to an array, if possible.
+
+    :param arg_value: The value of the argument.
+    :return: An array.array instance or None if the value cannot be stored as a raw buffer.
+    """
+    if not isinstance(arg_value, (list, tuple)) or len(arg_value) == 0:
+        return None
+
+    if all(type(el) is float for el in arg_value):
+        return array.array("d", arg_value)
+
+    if all(type(el) is int for el in arg_value):
+        try:
+            return array.array("q", arg_value)
+        except OverflowError:
+            return None
+
+    return None
+
+
+def _is_size(value: Any) -> bool:
+    return type(value) is int and value >= 0
+
+
+def _extract_buffers(value: Any, buffers: List[array.array]) -> Any:
+    """
+    Converts a value to the nodes of the JSON index: lists of integers or floats are replaced by buffer nodes and
+    appended to buffers, and other lists, tuples, and mappings become list and dict nodes. Values which are not JSON
+    values are converted as by dump_json.
+
+    :param value: The value of an argument.
+    :param buffers: The arrays of the lists already replaced, to which the new arrays are appended.
+    :return: The node to write in the index.
+    :raises TypeError: If a value cannot be written as JSON.
+    """
+    buffer = _to_buffer(value)
+    if buffer is not None:
+        buffers.append(buffer)
+        return [_BUFFER, len(buffers) - 1]
+
+    if isinstance(value, (list, tuple)):
+        return [_LIST, [_extract_buffers(el, buffers) for el in value]]
+    if isinstance(value, Mapping):
+        return [_DICT, {key: _extract_buffers(el, buffers) for key, el in value.items()}]
+    if value is None or type(value) in (bool, int, float, str):
+        return value
+    return _extract_buffers(writer._encode_default(value), buffers)
+
+
+def _restore_buffers(value: Any, views: List[memoryview]) -> Any:
+    """
+    Replaces the buffer nodes of a value decoded from the index by their memoryviews, and the list and dict nodes by
+    tuples and FrozenDict instances.
+
+    :param value: The decoded node of an argument.
+    :param views: The memoryview of each buffer.
+    :return: The read-only value.
+    :raises ValueError: If the node is malformed.
+    """
+    if not isinstance(value, list):
+        return value
+
+    tag, payload = value
+    if tag == _BUFFER and _is_size(payload):
+        return views[payload]
+    if tag == _LIST and isinstance(payload, list):
+        return tuple(_restore_buffers(el, views) for el in payload)
+    if tag == _DICT and isinstance(payload, dict):
+        return FrozenDict((key, _restore_buffers(el, views)) for key, el in payload.items())
+
+    raise ValueError("Unexpected node {}".format(value))
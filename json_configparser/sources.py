@@ -0,0 +1,239 @@
+"""
+Implements the configuration sources which ConfigArgs.parse_source can read from: a local file, a directory of JSON
+fragments, a member of a zip archive, and an HTTP URL.
+
+Every source reports a version token together with its content, so unchanged configurations are neither read again
+nor validated again. The HTTP source uses conditional requests and pooled keep-alive connections for this purpose.
+
+The http.client, urllib.parse, and zipfile modules are only imported by the sources which use them, so importing the
+package does not pay for them.
+"""
+
+import abc
+import fnmatch
+import os
+import threading
+from typing import NamedTuple, List, Any, Union, Dict, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import http.client
+
+
+class FetchResult(NamedTuple):
+    """
+    NamedTuple representing the content fetched from a configuration source.
+    """
+    #: an opaque token identifying this version of the content
+    version: Any
+    #: the JSON documents to merge into a single configuration, in order
+    documents: List[bytes]
+
+
+class ConfigSource(abc.ABC):
+    """
+    Base class of all configuration sources.
+    """
+    @abc.abstractmethod
+    def fetch(self, known_version: Any = None) -> Union[FetchResult, None]:
+        """
+        Fetches the content of the source, unless it is still at the known version.
+
+        :param known_version: The version of the last content fetched by the caller, or None.
+        :return: A FetchResult, or None if the content did not change since known_version.
+        :raises OSError: If the content cannot be fetched.
+        """
+
+
+class FileSource(ConfigSource):
+    """
+    A single local JSON file. The version is given by the modification time, size, and inode of the file, so unchanged
+    files are never read again.
+    """
+    def __init__(self, path: str):
+        """
+        :param path: Path to the JSON file.
+        """
+        self.path = path
+
+    def fetch(self, known_version: Any = None) -> Union[FetchResult, None]:
+        stat = os.stat(self.path)
+        version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if version == known_version:
+            return None
+
+        with open(self.path, "rb") as f:
+            return FetchResult(version, [f.read()])
+
+
+class DirectorySource(ConfigSource):
+    """
+    A directory of JSON fragments, each holding an object with some of the arguments. The fragments are merged in
+    file name order and an argument may only be defined in one of them.
+    """
+    def __init__(self, path: str, pattern: str = "*.json"):
+        """
+        :param path: Path to the directory.
+        :param pattern: The glob-style pattern of the fragment file names.
+        """
+        self.path = path
+        self.pattern = pattern
+
+    def fetch(self, known_version: Any = None) -> Union[FetchResult, None]:
+        file_names = sorted(name for name in os.listdir(self.path) if fnmatch.fnmatch(name, self.pattern))
+        paths = [os.path.join(self.path, name) for name in file_names]
+
+        version = []
+        for name, path in zip(file_names, paths):
+            stat = os.stat(path)
+            version.append((name, stat.st_mtime_ns, stat.st_size, stat.st_ino))
+        version = tuple(version)
+        if version == known_version:
+            return None
+
+        documents = []
+        for path in paths:
+            with open(path, "rb") as f:
+                documents.append(f.read())
+
+        return FetchResult(version, documents)
+
+
+class ZipMemberSource(ConfigSource):
+    """
+    A JSON file stored in a zip archive. The version is given by the CRC and size of the member, so the member is only
+    decompressed when its content changed, even if the archive itself was rewritten.
+    """
+    def __init__(self, zip_path: str, member: str):
+        """
+        :param zip_path: Path to the zip archive.
+        :param member: Name of the JSON file inside the archive.
+        """
+        self.zip_path = zip_path
+        self.member = member
+
+    def fetch(self, known_version: Any = None) -> Union[FetchResult, None]:
+        import zipfile
+
+        with zipfile.ZipFile(self.zip_path) as zip_file:
+            info = zip_file.getinfo(self.member)
+            version = (info.CRC, info.file_size)
+            if version == known_version:
+                return None
+
+            return FetchResult(version, [zip_file.read(info)])
+
+
+class _ConnectionPool(object):
+    """
+    Thread-safe pool of idle keep-alive HTTP connections, shared by all HttpSource instances.
+    """
+    def __init__(self, max_idle_per_host: int = 4):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, scheme: str, netloc: str, timeout: float) -> "http.client.HTTPConnection":
+        import http.client
+
+        with self._lock:
+            idle = self._idle.get((scheme, netloc), None)
+            if idle:
+                return idle.pop()
+
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=timeout)
+        return http.client.HTTPConnection(netloc, timeout=timeout)
+
+    def release(self, scheme: str, netloc: str, connection: "http.client.HTTPConnection"):
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+
+        connection.close()
+
+    def clear(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+_connection_pool = _ConnectionPool()
+
+
+class HttpSource(ConfigSource):
+    """
+    A JSON document served over HTTP(S).
+    Requests are conditional (If-None-Match and If-Modified-Since), so an unchanged document is neither downloaded nor
+    validated again, and connections are kept alive and reused across all HttpSource instances of the same host.
+    """
+    def __init__(self, url: str, timeout: float = 10.0, headers: Union[Dict[str, str], None] = None):
+        """
+        :param url: The http or https URL of the JSON document.
+        :param timeout: The timeout of each request, in seconds.
+        :param headers: Extra headers to send with each request, e.g. for authentication.
+        """
+        import urllib.parse
+
+        parsed_url = urllib.parse.urlsplit(url)
+        if parsed_url.scheme not in ["http", "https"] or not parsed_url.netloc:
+            raise ValueError("The url parameter should be an http or https URL (url: {})".format(url))
+
+        self.url = url
+        self.timeout = timeout
+        self.headers = dict(headers) if headers is not None else {}
+
+        self._scheme = parsed_url.scheme
+        self._netloc = parsed_url.netloc
+        self._target = urllib.parse.urlunsplit(("", "", parsed_url.path or "/", parsed_url.query, ""))
+
+    def fetch(self, known_version: Any = None) -> Union[FetchResult, None]:
+        headers = dict(self.headers)
+        if known_version is not None:
+            etag, last_modified = known_version
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+
+        status, response_headers, body = self._request(headers)
+
+        if status == 304:
+            return None
+        if status != 200:
+            raise OSError("Could not fetch the configuration (url: {}, status: {})".format(self.url, status))
+
+        version = (response_headers.get("ETag", None), response_headers.get("Last-Modified", None))
+        if version == (None, None):
+            # Without validators every fetch is a new version
+            version = None
+
+        return FetchResult(version, [body])
+
+    def _request(self, headers: Dict[str, str]) -> Tuple[int, Any, bytes]:
+        import http.client
+
+        # A pooled connection may have been closed by the server, so retry once with a new connection
+        for attempt in range(2):
+            connection = _connection_pool.acquire(self._scheme, self._netloc, self.timeout)
+            released = False
+            try:
+                connection.request("GET", self._target, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+                if not response.will_close:
+                    _connection_pool.release(self._scheme, self._netloc, connection)
+                    released = True
+
+                return response.status, response.headers, body
+            except (http.client.HTTPException, ConnectionError):
+                if attempt == 1:
+                    raise
+            finally:
+                # Every other outcome, including timeouts and other errors, leaves the connection unusable
+                if not released:
+                    connection.close()
@@ -0,0 +1,119 @@
+"""
+The string_constraints module implements the StringConstraints class, which can be used to represent constraints on
+string arguments, on the string elements of lists/dictionaries, or on dictionary keys.
+"""
+
+import functools
+import re
+from typing import Union
+
+from . import frozen_dict
+
+#: the maximum number of compiled patterns shared between all StringConstraints instances
+PATTERN_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _compile_pattern(pattern: str):
+    return re.compile(pattern)
+
+
+class StringConstraints(frozen_dict.ReadOnlyObject):
+    """
+    Represents the constraints of a string argument.
+    A StringConstraints instance is defined by a regular expression pattern, minimum and maximum lengths, and a prefix.
+    The supported argument types are str, or lists/dictionaries of str. With keys=True the constraints apply to the keys
+    of the dictionaries of the argument instead, whatever the type of their values.
+    """
+    def __init__(self, arg_name: str, pattern: Union[str, None] = None, min_length: Union[int, None] = None,
+                 max_length: Union[int, None] = None, prefix: Union[str, None] = None, keys: bool = False):
+        """
+        At least one constraint must be provided.
+        Patterns are compiled once and shared between instances through a bounded cache.
+
+        :param arg_name: The name of the argument.
+        :param pattern: A regular expression which the whole string must match.
+        :param min_length: The minimum length of the string (inclusive).
+        :param max_length: The maximum length of the string (inclusive).
+        :param prefix: A prefix which the string must start with.
+        :param keys: Flag indicating if the constraints apply to dictionary keys instead of string values.
+        """
+        self._validate_init_args(arg_name, pattern, min_length, max_length, prefix, keys)
+
+        self.arg_name = arg_name
+        self.pattern = pattern
+        self.min_length = min_length
+        self.max_length = max_length
+        self.prefix = prefix
+        self.keys = keys
+
+        self._compiled_pattern = None if pattern is None else _compile_pattern(pattern)
+        self._seal()
+
+    @staticmethod
+    def _validate_init_args(arg_name: str, pattern: Union[str, None], min_length: Union[int, None],
+                            max_length: Union[int, None], prefix: Union[str, None], keys: bool):
+        if not isinstance(arg_name, str):
+            raise TypeError("The arg_name parameter should be a string "
+                            "(arg_name: {})".format(arg_name))
+        if len(arg_name.strip()) == 0:
+            raise ValueError("The arg_name parameter should be a non-empty string "
+                             "(arg_name: {})".format(arg_name))
+
+        if pattern is not None:
+            if not isinstance(pattern, str):
+                raise TypeError("The pattern parameter should be a string or None "
+                                "(pattern: {})".format(pattern))
+            try:
+                _compile_pattern(pattern)
+            except re.error as e:
+                raise ValueError("The pattern parameter should be a valid regular expression "
+                                 "(pattern: {}, error: {})".format(pattern, e))
+
+        for name, value in [("min_length", min_length), ("max_length", max_length)]:
+            if value is not None and type(value) is not int:
+                raise TypeError("The {name} parameter should be an integer or None "
+                                "({name}: {value})".format(name=name, value=value))
+            if value is not None and value < 0:
+                raise ValueError("The {name} parameter should be a non-negative integer "
+                                 "({name}: {value})".format(name=name, value=value))
+
+        if min_length is not None and max_length is not None and min_length > max_length:
+            raise ValueError("The min_length parameter should be less than or equal to the max_length parameter "
+                             "(min_length: {}, max_length: {})".format(min_length, max_length))
+
+        if prefix is not None and not isinstance(prefix, str):
+            raise TypeError("The prefix parameter should be a string or None "
+                            "(prefix: {})".format(prefix))
+
+        if not isinstance(keys, bool):
+            raise TypeError("The keys parameter should be a boolean value "
+                            "(keys: {})".format(keys))
+
+        if pattern is None and min_length is None and max_length is None and prefix is None:
+            raise ValueError("At least one of the pattern, min_length, max_length, or prefix parameters should be "
+                             "given (arg_name: {})".format(arg_name))
+
+    def validate_value(self, arg_value: str):
+        """
+        Validates a string against the constraints.
+
+        :param arg_value: The string to validate.
+        :raises ValueError: If the string does not satisfy the constraints.
+        """
+        if self.min_length is not None and len(arg_value) < self.min_length:
+            raise ValueError("The {name} argument should have at least {length} characters "
+                             "({name}: {value})".format(name=self.arg_name, length=self.min_length, value=arg_value))
+        if self.max_length is not None and len(arg_value) > self.max_length:
+            raise ValueError("The {name} argument should have at most {length} characters "
+                             "({name}: {value})".format(name=self.arg_name, length=self.max_length, value=arg_value))
+        if self.prefix is not None and not arg_value.startswith(self.prefix):
+            raise ValueError("The {name} argument should start with {prefix} "
+                             "({name}: {value})".format(name=self.arg_name, prefix=self.prefix, value=arg_value))
+        if self._compiled_pattern is not None and self._compiled_pattern.fullmatch(arg_value) is None:
+            raise ValueError("The {name} argument should match the pattern {pattern} "
+                             "({name}: {value})".format(name=self.arg_name, pattern=self.pattern, value=arg_value))
+
+    def __str__(self):
+        return "StringConstraints(pattern={}, min_length={}, max_length={}, prefix={}, keys={})".format(
+            self.pattern, self.min_length, self.max_length, self.prefix, self.keys)
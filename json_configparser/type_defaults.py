@@ -4,6 +4,8 @@ Implements the TypeDefaultBounds NamedTuple, which holds information about an ar
 
 from typing import NamedTuple, Any
 from . import bounds
+from . import collection_constraints
+from . import string_constraints
 
 
 class TypeDefaultBounds(NamedTuple):
@@ -20,3 +22,11 @@ class TypeDefaultBounds(NamedTuple):
     default_value: Any = None
     #: an instance of the Bound class, representing the bounds of the argument
     bound_obj: bounds.Bounds = None
+    #: an instance of the StringConstraints class, representing the constraints of the string values of the argument
+    str_constraints_obj: string_constraints.StringConstraints = None
+    #: an instance of the StringConstraints class, representing the constraints of the dictionary keys of the argument
+    key_constraints_obj: string_constraints.StringConstraints = None
+    #: an instance of the CollectionConstraints class, representing the constraints of the list/dict argument itself
+    collection_constraints_obj: collection_constraints.CollectionConstraints = None
+    #: flag to indicate if the argument, a List[Dict[str, X]], is validated into a columnar ColumnTable
+    columnar: bool = False
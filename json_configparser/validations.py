@@ -2,20 +2,95 @@
 This module implements the type and bound validation of all supported types.
 """
 
-from typing import Any, List, Dict
+import enum
+import typing
+from collections.abc import Mapping
+from typing import Any, List, Dict, Union
 
+from . import columnar
+from . import limits
+from . import sampling
 from . import type_defaults
 
+# typing.Literal is only available from Python 3.8
+_Literal = getattr(typing, "Literal", None)
+_SCALAR_TYPES = (bool, int, float, str)
+# Maps id(type_) to the type and to the index of the allowed values of a Literal or Enum type. Items are read and added
+# one at a time without locks, and threads which race on a new type build the same index
+_choice_indexes = {}
+_MISSING = object()
 
-def validate_argument(arg_value: Any, arg_type_defaults: type_defaults.TypeDefaultBounds) -> Any:
+
+def is_choice_type(type_: Any) -> bool:
+    """
+    Checks if a type restricts values to a fixed set of choices, i.e. if it is a Literal or an Enum subclass.
+
+    :param type_: The type to check.
+    :return: Boolean value indicating if the type is a Literal or an Enum subclass.
+    """
+    if _Literal is not None and getattr(type_, "__origin__", None) is _Literal:
+        return True
+    return isinstance(type_, type) and issubclass(type_, enum.Enum)
+
+
+def choice_index(type_: Any) -> Dict[tuple, Any]:
+    """
+    Returns the index of the allowed values of a Literal or Enum type, building it the first time the type is seen.
+    The index maps the keys of _choice_key, so that e.g. True and 1 are different choices while 1 and 1.0 are the same,
+    to the validated value: the value itself for Literals and the member for Enums.
+
+    :param type_: A Literal or Enum type.
+    :return: The index of the allowed values.
+    :raises TypeError: If an allowed value is not a bool, int, float, or str.
+    """
+    cached = _choice_indexes.get(id(type_), None)
+    if cached is not None and cached[0] is type_:
+        return cached[1]
+
+    if isinstance(type_, type) and issubclass(type_, enum.Enum):
+        choices = [(member.value, member) for member in type_]
+    else:
+        choices = [(value, value) for value in type_.__args__]
+
+    index = {}
+    for value, validated_value in choices:
+        if type(value) not in _SCALAR_TYPES:
+            raise TypeError("The allowed values of {} should be bools, ints, floats, or strs "
+                            "(value: {})".format(type_, value))
+        index.setdefault(_choice_key(value), validated_value)
+
+    # Keeping a reference to the type guarantees its id is never reused by another type
+    _choice_indexes[id(type_)] = (type_, index)
+    return index
+
+
+def _choice_key(value: Any) -> tuple:
+    """
+    Returns the key of a bool, int, float, or str value in the index of allowed values.
+    As for int and float arguments, ints and floats are the same choice when they are equal (e.g. 10 and 10.0), while
+    bools are distinct from the numbers.
+    """
+    return (float if type(value) is int else type(value), value)
+
+
+def validate_argument(arg_value: Any, arg_type_defaults: type_defaults.TypeDefaultBounds,
+                      tracker: Union[limits.LimitsTracker, None] = None,
+                      sampler: Union[sampling.Sampler, None] = None) -> Any:
     """
     Given a value and type/bounds, this function checks if the type is supported.
     If so, then check if the value is of the correct type and if it is within the defined bounds.
-    For Lists and Dictionaries these checks are applied to all elements.
+    For Lists and Dictionaries these checks are applied to all elements. Lists and Dictionaries are returned as they
+    are unless an element was converted (e.g. 10.0 for an int), in which case only the containers holding converted
+    elements are copied.
 
     :param arg_value: The value of the argument to check.
     :param arg_type_defaults: An instance of TypeDefaultBounds, specifying the type and bounds of the argument to check.
-    :raises ValueError: If the argument is an empty string.
+    :param tracker: An optional LimitsTracker, which accounts for every list and dictionary before it is validated.
+    :param sampler: An optional Sampler. Only the sampled elements of large lists and dictionaries are validated, the
+                    other elements are kept as they are. Collection constraints on the elements only see the sample.
+    :raises ValueError: If the argument is an empty string, or out of its bounds, string constraints, or collection
+                        constraints.
+    :raises LimitExceededError: If the argument exceeds one of the limits of the tracker.
     :raises TypeError: If the argument value is not of the expected type.
     """
     if arg_type_defaults.type_ == bool:
@@ -27,6 +102,8 @@ def validate_argument(arg_value: Any, arg_type_defaults: type_defaults.TypeDefau
         if not isinstance(arg_value, str):
             raise TypeError("The {name} argument should be a string "
                             "({name}: {value})".format(name=arg_type_defaults.arg_name, value=arg_value))
+        if arg_type_defaults.str_constraints_obj is not None:
+            arg_type_defaults.str_constraints_obj.validate_value(arg_value)
 
     elif arg_type_defaults.type_ == int or arg_type_defaults.type_ == float:
         if not isinstance(arg_value, arg_type_defaults.type_):
@@ -45,15 +122,18 @@ def validate_argument(arg_value: Any, arg_type_defaults: type_defaults.TypeDefau
         if arg_type_defaults.bound_obj is not None:
             arg_type_defaults.bound_obj.validate_value(arg_value)
 
+    elif is_choice_type(arg_type_defaults.type_):
+        return _validate_choice(arg_value, arg_type_defaults)
+
     # All other expected types (List[x] and Dict[x]) must have this attribute
     elif not hasattr(arg_type_defaults.type_, "__origin__"):
         raise TypeError("Unknown type {} for {} argument".format(arg_type_defaults.type_, arg_type_defaults.arg_name))
 
     elif arg_type_defaults.type_.__origin__ in [list, List]:
-        return _validate_list(arg_value, arg_type_defaults)
+        return _validate_list(arg_value, arg_type_defaults, tracker, sampler)
 
     elif arg_type_defaults.type_.__origin__ in [dict, Dict]:
-        return _validate_dict(arg_value, arg_type_defaults)
+        return _validate_dict(arg_value, arg_type_defaults, tracker, sampler)
 
     else:
         raise TypeError("Unknown type {} for argument {}".format(arg_type_defaults.type_, arg_type_defaults.arg_name))
@@ -61,17 +141,43 @@ def validate_argument(arg_value: Any, arg_type_defaults: type_defaults.TypeDefau
     return arg_value
 
 
-def _validate_list(arg_value: Any, arg_type_defaults: type_defaults.TypeDefaultBounds) -> Any:
-    if not isinstance(arg_value, list):
+def _validate_choice(arg_value: Any, arg_type_defaults: type_defaults.TypeDefaultBounds) -> Any:
+    type_ = arg_type_defaults.type_
+    # Enum members, e.g. from defaults or frozen results, are already valid
+    if isinstance(arg_value, enum.Enum) and isinstance(type_, type) and isinstance(arg_value, type_):
+        return arg_value
+
+    index = choice_index(type_)
+    validated_value = _MISSING
+    if type(arg_value) in _SCALAR_TYPES:
+        validated_value = index.get(_choice_key(arg_value), _MISSING)
+
+    if validated_value is _MISSING:
+        raise ValueError("The {name} argument should be one of the {count} allowed values of {type_} "
+                         "({name}: {value})".format(name=arg_type_defaults.arg_name, count=len(index),
+                                                    type_=type_.__name__ if isinstance(type_, type) else "the Literal",
+                                                    value=arg_value))
+
+    return validated_value
+
+
+def _validate_list(arg_value: Any, arg_type_defaults: type_defaults.TypeDefaultBounds,
+                   tracker: Union[limits.LimitsTracker, None] = None,
+                   sampler: Union[sampling.Sampler, None] = None) -> Any:
+    if arg_type_defaults.columnar:
+        return _validate_columns(arg_value, arg_type_defaults, tracker)
+
+    # Tuples are accepted so frozen results can be validated again
+    if not isinstance(arg_value, (list, tuple)):
         raise TypeError("The {name} argument should be a list "
                         "({name}: {value})".format(name=arg_type_defaults.arg_name, value=arg_value))
 
     # Get expected inner type of list
     inner_type = arg_type_defaults.type_.__args__[0]
-    if inner_type not in [int, float, str, bool] and \
+    if inner_type not in [int, float, str, bool] and not is_choice_type(inner_type) and \
             (not hasattr(inner_type, "__origin__") or inner_type.__origin__ not in [list, dict, List, Dict]):
-        raise TypeError("List arguments can only be List[int], List[float], List[str], List[bool], or a combination of "
-                        "List of Lists/Dicts with those types "
+        raise TypeError("List arguments can only be List[int], List[float], List[str], List[bool], List of a Literal "
+                        "or Enum, or a combination of List of Lists/Dicts with those types "
                         "({}: {})".format(arg_type_defaults.arg_name, arg_type_defaults.type_))
 
     # Validate each element recursively
@@ -81,16 +187,42 @@ def _validate_list(arg_value: Any, arg_type_defaults: type_defaults.TypeDefaultB
         raise TypeError("The {name} argument should be a list of {type_}, but it is an empty "
                         "list.".format(name=arg_type_defaults.arg_name, type_=inner_type))
 
-    new_lst = []
-    for el in arg_value:
-        el_type_defaults = type_defaults.TypeDefaultBounds(el_name, inner_type, bound_obj=arg_type_defaults.bound_obj)
-        new_lst.append(validate_argument(el, el_type_defaults))
+    if tracker is not None:
+        tracker.enter_container(len(arg_value))
+
+    check_el = None
+    if arg_type_defaults.collection_constraints_obj is not None:
+        arg_type_defaults.collection_constraints_obj.validate_length(len(arg_value))
+        check_el = arg_type_defaults.collection_constraints_obj.element_checker()
+
+    el_type_defaults = type_defaults.TypeDefaultBounds(el_name, inner_type, bound_obj=arg_type_defaults.bound_obj,
+                                                       str_constraints_obj=arg_type_defaults.str_constraints_obj,
+                                                       key_constraints_obj=arg_type_defaults.key_constraints_obj)
+
+    indexes = None if sampler is None else sampler.sample_indexes(arg_type_defaults.arg_name, len(arg_value))
+    new_lst = None
+    for i in range(len(arg_value)) if indexes is None else indexes:
+        el = arg_value[i]
+        new_el = validate_argument(el, el_type_defaults, tracker, sampler)
+        if check_el is not None:
+            check_el(new_el, new_el)
+        if new_el is not el:
+            # Only copy the list once an element was converted, sharing all unchanged elements
+            if new_lst is None:
+                new_lst = list(arg_value)
+            new_lst[i] = new_el
+
+    if tracker is not None:
+        tracker.exit_container()
 
-    return new_lst
+    return arg_value if new_lst is None else new_lst
 
 
-def _validate_dict(arg_value: Any, arg_type_defaults: type_defaults.TypeDefaultBounds) -> Any:
-    if not isinstance(arg_value, dict):
+def _validate_dict(arg_value: Any, arg_type_defaults: type_defaults.TypeDefaultBounds,
+                   tracker: Union[limits.LimitsTracker, None] = None,
+                   sampler: Union[sampling.Sampler, None] = None) -> Any:
+    # Read-only mappings are accepted so frozen results can be validated again
+    if not isinstance(arg_value, Mapping):
         raise TypeError("The {name} argument should be a dict "
                         "({name}: {value})".format(name=arg_type_defaults.arg_name, value=arg_value))
 
@@ -101,10 +233,10 @@ def _validate_dict(arg_value: Any, arg_type_defaults: type_defaults.TypeDefaultB
     # Get expected type of dictionary values
     inner_type = arg_type_defaults.type_.__args__[1]
 
-    if inner_type not in [int, float, str, bool] and \
+    if inner_type not in [int, float, str, bool] and not is_choice_type(inner_type) and \
             (not hasattr(inner_type, "__origin__") or inner_type.__origin__ not in [list, dict, List, Dict]):
         raise TypeError("Dict arguments can only be Dict[str, int], Dict[str, float], Dict[str, str], Dict[str, bool], "
-                        "or a combination of Dict of Lists/Dicts with those types "
+                        "Dict of a Literal or Enum, or a combination of Dict of Lists/Dicts with those types "
                         "({}: {})".format(arg_type_defaults.arg_name, arg_type_defaults.type_))
 
     # Validate keys and elements recursively
@@ -115,12 +247,139 @@ def _validate_dict(arg_value: Any, arg_type_defaults: type_defaults.TypeDefaultB
         raise TypeError("The {name} argument should be a dict of {type_}, but it is an empty "
                         "dict.".format(name=arg_type_defaults.arg_name, type_=inner_type))
 
-    new_dict = {}
-    for key in arg_value:
-        key_type_defaults = type_defaults.TypeDefaultBounds(key_name, str)
+    if tracker is not None:
+        tracker.enter_container(len(arg_value))
+
+    check_el = None
+    if arg_type_defaults.collection_constraints_obj is not None:
+        arg_type_defaults.collection_constraints_obj.validate_length(len(arg_value))
+        arg_type_defaults.collection_constraints_obj.validate_keys(arg_value.keys())
+        check_el = arg_type_defaults.collection_constraints_obj.element_checker()
+
+    key_type_defaults = type_defaults.TypeDefaultBounds(key_name, str,
+                                                        str_constraints_obj=arg_type_defaults.key_constraints_obj)
+
+    indexes = None if sampler is None else sampler.sample_indexes(arg_type_defaults.arg_name, len(arg_value))
+    if indexes is None:
+        keys = arg_value
+    else:
+        all_keys = list(arg_value)
+        keys = [all_keys[i] for i in indexes]
+
+    new_dict = None
+    for key in keys:
+        validate_argument(key, key_type_defaults)
         el_type_defaults = type_defaults.TypeDefaultBounds(el_name + key, inner_type,
-                                                           bound_obj=arg_type_defaults.bound_obj)
+                                                           bound_obj=arg_type_defaults.bound_obj,
+                                                           str_constraints_obj=arg_type_defaults.str_constraints_obj,
+                                                           key_constraints_obj=arg_type_defaults.key_constraints_obj)
+        value = arg_value[key]
+        new_value = validate_argument(value, el_type_defaults, tracker, sampler)
+        if check_el is not None:
+            check_el(key, new_value)
+        if new_value is not value:
+            # Only copy the dictionary once a value was converted, sharing all unchanged values
+            if new_dict is None:
+                new_dict = dict(arg_value)
+            new_dict[key] = new_value
+
+    if tracker is not None:
+        tracker.exit_container()
+
+    return arg_value if new_dict is None else new_dict
+
+
+def _validate_columns(arg_value: Any, arg_type_defaults: type_defaults.TypeDefaultBounds,
+                      tracker: Union[limits.LimitsTracker, None] = None) -> columnar.ColumnTable:
+    """
+    Validates a List[Dict[str, X]] argument column by column, returning a ColumnTable.
+    The key set is taken from the first row and every row must have the same keys, which are validated only once.
+    Sampling does not apply to columnar arguments.
+    """
+    name = arg_type_defaults.arg_name
+    if isinstance(arg_value, columnar.ColumnTable):
+        keys = arg_value.keys
+        columns = [arg_value.column(key) for key in keys]
+    else:
+        if not isinstance(arg_value, (list, tuple)):
+            raise TypeError("The {name} argument should be a list "
+                            "({name}: {value})".format(name=name, value=arg_value))
+        if len(arg_value) == 0:
+            raise TypeError("The {name} argument should be a list of {type_}, but it is an empty "
+                            "list.".format(name=name, type_=arg_type_defaults.type_.__args__[0]))
+
+        for i, row in enumerate(arg_value):
+            if not isinstance(row, Mapping):
+                raise TypeError("The element of {name} list argument should be a dict "
+                                "(element of {name} list: {value})".format(name=name, value=row))
+            if i == 0:
+                keys = tuple(row)
+                key_set = set(keys)
+            elif len(row) != len(keys) or row.keys() != key_set:
+                raise ValueError("The rows of the columnar {name} argument should all have the keys {keys} "
+                                 "(row {i}: {row})".format(name=name, keys=list(keys), i=i, row=row))
+
+        columns = [[row[key] for row in arg_value] for key in keys]
+
+    row_name = "element of " + name + " list"
+    row_type = arg_type_defaults.type_.__args__[0]
+    if len(keys) == 0:
+        raise TypeError("The {name} argument should be a dict of {type_}, but it is an empty "
+                        "dict.".format(name=row_name, type_=row_type.__args__[1]))
+
+    length = len(columns[0])
+    if tracker is not None:
+        tracker.enter_container(length)
+        tracker.enter_container(length * len(keys))
+
+    if arg_type_defaults.collection_constraints_obj is not None:
+        arg_type_defaults.collection_constraints_obj.validate_length(length)
+
+    key_type_defaults = type_defaults.TypeDefaultBounds("key of " + row_name + " dictionary", str,
+                                                        str_constraints_obj=arg_type_defaults.key_constraints_obj)
+    new_columns = {}
+    for key, column in zip(keys, columns):
         validate_argument(key, key_type_defaults)
-        new_dict[key] = validate_argument(arg_value[key], el_type_defaults)
+        el_type_defaults = type_defaults.TypeDefaultBounds("element of " + row_name + " dictionary with key " + key,
+                                                           row_type.__args__[1], bound_obj=arg_type_defaults.bound_obj,
+                                                           str_constraints_obj=arg_type_defaults.str_constraints_obj)
+        new_columns[key] = _validate_column(column, el_type_defaults)
+
+    table = columnar.ColumnTable(new_columns)
+
+    if arg_type_defaults.collection_constraints_obj is not None:
+        check_el = arg_type_defaults.collection_constraints_obj.element_checker()
+        if check_el is not None:
+            for row in table:
+                check_el(row, row)
+
+    if tracker is not None:
+        tracker.exit_container()
+        tracker.exit_container()
+
+    return table
+
+
+def _validate_column(column: Any, el_type_defaults: type_defaults.TypeDefaultBounds) -> Any:
+    """
+    Validates the values of one column. Columns whose values all have exactly the expected type are checked in a single
+    pass, with bounds checked on the minimum and maximum only. Other columns are validated value by value.
+    """
+    type_ = el_type_defaults.type_
+    if type_ not in _SCALAR_TYPES or not all(type(value) is type_ for value in column):
+        return [validate_argument(value, el_type_defaults) for value in column]
+
+    if type_ == str and el_type_defaults.str_constraints_obj is not None:
+        for value in column:
+            el_type_defaults.str_constraints_obj.validate_value(value)
+
+    if type_ in [int, float] and el_type_defaults.bound_obj is not None:
+        # NaN values do not compare, so they are checked one by one
+        if type_ == float and any(value != value for value in column):
+            for value in column:
+                el_type_defaults.bound_obj.validate_value(value)
+        else:
+            el_type_defaults.bound_obj.validate_value(min(column))
+            el_type_defaults.bound_obj.validate_value(max(column))
 
-    return new_dict
+    return column
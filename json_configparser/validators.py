@@ -0,0 +1,185 @@
+"""
+The validators module implements the Validator class, which represents a named extra validation that declares the
+arguments it reads, and the ValidatorRunner class, which runs the validators of a ConfigArgs instance.
+"""
+
+import copy
+import inspect
+from concurrent.futures import Executor
+from typing import List, Callable, Dict, Any, Union, NamedTuple, Tuple
+
+from . import frozen_dict
+
+_MISSING = object()
+
+
+class Validator(frozen_dict.ReadOnlyObject):
+    """
+    Represents a named extra validation.
+    The function receives a dictionary with only the arguments it declares (arguments missing from the JSON are not
+    included, unless the results are frozen) and should raise an error if they are invalid. Its return value is ignored.
+    Functions must only depend on the arguments they receive, since with frozen results they are not run again while
+    those arguments do not change.
+    """
+    def __init__(self, name: str, function: Callable[[Dict[str, Any]], Any], arg_names: List[str]):
+        """
+        :param name: The name of the validator, which must be unique within a ConfigArgs instance.
+        :param function: A function of a single parameter, a dictionary mapping argument name to value.
+        :param arg_names: The names of the arguments read by the function.
+        """
+        self._validate_init_args(name, function, arg_names)
+
+        self.name = name
+        self.function = function
+        self.arg_names = tuple(arg_names)
+        self._seal()
+
+    @staticmethod
+    def _validate_init_args(name: str, function: Callable[[Dict[str, Any]], Any], arg_names: List[str]):
+        if not isinstance(name, str):
+            raise TypeError("The name parameter should be a string "
+                            "(name: {})".format(name))
+        if len(name.strip()) == 0:
+            raise ValueError("The name parameter should be a non-empty string "
+                             "(name: {})".format(name))
+
+        if not isinstance(function, Callable):
+            raise TypeError("The function parameter should be a function of a single parameter "
+                            "(function: {})".format(function))
+        sig = inspect.signature(function)
+        if not len(sig.parameters) == 1:
+            raise ValueError("The function parameter should be a function of a single parameter "
+                             "(function parameters: {})".format(sig.parameters))
+
+        if not isinstance(arg_names, (list, tuple)) or not all(isinstance(arg_name, str) for arg_name in arg_names):
+            raise TypeError("The arg_names parameter should be a list of strings "
+                            "(arg_names: {})".format(arg_names))
+        if len(arg_names) == 0 or len(set(arg_names)) != len(arg_names):
+            raise ValueError("The arg_names parameter should be a non-empty list of unique argument names "
+                             "(arg_names: {})".format(arg_names))
+
+    def __str__(self):
+        return "Validator(name={}, arg_names={})".format(self.name, list(self.arg_names))
+
+
+class _Fingerprint(NamedTuple):
+    """
+    NamedTuple identifying the frozen value of an argument passed to a validator.
+    """
+    #: the frozen value, shared with the result it comes from
+    value: Any
+    #: the hash of the value
+    hash_value: int
+
+
+class ValidatorRunner(object):
+    """
+    Runs the validators of a ConfigArgs instance.
+    With frozen results, the arguments of the last successful run of each validator are remembered, so on reloads only
+    the validators whose arguments changed are run again. Frozen values are immutable, so they are remembered by
+    reference rather than copied, and compared by identity, then by their hash, computed once per argument and run,
+    and only compared by equality when the hashes match. Values which cannot be hashed are considered changed.
+    Mutable results cannot be compared as cheaply, so every validator runs on every parse.
+
+    Runs from several threads share the remembered arguments without locks: each entry is read and replaced as a single
+    dictionary item, and a validator skipped because another thread just recorded equal inputs would have passed.
+    """
+    def __init__(self, validators_lst: List[Validator], frozen: bool):
+        """
+        :param validators_lst: The validators, already checked against the options class.
+        :param frozen: Flag indicating if the arguments are frozen, in which case they are neither copied nor frozen
+                       again, and validators are only run again when their arguments changed.
+        """
+        self.validators_lst = tuple(validators_lst)
+        self.frozen = frozen
+        # Maps validator name to the fingerprints of the arguments of its last successful run, with frozen results
+        self._passed_inputs = {}
+
+    def run(self, args_dict: Dict[str, Any], executor: Union[Executor, None] = None):
+        """
+        Runs the validators, or with frozen results the validators whose arguments changed since their last successful
+        run.
+        Errors are deterministic: the raised error is always the one of the first failing validator, in the order in
+        which validators were given.
+
+        :param args_dict: The validated arguments, mapping argument name to value.
+        :param executor: An optional concurrent.futures Executor used to run the validators concurrently.
+        """
+        # Maps argument name to its fingerprint in this run
+        fingerprints = {}
+        pending = []
+        for validator in self.validators_lst:
+            if not self.frozen:
+                pending.append((validator, None))
+                continue
+
+            passed_inputs = self._passed_inputs.get(validator.name, None) or (None,) * len(validator.arg_names)
+            inputs = tuple(_fingerprint(arg_name, args_dict, fingerprints, passed)
+                           for arg_name, passed in zip(validator.arg_names, passed_inputs))
+            if not _same_inputs(inputs, passed_inputs):
+                pending.append((validator, inputs))
+
+        if executor is None or len(pending) < 2:
+            for validator, inputs in pending:
+                validator.function(self._select_args(validator, args_dict))
+                self._remember(validator, inputs)
+            return
+
+        futures = [executor.submit(validator.function, self._select_args(validator, args_dict))
+                   for validator, _ in pending]
+        try:
+            for (validator, inputs), future in zip(pending, futures):
+                future.result()
+                self._remember(validator, inputs)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _remember(self, validator: Validator, inputs: Union[Tuple[Union[_Fingerprint, None], ...], None]):
+        if inputs is not None:
+            self._passed_inputs[validator.name] = inputs
+
+    def _select_args(self, validator: Validator, args_dict: Dict[str, Any]) -> Dict[str, Any]:
+        selected_args = {arg_name: args_dict[arg_name] for arg_name in validator.arg_names if arg_name in args_dict}
+        # Frozen values cannot be modified, so they do not need to be copied
+        return selected_args if self.frozen else copy.deepcopy(selected_args)
+
+    def clear(self):
+        """
+        Forgets the last successful runs, so every validator is run on the next call.
+        """
+        self._passed_inputs.clear()
+
+
+def _fingerprint(arg_name: str, args_dict: Dict[str, Any], fingerprints: Dict[str, Union[_Fingerprint, None]],
+                 passed: Union[_Fingerprint, None]) -> Union[_Fingerprint, None]:
+    """
+    Returns the fingerprint of an argument, or None if it cannot be hashed. A value which is the same object as in the
+    last successful run keeps its fingerprint, without being hashed again.
+    """
+    arg_value = args_dict.get(arg_name, _MISSING)
+    if passed is not None and passed.value is arg_value:
+        return passed
+
+    if arg_name not in fingerprints:
+        try:
+            fingerprints[arg_name] = _Fingerprint(arg_value, 0 if arg_value is _MISSING else hash(arg_value))
+        except TypeError:
+            fingerprints[arg_name] = None
+    return fingerprints[arg_name]
+
+
+def _same_inputs(inputs: Tuple[Union[_Fingerprint, None], ...],
+                 passed_inputs: Tuple[Union[_Fingerprint, None], ...]) -> bool:
+    """
+    Checks if the fingerprints of the arguments of a validator match those of its last successful run.
+    """
+    for fingerprint, passed in zip(inputs, passed_inputs):
+        if fingerprint is None or passed is None:
+            return False
+        if fingerprint.value is passed.value:
+            continue
+        if fingerprint.hash_value != passed.hash_value or fingerprint.value != passed.value:
+            return False
+
+    return True
@@ -0,0 +1,132 @@
+"""
+Implements the streaming and atomic writing of validated arguments to a JSON file, used by ConfigArgs.dump_json.
+"""
+
+import enum
+import json
+import os
+import stat
+import tempfile
+from collections.abc import Mapping
+from typing import Any, Dict, Union
+
+from . import columnar
+
+#: the number of characters buffered before they are written to the file
+DEFAULT_CHUNK_SIZE = 1 << 16
+# The number of elements of a list or dictionary encoded at once by the C accelerated encoder
+_BATCH_SIZE = 1024
+
+
+def _encode_default(value: Any) -> Any:
+    """
+    Converts the values which the json module cannot encode natively, such as read-only mappings, memoryviews, Enum
+    members, and column tables.
+    """
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, memoryview):
+        return value.tolist()
+    if isinstance(value, columnar.ColumnTable):
+        return value.to_rows()
+
+    raise TypeError("Object of type {} is not JSON serializable".format(type(value).__name__))
+
+
+def _iter_batches(encoder: json.JSONEncoder, value: Any):
+    """
+    Encodes a list or dictionary in batches of elements, so each batch is encoded by the C accelerated encoder while
+    the encoded output of the whole value is never held in memory.
+    """
+    if isinstance(value, (list, tuple)):
+        yield "["
+        for start in range(0, len(value), _BATCH_SIZE):
+            if start > 0:
+                yield ","
+            yield encoder.encode(value[start:start + _BATCH_SIZE])[1:-1]
+        yield "]"
+
+    elif isinstance(value, Mapping):
+        keys = sorted(value) if encoder.sort_keys else list(value)
+        yield "{"
+        for start in range(0, len(keys), _BATCH_SIZE):
+            if start > 0:
+                yield ","
+            yield encoder.encode({key: value[key] for key in keys[start:start + _BATCH_SIZE]})[1:-1]
+        yield "}"
+
+    else:
+        yield encoder.encode(value)
+
+
+def _iter_chunks(encoder: json.JSONEncoder, args_dict: Dict[str, Any]):
+    if encoder.indent is not None:
+        yield from encoder.iterencode(args_dict)
+        return
+
+    keys = sorted(args_dict) if encoder.sort_keys else list(args_dict)
+    yield "{"
+    for i, key in enumerate(keys):
+        if i > 0:
+            yield ","
+        yield encoder.encode(key)
+        yield ":"
+        yield from _iter_batches(encoder, args_dict[key])
+    yield "}"
+
+
+def write_json(args_dict: Dict[str, Any], path_to_json: str, encoding: str = "utf-8", sort_keys: bool = False,
+               indent: Union[int, None] = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Writes a dictionary to a JSON file, streaming the encoded output in chunks instead of building the whole string.
+    Without indentation, large lists and dictionaries are encoded in batches of elements by the C accelerated encoder.
+    The file is written atomically: the output goes to a temporary file in the same directory, which replaces the
+    target file only once it is complete and flushed to disk.
+
+    :param args_dict: The dictionary mapping argument name to value.
+    :param path_to_json: Path to the JSON file to write.
+    :param encoding: The encoding of the JSON file.
+    :param sort_keys: Flag indicating if dictionary keys are sorted, which makes the output deterministic.
+    :param indent: The indentation of the output, or None for the most compact output.
+    :param chunk_size: The number of characters buffered before they are written to the file.
+    """
+    if not isinstance(chunk_size, int) or isinstance(chunk_size, bool) or chunk_size < 1:
+        raise ValueError("The chunk_size parameter should be a positive integer (chunk_size: {})".format(chunk_size))
+
+    # NaN and infinite floats are written as the json module reads them, as parse_json does
+    encoder = json.JSONEncoder(sort_keys=sort_keys, indent=indent, ensure_ascii=False, allow_nan=True,
+                               default=_encode_default,
+                               separators=(",", ":") if indent is None else (",", ": "))
+
+    directory, file_name = os.path.split(os.path.abspath(path_to_json))
+    fd, tmp_path = tempfile.mkstemp(prefix="." + file_name + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            buffer = []
+            buffered = 0
+            for chunk in _iter_chunks(encoder, args_dict):
+                buffer.append(chunk)
+                buffered += len(chunk)
+                if buffered >= chunk_size:
+                    f.write("".join(buffer))
+                    buffer = []
+                    buffered = 0
+            f.write("".join(buffer))
+
+            f.flush()
+            os.fsync(f.fileno())
+
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path_to_json).st_mode))
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+
+        os.replace(tmp_path, path_to_json)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
@@ -0,0 +1,107 @@
+"""
+Implements the client of the json_configparser validation daemon (see json_configparser.daemon).
+
+This module only imports the standard library, and is kept outside of the json_configparser package so that importing
+it does not import the package: short-lived processes, such as pre-commit hooks and build steps, only pay for starting
+the interpreter and a round trip to the daemon.
+
+Usage::
+
+    python -m json_configparser_client check /tmp/configparser.sock my_package.options:Arguments config.json
+    python -m json_configparser_client stop /tmp/configparser.sock
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+from typing import List, Dict, Any, Tuple, Union
+
+
+def _send(socket_path: str, message: Dict[str, Any], timeout: Union[float, None]) -> Dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path)
+        client.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        with client.makefile("rb") as f:
+            response = json.loads(f.readline().decode("utf-8"))
+
+    if not response["ok"]:
+        raise ValueError("The server rejected the request: {}: {}".format(response["error"], response["message"]))
+    return response
+
+
+def validate_files(socket_path: str, requests: List[Tuple[str, str]], encoding: str = "utf-8",
+                   timeout: Union[float, None] = 60.0, include_args: bool = True) -> List[Dict[str, Any]]:
+    """
+    Sends a batch of validation requests to a running server.
+
+    :param socket_path: Path of the Unix domain socket of the server.
+    :param requests: A list of (schema, path) tuples. Relative paths are relative to the current directory.
+    :param encoding: The encoding of the JSON files.
+    :param timeout: The number of seconds to wait for the server, or None to wait forever.
+    :param include_args: Flag indicating if the results of valid files include their validated arguments. Without
+                         them, the server does not serialize the arguments.
+    :return: One result per request: {"ok": True, "args": ...} (or {"ok": True} without include_args) or
+             {"ok": False, "error": ..., "message": ...}.
+    :raises OSError: If the server cannot be reached.
+    """
+    message = {"op": "validate",
+               "requests": [{"schema": schema, "path": os.path.abspath(path), "encoding": encoding}
+                            for schema, path in requests],
+               "include_args": include_args}
+    return _send(socket_path, message, timeout)["results"]
+
+
+def shutdown(socket_path: str, timeout: Union[float, None] = 60.0):
+    """
+    Asks a running server to exit.
+
+    :param socket_path: Path of the Unix domain socket of the server.
+    :param timeout: The number of seconds to wait for the server, or None to wait forever.
+    :raises OSError: If the server cannot be reached.
+    """
+    _send(socket_path, {"op": "shutdown"}, timeout)
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    """
+    Command line entry point, see the module documentation.
+
+    :param argv: The command line arguments, or None to use sys.argv.
+    :return: The exit code: 0 if every file is valid, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog="python -m json_configparser_client",
+                                     description="Validate JSON configuration files through a local daemon.")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    check_parser = subparsers.add_parser("check", help="validate files through a running daemon")
+    check_parser.add_argument("socket_path")
+    check_parser.add_argument("schema")
+    check_parser.add_argument("paths", nargs="+")
+    check_parser.add_argument("--encoding", default="utf-8")
+
+    stop_parser = subparsers.add_parser("stop", help="stop a running daemon")
+    stop_parser.add_argument("socket_path")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "stop":
+        shutdown(args.socket_path)
+        return 0
+
+    results = validate_files(args.socket_path, [(args.schema, path) for path in args.paths], args.encoding,
+                             include_args=False)
+    exit_code = 0
+    for path, result in zip(args.paths, results):
+        if not result["ok"]:
+            print("{}: {}: {}".format(path, result["error"], result["message"]), file=sys.stderr)
+            exit_code = 1
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,6 +21,7 @@ setup(name="json_configparser",
                    "Programming Language :: Python :: 3.8"],
       keywords="configuration options",
       packages=["json_configparser"],
+      py_modules=["json_configparser_client"],
       python_requires=">=3.6, <3.9",
       install_requires=[],
       project_urls={"Bug Reports": "https://github.com/GIlunga/JSON-Configparser/issues",
@@ -0,0 +1,14 @@
+import json
+
+import pytest
+
+
+@pytest.fixture
+def write_json(tmp_path):
+    # Writes a value to a JSON file in the temporary directory of the test and returns the path to the file
+    def _write_json(value, file_name="args.json"):
+        path_to_json = tmp_path / file_name
+        path_to_json.write_text(json.dumps(value))
+        return str(path_to_json)
+
+    return _write_json
@@ -39,6 +39,12 @@ class OptionsDefaults(NamedTuple):
     a16: Dict[str, List[int]] = {"a": [1, 2], "b": [3, 4]}
 
 
+class OptionsEmptyDefaults(NamedTuple):
+    a1: int
+    a2: List[int] = []
+    a3: Dict[str, int] = {}
+
+
 def valid_extra_vals(args_dict: Dict[str, Any]):
     if args_dict["a1"] + args_dict["a2"] <= 0:
         raise ValueError("a1 + a2 must be larger than zero!")
@@ -0,0 +1,127 @@
+import subprocess
+import sys
+from typing import NamedTuple, List, Dict
+
+import pytest
+
+import json_configparser
+from json_configparser import batch
+
+
+class OptionsSweep(NamedTuple):
+    learning_rate: float
+    layers: int
+    name: str
+    widths: List[int]
+    flags: Dict[str, bool] = {"dropout": True}
+    momentum: float = 0.9
+
+
+bounds_lst = [json_configparser.Bounds("learning_rate", lower_bound=0, upper_bound=1),
+              json_configparser.Bounds("layers", lower_bound=1, upper_bound=100),
+              json_configparser.Bounds("widths", lower_bound=1)]
+
+
+def _config(i):
+    return {"learning_rate": 0.001 * (i + 1), "layers": i % 10 + 1, "name": "run-{}".format(i), "widths": [64, 32]}
+
+
+def _assert_same_as_validate_dict(args_object, args_dicts):
+    results = args_object.validate_batch(args_dicts)
+
+    assert [result.index for result in results] == list(range(len(args_dicts)))
+    for args_dict, result in zip(args_dicts, results):
+        try:
+            expected = args_object.validate_dict(args_dict)
+        except Exception as e:
+            assert not result.ok and result.args is None
+            assert type(result.error) is type(e) and str(result.error) == str(e)
+        else:
+            assert result.ok and result.error is None
+            assert result.args == expected
+    return results
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_validate_batch(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(batch, "numpy", None)
+
+    args_object = json_configparser.ConfigArgs(OptionsSweep, bounds_lst)
+    args_dicts = [_config(i) for i in range(100)]
+    args_dicts[3] = dict(args_dicts[3], momentum=0.5)
+    args_dicts[5] = dict(args_dicts[5], layers=5.0)
+    args_dicts[7] = dict(args_dicts[7], learning_rate=1)
+
+    results = _assert_same_as_validate_dict(args_object, args_dicts)
+    assert all(result.ok for result in results)
+    assert type(results[5].args["layers"]) is int and type(results[7].args["learning_rate"]) is float
+    assert results[3].args["momentum"] == 0.5 and "momentum" not in results[4].args
+    assert args_dicts[5]["layers"] == 5.0
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_validate_batch_errors(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(batch, "numpy", None)
+
+    args_object = json_configparser.ConfigArgs(OptionsSweep, bounds_lst)
+    args_dicts = [_config(i) for i in range(20)]
+    args_dicts[1] = dict(args_dicts[1], learning_rate=2.0)
+    args_dicts[2] = dict(args_dicts[2], layers="3")
+    args_dicts[3] = {key: value for key, value in args_dicts[3].items() if key != "name"}
+    args_dicts[4] = dict(args_dicts[4], unknown=1)
+    args_dicts[5] = dict(args_dicts[5], widths=[64, 0])
+    args_dicts[6] = dict(args_dicts[6], learning_rate=float("nan"), layers=0)
+    args_dicts[7] = dict(args_dicts[7], layers=2 ** 70)
+    args_dicts[8] = dict(args_dicts[8], widths=[64, "a"])
+    args_dicts[9] = [args_dicts[9]]
+    args_dicts[10] = {key: value for key, value in args_dicts[3].items()}
+
+    results = _assert_same_as_validate_dict(args_object, args_dicts[:9])
+    assert [result.ok for result in results] == [True] + [False] * 8
+    assert isinstance(results[2].error, TypeError) and isinstance(results[6].error, ValueError)
+
+    results = args_object.validate_batch(args_dicts)
+    assert isinstance(results[9].error, TypeError)
+    assert str(results[10].error) == str(results[3].error) and results[10].error is not results[3].error
+
+
+def test_validate_batch_frozen_and_validations():
+    def check_layers(args):
+        if args["layers"] == 4:
+            raise ValueError("4 layers are not allowed")
+
+    args_object = json_configparser.ConfigArgs(OptionsSweep, bounds_lst, extra_validations=check_layers, frozen=True)
+    results = _assert_same_as_validate_dict(args_object, [_config(i) for i in range(6)])
+
+    assert [result.ok for result in results] == [True, True, True, False, True, True]
+    assert isinstance(results[0].args, json_configparser.FrozenDict) and results[0].args["momentum"] == 0.9
+    assert results[0].args["widths"] == (64, 32)
+
+
+def test_validate_batch_limits():
+    args_object = json_configparser.ConfigArgs(OptionsSweep, bounds_lst,
+                                               limits_obj=json_configparser.Limits(max_elements=4))
+    results = args_object.validate_batch([_config(0), dict(_config(1), widths=[1, 2, 3, 4, 5])])
+
+    assert results[0].ok and isinstance(results[1].error, json_configparser.LimitExceededError)
+
+
+def test_validate_batch_invalid():
+    args_object = json_configparser.ConfigArgs(OptionsSweep, bounds_lst)
+
+    assert args_object.validate_batch([]) == []
+    with pytest.raises(TypeError):
+        args_object.validate_batch(_config(0))
+
+
+def test_numpy_not_imported_with_package():
+    code = "import sys, json_configparser; print('numpy' in sys.modules)"
+    output = subprocess.check_output([sys.executable, "-c", code], universal_newlines=True)
+
+    assert output.strip() == "False"
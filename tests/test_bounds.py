@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import json_configparser
 import pytest
 
@@ -70,3 +73,65 @@ def test_invalid_bound():
 def test_equal_bound():
     with pytest.raises(ValueError):
         json_configparser.Bounds(valid_arg_name, 5, valid_lower_inclusive, 5, valid_upper_inclusive)
+
+
+def test_read_only():
+    bound = json_configparser.Bounds(valid_arg_name, valid_lower_bound)
+
+    with pytest.raises(AttributeError):
+        bound.lower_bound = 0
+    with pytest.raises(AttributeError):
+        del bound.upper_bound
+    assert copy.deepcopy(bound).lower_bound == pickle.loads(pickle.dumps(bound)).lower_bound == valid_lower_bound
+
+
+@pytest.mark.parametrize("lbound", [None, 0])
+@pytest.mark.parametrize("linclusive", [True, False])
+@pytest.mark.parametrize("ubound", [None, 10])
+@pytest.mark.parametrize("uinclusive", [True, False])
+@pytest.mark.parametrize("value", [-1, 0, 0.5, 10, 10.5, float("nan")])
+def test_compiled_check(lbound, linclusive, ubound, uinclusive, value):
+    bound = json_configparser.Bounds(valid_arg_name, lbound, linclusive, ubound, uinclusive)
+    too_low = lbound is not None and (value < lbound or (value == lbound and not linclusive))
+    too_high = ubound is not None and (value > ubound or (value == ubound and not uinclusive))
+
+    if too_low or too_high:
+        with pytest.raises(ValueError, match=valid_arg_name):
+            bound.validate_value(value)
+    else:
+        bound.validate_value(value)
+
+
+@pytest.mark.parametrize("first,second,expected", [((0, True, 10, True), (5, True, 20, False), "[5, 10]"),
+                                                   ((0, False, 10, True), (0, True, None, True), "]0, 10]"),
+                                                   ((0, True, 10, False), (None, True, 10, True), "[0, 10["),
+                                                   ((None, True, 10, True), (0, True, None, True), "[0, 10]")])
+def test_intersection(first, second, expected):
+    first = json_configparser.Bounds(valid_arg_name, *first)
+    second = json_configparser.Bounds(valid_arg_name, *second)
+
+    assert str(first.intersection(second)) == str(second.intersection(first)) == expected
+
+
+@pytest.mark.parametrize("first,second,expected", [((0, True, 10, True), (5, True, 20, False), "[0, 20["),
+                                                   ((0, False, 10, False), (10, True, 20, True), "]0, 20]"),
+                                                   ((0, True, 10, True), (0, False, None, True), "[0, None]"),
+                                                   ((None, True, 10, False), (0, True, 10, True), "[None, 10]")])
+def test_union(first, second, expected):
+    first = json_configparser.Bounds(valid_arg_name, *first)
+    second = json_configparser.Bounds(valid_arg_name, *second)
+
+    assert str(first.union(second)) == str(second.union(first)) == expected
+
+
+def test_invalid_combinations():
+    first = json_configparser.Bounds(valid_arg_name, 0, True, 10, False)
+
+    with pytest.raises(ValueError):
+        first.intersection(json_configparser.Bounds(valid_arg_name, 10, True, 20, True))
+    with pytest.raises(ValueError):
+        first.union(json_configparser.Bounds(valid_arg_name, 10, False, 20, True))
+    with pytest.raises(ValueError):
+        first.union(json_configparser.Bounds("other", 5, True, 20, True))
+    with pytest.raises(TypeError):
+        first.intersection((0, 10))
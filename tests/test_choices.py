@@ -0,0 +1,134 @@
+import enum
+import typing
+from typing import NamedTuple, List, Dict
+
+import pytest
+
+import json_configparser
+from json_configparser import validations
+from json_configparser import type_defaults
+
+Literal = getattr(typing, "Literal", None)
+pytestmark = pytest.mark.skipif(Literal is None, reason="typing.Literal requires Python 3.8")
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Level(enum.Enum):
+    LOW = 1
+    HIGH = 2
+
+
+if Literal is not None:
+    Sku = Literal[tuple("sku-{}".format(i) for i in range(10000))]
+
+    class OptionsChoices(NamedTuple):
+        mode: Literal["fast", "safe"]
+        color: Color
+        levels: List[Level]
+        skus: List[Sku]
+        sizes: Dict[str, Literal[1, 2, 3]]
+        nested: Dict[str, List[Color]] = {"a": [Color.RED]}
+        flag: Literal[True, "auto"] = "auto"
+
+
+valid_choices = {"mode": "fast", "color": "red", "levels": [1, 2, 1], "skus": ["sku-1", "sku-9999"],
+                 "sizes": {"a": 1, "b": 3}, "nested": {"a": ["red", "green"]}, "flag": True}
+
+
+def test_valid_choices(write_json):
+    args_object = json_configparser.ConfigArgs(OptionsChoices)
+    args_dict = args_object.parse_json(write_json(valid_choices))
+
+    assert args_dict == dict(valid_choices, color=Color.RED, levels=[Level.LOW, Level.HIGH, Level.LOW],
+                             nested={"a": [Color.RED, Color.GREEN]})
+    OptionsChoices(**args_dict)
+
+
+@pytest.mark.parametrize("arg_name,value", [("mode", "slow"),
+                                            ("mode", 1),
+                                            ("color", "RED"),
+                                            ("color", ["red"]),
+                                            ("levels", [1, 3]),
+                                            ("levels", [True]),
+                                            ("levels", [1.5]),
+                                            ("skus", ["sku-10000"]),
+                                            ("sizes", {"a": 4}),
+                                            ("sizes", {"a": True}),
+                                            ("nested", {"a": ["blue"]}),
+                                            ("flag", 1)])
+def test_invalid_choices(write_json, arg_name, value):
+    args_object = json_configparser.ConfigArgs(OptionsChoices)
+
+    with pytest.raises(ValueError):
+        args_object.parse_json(write_json(dict(valid_choices, **{arg_name: value})))
+
+
+def test_choice_index_built_once():
+    json_configparser.ConfigArgs(OptionsChoices)
+    index = validations.choice_index(Sku)
+
+    assert validations.choice_index(Sku) is index
+    assert len(index) == 10000
+
+
+def test_enum_member_value():
+    typedef = type_defaults.TypeDefaultBounds("a", Color)
+    assert validations.validate_argument(Color.GREEN, typedef) is Color.GREEN
+
+
+@pytest.mark.parametrize("type_", [Literal[1, (1, 2)] if Literal is not None else None,
+                                   enum.Enum("Invalid", {"A": (1, 2)})])
+def test_invalid_choice_values(type_):
+    class Options(NamedTuple):
+        a: type_
+
+    with pytest.raises(TypeError):
+        json_configparser.ConfigArgs(Options)
+
+
+@pytest.mark.parametrize("default", ["slow", Color.RED])
+def test_invalid_default(default):
+    class Options(NamedTuple):
+        a: Literal["fast", "safe"] = default
+
+    with pytest.raises(ValueError):
+        json_configparser.ConfigArgs(Options)
+
+
+def test_no_bounds_for_choices():
+    class Options(NamedTuple):
+        a: Literal[1, 2]
+
+    with pytest.raises(TypeError):
+        json_configparser.ConfigArgs(Options, [json_configparser.Bounds("a", lower_bound=0)])
+
+
+def test_frozen_dump_choices(tmp_path, write_json):
+    args_object = json_configparser.ConfigArgs(OptionsChoices, frozen=True)
+    args_dict = args_object.parse_json(write_json(valid_choices))
+    path_to_json = str(tmp_path / "dumped.json")
+
+    args_object.dump_json(args_dict, path_to_json)
+
+    assert args_object.parse_json(path_to_json) == args_dict
+    hash(args_dict)
+
+
+def test_numeric_choices():
+    class Ratio(enum.Enum):
+        HALF = 0.5
+        ONE = 1.0
+
+    for type_, value, expected in [(Literal[1, 2], 1.0, 1), (Literal[1.0, 2.5], 1, 1.0), (Level, 2.0, Level.HIGH),
+                                   (Ratio, 1, Ratio.ONE), (Literal[True, 1], 1.0, 1), (Literal[True, 1], True, True)]:
+        validated_value = validations.validate_argument(value, type_defaults.TypeDefaultBounds("a", type_))
+        assert validated_value == expected and type(validated_value) is type(expected)
+
+    for type_, value in [(Literal[1, 2], 1.5), (Literal[1, 2], True), (Literal[True], 1), (Literal[True], 1.0),
+                         (Literal[0.0], False), (Literal["1"], 1)]:
+        with pytest.raises(ValueError):
+            validations.validate_argument(value, type_defaults.TypeDefaultBounds("a", type_))
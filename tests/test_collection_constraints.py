@@ -0,0 +1,115 @@
+from typing import NamedTuple, List, Dict
+
+import pytest
+
+import json_configparser
+
+
+class OptionsCollections(NamedTuple):
+    ports: List[int]
+    matrix: List[List[int]]
+    limits: Dict[str, int]
+    tags: List[str] = ["a", "b"]
+
+
+valid_collections = {"ports": [80, 443, 8080], "matrix": [[1, 2], [2, 1]], "limits": {"cpu": 2, "mem": 4}}
+
+valid_constraints_lst = [json_configparser.CollectionConstraints("ports", min_length=1, max_length=4, unique=True,
+                                                                 sorted_order=True),
+                         json_configparser.CollectionConstraints("matrix", unique=True),
+                         json_configparser.CollectionConstraints("limits", sorted_order=True,
+                                                                 required_keys=["cpu"]),
+                         json_configparser.CollectionConstraints("tags", max_length=2, unique=True)]
+
+
+@pytest.mark.parametrize("kwargs", [{"min_length": 0},
+                                    {"max_length": 5},
+                                    {"min_length": 5, "max_length": 5},
+                                    {"unique": True},
+                                    {"sorted_order": True},
+                                    {"required_keys": ["a", "b"]}])
+def test_valid_creation(kwargs):
+    json_configparser.CollectionConstraints("valid", **kwargs)
+
+
+@pytest.mark.parametrize("arg_name,kwargs", [(None, {"unique": True}),
+                                             ("valid", {"min_length": 1.0}),
+                                             ("valid", {"max_length": True}),
+                                             ("valid", {"unique": 1}),
+                                             ("valid", {"sorted_order": "yes"}),
+                                             ("valid", {"required_keys": "a"}),
+                                             ("valid", {"required_keys": [1]})])
+def test_wrong_types(arg_name, kwargs):
+    with pytest.raises(TypeError):
+        json_configparser.CollectionConstraints(arg_name, **kwargs)
+
+
+@pytest.mark.parametrize("arg_name,kwargs", [("  ", {"unique": True}),
+                                             ("valid", {}),
+                                             ("valid", {"required_keys": []}),
+                                             ("valid", {"min_length": -1}),
+                                             ("valid", {"min_length": 5, "max_length": 4})])
+def test_wrong_values(arg_name, kwargs):
+    with pytest.raises(ValueError):
+        json_configparser.CollectionConstraints(arg_name, **kwargs)
+
+
+def test_element_checker():
+    constraints = json_configparser.CollectionConstraints("valid", unique=True, sorted_order=True)
+    check = constraints.element_checker()
+    for el in [1, 2, 3]:
+        check(el, el)
+    with pytest.raises(ValueError):
+        check(3, 3)
+
+    # Every call creates an independent checker
+    constraints.element_checker()(1, 1)
+
+    assert json_configparser.CollectionConstraints("valid", max_length=1).element_checker() is None
+
+
+def test_valid_config(write_json):
+    args_object = json_configparser.ConfigArgs(OptionsCollections, collection_constraints_lst=valid_constraints_lst)
+    assert args_object.parse_json(write_json(valid_collections)) == valid_collections
+
+
+@pytest.mark.parametrize("arg_name,value", [("ports", [80, 443, 8080, 8443, 9000]),
+                                            ("ports", [80, 80]),
+                                            ("ports", [443, 80]),
+                                            ("matrix", [[1, 2], [1, 2]]),
+                                            ("limits", {"mem": 4, "cpu": 2}),
+                                            ("limits", {"mem": 4}),
+                                            ("tags", ["a", "a"]),
+                                            ("tags", ["a", "b", "c"])])
+def test_invalid_config(write_json, arg_name, value):
+    args_object = json_configparser.ConfigArgs(OptionsCollections, collection_constraints_lst=valid_constraints_lst)
+
+    with pytest.raises(ValueError):
+        args_object.parse_json(write_json(dict(valid_collections, **{arg_name: value})))
+
+
+def test_nested_lists_not_constrained(write_json):
+    # The constraints of matrix apply to its rows, not to the elements of each row
+    args_object = json_configparser.ConfigArgs(OptionsCollections, collection_constraints_lst=valid_constraints_lst)
+    value = dict(valid_collections, matrix=[[1, 1], [2, 2]])
+    assert args_object.parse_json(write_json(value))["matrix"] == [[1, 1], [2, 2]]
+
+
+@pytest.mark.parametrize("constraints_lst,error", [([json_configparser.CollectionConstraints("unknown", unique=True)],
+                                                    ValueError),
+                                                   ([json_configparser.CollectionConstraints("ports",
+                                                                                             required_keys=["a"])],
+                                                    TypeError),
+                                                   ([json_configparser.CollectionConstraints("matrix",
+                                                                                             sorted_order=True)],
+                                                    TypeError),
+                                                   ([json_configparser.CollectionConstraints("ports", unique=True),
+                                                     json_configparser.CollectionConstraints("ports", max_length=2)],
+                                                    ValueError),
+                                                   ([json_configparser.CollectionConstraints("tags", max_length=1)],
+                                                    ValueError),
+                                                   (json_configparser.CollectionConstraints("ports", unique=True),
+                                                    TypeError)])
+def test_invalid_constraints_lst(constraints_lst, error):
+    with pytest.raises(error):
+        json_configparser.ConfigArgs(OptionsCollections, collection_constraints_lst=constraints_lst)
@@ -0,0 +1,182 @@
+import array
+import pickle
+from typing import NamedTuple, List, Dict
+
+import pytest
+
+import json_configparser
+from json_configparser import columnar
+from .data import option_defs
+
+
+class OptionsTable(NamedTuple):
+    rows: List[Dict[str, float]]
+    names: List[Dict[str, str]]
+    counts: List[Dict[str, int]] = [{"a": 1}]
+
+
+table_args = {"rows": [{"x": 1.5, "y": 2}, {"x": 3.0, "y": 4.5}],
+              "names": [{"first": "ab", "last": "cd"}, {"first": "ef", "last": "gh"}]}
+
+unique_rows_lst = [json_configparser.CollectionConstraints("rows", unique=True)]
+
+
+def _args_object(**kwargs):
+    return json_configparser.ConfigArgs(OptionsTable, columnar_args=["rows", "names", "counts"], **kwargs)
+
+
+def test_column_table():
+    table = json_configparser.ColumnTable({"a": [1, 2], "b": [0.5, 1.5], "c": ["x", "y"], "d": [True, False]})
+
+    assert table.keys == ("a", "b", "c", "d")
+    assert isinstance(table.column("a"), array.array) and isinstance(table.column("b"), array.array)
+    assert table.column("c") == ["x", "y"] and table.column("d") == [True, False]
+    assert len(table) == 2
+    assert table[1] == {"a": 2, "b": 1.5, "c": "y", "d": False}
+    assert table[-1] == table[1] and table[:1] == [table[0]]
+    assert list(table) == table.to_rows() == table
+    assert table == json_configparser.ColumnTable.from_rows(table.to_rows())
+    assert hash(table) == hash(json_configparser.ColumnTable.from_rows(table.to_rows()))
+    assert pickle.loads(pickle.dumps(table)) == table
+
+    # Ints which do not fit in 64 bits are kept in lists
+    assert json_configparser.ColumnTable({"a": [2 ** 70]}).column("a") == [2 ** 70]
+
+    with pytest.raises(KeyError):
+        table.column("e")
+
+
+def test_column_copies():
+    table = json_configparser.ColumnTable({"a": [1, 2], "c": ["x", "y"]})
+    table_hash = hash(table)
+
+    # Modifying a returned column changes neither the table nor its cached hash
+    table.column("a")[0] = 5
+    table.column("c").append("z")
+    assert table == [{"a": 1, "c": "x"}, {"a": 2, "c": "y"}]
+    assert hash(table) == table_hash == hash(json_configparser.ColumnTable.from_rows(table.to_rows()))
+
+
+@pytest.mark.parametrize("columns", [{}, [1], {"a": [1], "b": [1, 2]}])
+def test_invalid_column_table(columns):
+    with pytest.raises(ValueError):
+        json_configparser.ColumnTable(columns)
+
+
+@pytest.mark.parametrize("rows", [[], [1], [{"a": 1}, {"b": 1}], [{"a": 1}, {"a": 1, "b": 2}]])
+def test_invalid_from_rows(rows):
+    with pytest.raises(ValueError):
+        json_configparser.ColumnTable.from_rows(rows)
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_parse_columnar(write_json, frozen):
+    result = _args_object(frozen=frozen).parse_json(write_json(table_args))
+
+    assert isinstance(result["rows"], columnar.ColumnTable)
+    assert result["rows"] == [{"x": 1.5, "y": 2.0}, {"x": 3.0, "y": 4.5}]
+    assert isinstance(result["rows"].column("y"), array.array)
+    assert result["names"].column("first") == ["ab", "ef"]
+    if frozen:
+        hash(result)
+
+
+def test_validate_columnar_table_again(tmp_path, write_json):
+    args_object = _args_object()
+    result = args_object.parse_json(write_json(table_args))
+
+    assert args_object.validate_dict(result) == result
+    args_object.dump_json(result, str(tmp_path / "dumped.json"))
+    assert args_object.parse_json(str(tmp_path / "dumped.json")) == result
+
+
+@pytest.mark.parametrize("arg_name,value,error", [("rows", [{"x": 1.5, "y": 2}, {"x": 3.0}], ValueError),
+                                                  ("rows", [{"x": 1.5, "y": 2}, {"x": 3.0, "z": 1}], ValueError),
+                                                  ("rows", [{"x": 1.5, "y": 2}, {"x": 3.0, "y": "a"}], TypeError),
+                                                  ("rows", [{"x": 1.5, "y": 2}, [3.0, 1]], TypeError),
+                                                  ("rows", [{}], TypeError),
+                                                  ("rows", [], TypeError),
+                                                  ("rows", {"x": 1.5}, TypeError),
+                                                  ("rows", [{"x": 1.5, "y": 2}, {"x": 30.0, "y": 1}], ValueError),
+                                                  ("names", [{"first": "ab", "last": "c"}], ValueError)])
+def test_invalid_columnar(write_json, arg_name, value, error):
+    args_object = _args_object(bounds_lst=[json_configparser.Bounds("rows", lower_bound=0, upper_bound=10)],
+                               str_constraints_lst=[json_configparser.StringConstraints("names", min_length=2)])
+
+    with pytest.raises(error):
+        args_object.parse_json(write_json(dict(table_args, **{arg_name: value})))
+
+
+def test_columnar_constraints(write_json):
+    constraints = [json_configparser.CollectionConstraints("rows", max_length=2, unique=True)]
+    args_object = _args_object(collection_constraints_lst=constraints)
+
+    with pytest.raises(ValueError):
+        args_object.parse_json(write_json(dict(table_args, rows=table_args["rows"] * 2)))
+    with pytest.raises(ValueError):
+        args_object.parse_json(write_json(dict(table_args, rows=[{"x": 1, "y": 1}] * 2)))
+
+
+def test_columnar_patch(write_json):
+    args_object = _args_object()
+    result = args_object.parse_json(write_json(table_args))
+
+    patched = args_object.apply_patch(result, [{"op": "replace", "path": "/rows/0/x", "value": 2},
+                                               {"op": "add", "path": "/counts/-", "value": {"a": 2}}])
+    assert isinstance(patched["rows"], columnar.ColumnTable) and isinstance(patched["counts"], columnar.ColumnTable)
+    assert patched["rows"].column("x").tolist() == [2.0, 3.0]
+    assert patched["counts"] == [{"a": 1}, {"a": 2}]
+    assert patched["names"] is result["names"]
+
+    with pytest.raises(ValueError):
+        args_object.apply_patch(result, [{"op": "add", "path": "/rows/0/z", "value": 1.0}])
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_columnar_patch_rows(write_json, monkeypatch, frozen):
+    args_object = _args_object(frozen=frozen, collection_constraints_lst=unique_rows_lst)
+    result = args_object.parse_json(write_json(dict(table_args, counts=[{"a": 1}, {"a": 2}])))
+
+    # The tables are patched by column, without building the rows of the whole table
+    monkeypatch.setattr(columnar.ColumnTable, "from_rows", None)
+    monkeypatch.setattr(columnar.ColumnTable, "__iter__", None)
+    patched = args_object.apply_patch(result, [{"op": "add", "path": "/rows/1", "value": {"x": 2, "y": 2}},
+                                               {"op": "remove", "path": "/rows/0"},
+                                               {"op": "replace", "path": "/names/1",
+                                                "value": {"first": "a", "last": "b"}},
+                                               {"op": "replace", "path": "/counts/0/a", "value": 2 ** 70}])
+    monkeypatch.undo()
+
+    assert patched["rows"] == [{"x": 2.0, "y": 2.0}, {"x": 3.0, "y": 4.5}]
+    assert patched["rows"].column("x").tolist() == [2.0, 3.0]
+    assert patched["names"] == [{"first": "ab", "last": "cd"}, {"first": "a", "last": "b"}]
+    assert patched["counts"] == [{"a": 2 ** 70}, {"a": 2}]
+    assert result["rows"] == table_args["rows"] and result["counts"] == [{"a": 1}, {"a": 2}]
+    assert hash(patched["rows"]) == hash(json_configparser.ColumnTable.from_rows(patched["rows"].to_rows()))
+
+
+@pytest.mark.parametrize("operations,error", [([{"op": "add", "path": "/rows/-", "value": {"x": 1.5, "y": 2}}],
+                                               ValueError),
+                                              ([{"op": "add", "path": "/rows/0", "value": {"x": 1.0}}], ValueError),
+                                              ([{"op": "remove", "path": "/rows/0/x"}], ValueError),
+                                              ([{"op": "replace", "path": "/rows/0/z", "value": 1.0}], ValueError),
+                                              ([{"op": "replace", "path": "/rows/0/x/0", "value": 1.0}], ValueError),
+                                              ([{"op": "replace", "path": "/rows/0/x", "value": "a"}], TypeError),
+                                              ([{"op": "remove", "path": "/rows/0"},
+                                                {"op": "remove", "path": "/rows/0"}], TypeError)])
+def test_columnar_patch_errors(write_json, operations, error):
+    args_object = _args_object(collection_constraints_lst=unique_rows_lst)
+    result = args_object.parse_json(write_json(table_args))
+
+    with pytest.raises(error):
+        args_object.apply_patch(result, operations)
+
+
+@pytest.mark.parametrize("columnar_args,error", [("a14", TypeError),
+                                                 (["unknown"], ValueError),
+                                                 (["a5"], TypeError),
+                                                 (["a15"], TypeError),
+                                                 (["a14", "a14"], ValueError)])
+def test_invalid_columnar_args(columnar_args, error):
+    with pytest.raises(error):
+        json_configparser.ConfigArgs(option_defs.OptionsOnly, columnar_args=columnar_args)
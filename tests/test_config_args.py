@@ -1,3 +1,10 @@
+import json
+import pickle
+import threading
+import types
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import NamedTuple, List
+
 import pytest
 
 import json_configparser
@@ -103,3 +110,216 @@ def test_unknown_json_args():
 def test_valid_extra_validations(val_f):
     args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, extra_validations=val_f)
     args_object.parse_json("tests/data/valid.json")
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_iter_jsonl(use_executor):
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly)
+
+    if use_executor:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(args_object.iter_jsonl("tests/data/mixed.jsonl", executor=executor, max_pending=2))
+    else:
+        results = list(args_object.iter_jsonl("tests/data/mixed.jsonl"))
+
+    assert [result.line_number for result in results] == [1, 3, 4, 5]
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert results[0].args == valid_dict
+    assert isinstance(results[1].error, TypeError)
+    assert isinstance(results[2].error, ValueError)
+
+
+def test_iter_jsonl_process_pool():
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, valid_bounds_lst)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(args_object.iter_jsonl("tests/data/mixed.jsonl", executor=executor, max_pending=2))
+
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert results[0].args == valid_dict
+
+
+def test_pickle():
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, valid_bounds_lst, fill_defaults=True)
+    args_object.parse_source(json_configparser.FileSource("tests/data/valid.json"))
+    unpickled = pickle.loads(pickle.dumps(args_object))
+
+    assert isinstance(unpickled.type_default_bounds_dict, types.MappingProxyType)
+    assert isinstance(unpickled._defaults_template, types.MappingProxyType)
+    assert len(unpickled._source_cache) == 0
+    assert unpickled.parse_json("tests/data/valid.json") == args_object.parse_json("tests/data/valid.json")
+    with pytest.raises(AttributeError):
+        unpickled.frozen = True
+
+
+@pytest.mark.parametrize("max_pending,error", [(0, ValueError), (2.0, TypeError), (True, TypeError)])
+def test_iter_jsonl_invalid_max_pending(max_pending, error):
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly)
+
+    # Raised by the call, before the first line is read
+    with pytest.raises(error):
+        args_object.iter_jsonl("tests/data/mixed.jsonl", max_pending=max_pending)
+
+
+class _FirstOnlyExecutor(Executor):
+    # Runs the first submitted function and leaves the others pending
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        if not self.futures:
+            future.set_result(fn(*args, **kwargs))
+        self.futures.append(future)
+        return future
+
+
+def test_iter_jsonl_close_cancels_pending():
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly)
+    executor = _FirstOnlyExecutor()
+
+    results = args_object.iter_jsonl("tests/data/mixed.jsonl", executor=executor, max_pending=2)
+    assert next(results).line_number == 1
+    results.close()
+
+    assert len(executor.futures) == 2 and executor.futures[1].cancelled()
+
+
+@pytest.mark.parametrize("parallel_min_size", [1, 4, 1000])
+def test_parse_json_executor(parallel_min_size):
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, valid_bounds_lst)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        args_dict = args_object.parse_json("tests/data/valid.json", executor=executor,
+                                           parallel_min_size=parallel_min_size)
+
+    assert args_dict == valid_dict
+
+
+def test_parse_json_executor_first_error(tmp_path):
+    invalid_dict = dict(valid_dict, a5=[5, "a"], a13=[[1, 2], [3, 4.5]], a16={"a": [1, 2], "b": [3, 4.5]})
+    path_to_json = tmp_path / "invalid.json"
+    path_to_json.write_text(json.dumps(invalid_dict))
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        with pytest.raises(TypeError, match="a5"):
+            args_object.parse_json(str(path_to_json), executor=executor, parallel_min_size=4)
+
+
+def test_validate_dict():
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, valid_bounds_lst)
+    with open("tests/data/valid.json") as f:
+        loaded_dict = json.load(f)
+
+    args_dict = args_object.validate_dict(loaded_dict)
+    assert args_dict == valid_dict and args_dict is not loaded_dict
+    assert args_dict["a13"] is loaded_dict["a13"]
+
+    with pytest.raises(ValueError):
+        args_object.validate_dict(dict(loaded_dict, unknown=1))
+    assert "unknown" not in loaded_dict
+    with pytest.raises(TypeError):
+        args_object.validate_dict([loaded_dict])
+
+
+def test_read_only_after_construction():
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsDefaults, valid_bounds_lst, frozen=True)
+
+    with pytest.raises(AttributeError):
+        args_object.frozen = False
+    with pytest.raises(TypeError):
+        args_object.type_default_bounds_dict["a1"] = None
+    with pytest.raises(TypeError):
+        args_object._defaults_template["a1"] = None
+    with pytest.raises(AttributeError):
+        args_object.arg_names.add("unknown")
+
+
+def test_lists_copied_at_construction():
+    checked = []
+    validators_lst = [json_configparser.Validator("a1", lambda args: checked.append(args["a1"]), ["a1"])]
+    bounds_lst = list(valid_bounds_lst)
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, bounds_lst, validators_lst=validators_lst)
+
+    validators_lst.append(json_configparser.Validator("unknown", checked.append, ["unknown"]))
+    bounds_lst.append(json_configparser.Bounds("a1", lower_bound=100))
+    args = args_object.parse_json("tests/data/valid.json")
+
+    assert checked == [args["a1"]]
+    assert isinstance(args_object.validators_lst, tuple) and len(args_object.validators_lst) == 1
+    assert args_object.bounds_lst == tuple(valid_bounds_lst)
+
+
+def test_parse_json_threads():
+    checked = []
+    validator = json_configparser.Validator("a1", lambda args: checked.append(args["a1"]), ["a1"])
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, valid_bounds_lst, validators_lst=[validator])
+    source = json_configparser.FileSource("tests/data/valid.json")
+    barrier = threading.Barrier(8)
+    results = []
+
+    def parse():
+        barrier.wait()
+        for _ in range(20):
+            results.append(args_object.parse_json("tests/data/valid.json"))
+            results.append(args_object.parse_source(source))
+
+    threads = [threading.Thread(target=parse) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 320 and all(result == valid_dict for result in results)
+    assert len(checked) >= 1
+
+
+def test_fill_defaults():
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsDefaults, fill_defaults=True)
+
+    first = args_object.validate_dict({"a1": 7})
+    second = args_object.validate_dict({})
+    assert first == dict(valid_dict, a1=7) and second == valid_dict
+    assert args_object.parse_json("tests/data/empty.json") == valid_dict
+
+    # Mutable defaults are copied for each result and never shared with the options class
+    assert first["a15"] is not second["a15"] and first["a15"]["a"] is not second["a15"]["a"]
+    assert second["a13"] is not option_defs.OptionsDefaults._field_defaults["a13"]
+    second["a5"].append(1)
+    assert args_object.validate_dict({})["a5"] == [5, 5]
+
+    # Removing an argument restores its default
+    assert args_object.apply_patch(first, [{"op": "remove", "path": "/a1"}]) == valid_dict
+
+
+def test_fill_defaults_validated_once():
+    class OptionsConverted(NamedTuple):
+        a1: float = 10
+        a2: List[int] = []
+
+    args_object = json_configparser.ConfigArgs(OptionsConverted, fill_defaults=True)
+    result = args_object.validate_dict({})
+
+    assert type(result["a1"]) is float and result["a2"] == []
+    assert json_configparser.ConfigArgs(OptionsConverted, frozen=True).validate_dict({}) == {"a1": 10.0, "a2": ()}
+
+
+def test_invalid_fill_defaults():
+    with pytest.raises(TypeError):
+        json_configparser.ConfigArgs(option_defs.OptionsDefaults, fill_defaults=1)
+
+
+def test_bounds_intersection():
+    bounds_lst = [json_configparser.Bounds("a1", lower_bound=0, upper_bound=10),
+                  json_configparser.Bounds("a1", lower_bound=2, upper_bound=20)]
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsDefaults, bounds_lst)
+
+    assert str(args_object.type_default_bounds_dict["a1"].bound_obj) == "[2, 10]"
+    with pytest.raises(ValueError):
+        args_object.validate_dict({"a1": 1})
+    with pytest.raises(ValueError):
+        args_object.validate_dict({"a1": 11})
+    with pytest.raises(ValueError):
+        json_configparser.ConfigArgs(option_defs.OptionsDefaults,
+                                     bounds_lst + [json_configparser.Bounds("a1", lower_bound=15)])
@@ -0,0 +1,187 @@
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+from typing import NamedTuple, List
+
+import pytest
+
+import json_configparser
+import json_configparser_client
+from json_configparser import daemon
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not available")
+
+
+class OptionsDaemon(NamedTuple):
+    name: str
+    ports: List[int]
+
+
+bounded_args = json_configparser.ConfigArgs(OptionsDaemon, [json_configparser.Bounds("ports", lower_bound=0)])
+
+SCHEMA = "tests.test_daemon:OptionsDaemon"
+BOUNDED_SCHEMA = "tests.test_daemon:bounded_args"
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to about 100 characters, so pytest temporary directories may be too long
+    directory = tempfile.mkdtemp()
+    yield os.path.join(directory, "daemon.sock")
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def server(socket_path):
+    validation_server = daemon.ValidationServer(socket_path, idle_timeout=5.0)
+    thread = threading.Thread(target=validation_server.serve)
+    thread.start()
+    for _ in range(500):
+        if os.path.exists(socket_path):
+            break
+        threading.Event().wait(0.01)
+
+    yield validation_server
+
+    if thread.is_alive():
+        daemon.shutdown(socket_path)
+    thread.join()
+
+
+@pytest.mark.parametrize("kwargs", [{"idle_timeout": 0}, {"idle_timeout": "1"}, {"max_cached_files": 0}])
+def test_invalid_server(socket_path, kwargs):
+    with pytest.raises(ValueError):
+        daemon.ValidationServer(socket_path, **kwargs)
+
+
+def test_handle_batch_caches(write_json, socket_path):
+    validation_server = daemon.ValidationServer(socket_path, max_cached_files=1)
+    valid_path = write_json({"name": "a", "ports": [80]}, "valid.json")
+    invalid_path = write_json({"name": "a", "ports": [-1]}, "invalid.json")
+
+    results = validation_server.handle_batch([{"schema": SCHEMA, "path": valid_path},
+                                              {"schema": BOUNDED_SCHEMA, "path": invalid_path},
+                                              {"schema": SCHEMA},
+                                              {"schema": "tests.test_daemon:Unknown", "path": valid_path}])
+
+    assert results[0] == {"ok": True, "args": {"name": "a", "ports": [80]}}
+    assert [result["ok"] for result in results[1:]] == [False, False, False]
+    assert [result["error"] for result in results[1:]] == ["ValueError", "ValueError", "AttributeError"]
+
+    # Only the most recent file is kept
+    assert list(validation_server._file_sources) == [(BOUNDED_SCHEMA, invalid_path, "utf-8")]
+    first = validation_server.validate(SCHEMA, valid_path)
+    assert validation_server.validate(SCHEMA, valid_path) == first
+
+    results = validation_server.handle_batch([{"schema": SCHEMA, "path": valid_path}], include_args=False)
+    assert results == [{"ok": True}]
+
+
+def test_reload_changed_schema(tmp_path, write_json, socket_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module_path = tmp_path / "daemon_options.py"
+    module_path.write_text("from typing import NamedTuple\n\n"
+                           "class Options(NamedTuple):\n"
+                           "    name: str\n")
+    valid_path = write_json({"name": "a", "port": 80}, "valid.json")
+    validation_server = daemon.ValidationServer(socket_path)
+
+    try:
+        with pytest.raises(ValueError):
+            validation_server.validate("daemon_options:Options", valid_path)
+        with pytest.raises(AttributeError):
+            validation_server.validate("daemon_options:Unknown", valid_path)
+
+        module_path.write_text("from typing import NamedTuple\n\n"
+                               "class Options(NamedTuple):\n"
+                               "    name: str\n"
+                               "    port: int = 0\n\n"
+                               "Unknown = Options\n")
+        stat = os.stat(str(module_path))
+        os.utime(str(module_path), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 10))
+
+        assert validation_server.validate("daemon_options:Options", valid_path) == {"name": "a", "port": 80}
+        assert validation_server.validate("daemon_options:Unknown", valid_path) == {"name": "a", "port": 80}
+    finally:
+        sys.modules.pop("daemon_options", None)
+
+
+def test_server(write_json, socket_path, server):
+    valid_path = write_json({"name": "a", "ports": [80]}, "valid.json")
+    invalid_path = write_json({"name": "a", "ports": [-1]}, "invalid.json")
+
+    results = daemon.validate_files(socket_path, [(SCHEMA, valid_path), (BOUNDED_SCHEMA, invalid_path)])
+    assert results[0] == {"ok": True, "args": {"name": "a", "ports": [80]}}
+    assert not results[1]["ok"] and results[1]["error"] == "ValueError"
+
+    results = json_configparser_client.validate_files(socket_path, [(SCHEMA, valid_path)], include_args=False)
+    assert results == [{"ok": True}]
+
+    assert json_configparser_client.main(["check", socket_path, SCHEMA, valid_path]) == 0
+    assert json_configparser_client.main(["check", socket_path, BOUNDED_SCHEMA, valid_path, invalid_path]) == 1
+
+    with pytest.raises(OSError):
+        daemon.ValidationServer(socket_path).serve()
+
+    assert json_configparser_client.main(["stop", socket_path]) == 0
+
+
+def test_server_socket_permissions(socket_path, server):
+    assert os.stat(socket_path).st_mode & 0o777 == 0o600
+
+
+def test_server_drops_idle_connections(write_json, socket_path, monkeypatch):
+    monkeypatch.setattr(daemon, "_CONNECTION_TIMEOUT", 0.05)
+    validation_server = daemon.ValidationServer(socket_path, idle_timeout=5.0)
+    thread = threading.Thread(target=validation_server.serve)
+    thread.start()
+    for _ in range(500):
+        if os.path.exists(socket_path):
+            break
+        threading.Event().wait(0.01)
+
+    valid_path = write_json({"name": "a", "ports": [80]}, "valid.json")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle_client:
+        idle_client.connect(socket_path)
+        # The idle connection is dropped, so the other clients are served
+        assert daemon.validate_files(socket_path, [(SCHEMA, valid_path)], include_args=False) == [{"ok": True}]
+        assert idle_client.recv(1) == b""
+
+    daemon.shutdown(socket_path)
+    thread.join()
+
+
+def test_server_rejects_invalid_requests(socket_path, server):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(b"[1, 2]\n")
+        with client.makefile("rb") as f:
+            response = json.loads(f.readline().decode("utf-8"))
+
+    assert not response["ok"] and response["error"] == "ValueError"
+
+
+def test_idle_exit(socket_path):
+    validation_server = daemon.ValidationServer(socket_path, idle_timeout=0.05)
+    validation_server.serve()
+    assert not os.path.exists(socket_path)
+
+
+def test_stale_socket(socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+        stale.bind(socket_path)
+
+    daemon.ValidationServer(socket_path, idle_timeout=0.05).serve()
+    assert not os.path.exists(socket_path)
+
+
+def test_client_does_not_import_package():
+    code = "import sys, json_configparser_client; print('json_configparser' in sys.modules)"
+    output = subprocess.check_output([sys.executable, "-c", code], universal_newlines=True)
+
+    assert output.strip() == "False"
@@ -0,0 +1,117 @@
+from typing import NamedTuple, List
+
+import pytest
+
+import json_configparser
+
+
+class OptionsV2(NamedTuple):
+    version: int
+    hosts: List[str]
+    retries: int = 3
+
+
+class OptionsBatch(NamedTuple):
+    inputs: List[str]
+
+
+def migrate_v1(args):
+    return {"version": 2, "hosts": [args["host"]]}
+
+
+args_v2 = json_configparser.ConfigArgs(OptionsV2, [json_configparser.Bounds("retries", lower_bound=0)])
+args_batch = json_configparser.ConfigArgs(OptionsBatch)
+version_dispatcher = json_configparser.SchemaDispatcher("version", {2: args_v2}, migrations={1: migrate_v1})
+kind_dispatcher = json_configparser.SchemaDispatcher("kind", {"service": args_v2, "batch": args_batch})
+
+
+@pytest.mark.parametrize("discriminator,schemas,migrations,error", [(1, {2: args_v2}, None, TypeError),
+                                                                    (" ", {2: args_v2}, None, ValueError),
+                                                                    ("version", {}, None, ValueError),
+                                                                    ("version", [args_v2], None, TypeError),
+                                                                    ("version", {2: OptionsV2}, None, TypeError),
+                                                                    ("version", {(2,): args_v2}, None, TypeError),
+                                                                    ("version", {2: args_v2}, {1: 2}, TypeError),
+                                                                    ("version", {2: args_v2}, {None: len}, TypeError)])
+def test_invalid_creation(discriminator, schemas, migrations, error):
+    with pytest.raises(error):
+        json_configparser.SchemaDispatcher(discriminator, schemas, migrations)
+
+
+def test_invalid_limits_obj():
+    with pytest.raises(TypeError):
+        json_configparser.SchemaDispatcher("version", {2: args_v2}, limits_obj={"max_depth": 2})
+
+
+def test_dispatch_limits(write_json):
+    limited_v2 = json_configparser.ConfigArgs(OptionsV2, limits_obj=json_configparser.Limits(max_file_bytes=1000,
+                                                                                             max_elements=10))
+    limited_batch = json_configparser.ConfigArgs(OptionsBatch, limits_obj=json_configparser.Limits(max_elements=5,
+                                                                                                   max_depth=3))
+    dispatcher = json_configparser.SchemaDispatcher("kind", {"service": limited_v2, "batch": limited_batch})
+
+    # The strictest limits of the schemas are enforced while decoding, whichever schema is selected
+    assert (dispatcher.limits_obj.max_file_bytes, dispatcher.limits_obj.max_elements) == (1000, 5)
+    assert dispatcher.limits_obj.max_depth == 3 and dispatcher.limits_obj.time_budget is None
+    assert dispatcher.parse_json(write_json({"kind": "service", "version": 2, "hosts": ["a"]})).args == \
+        {"version": 2, "hosts": ["a"]}
+
+    for value, limit_name in [({"kind": "service", "version": 2, "hosts": ["a"] * 6}, "max_elements"),
+                              ({"kind": "service", "version": 2, "hosts": ["a" * 1000]}, "max_file_bytes"),
+                              ([[[[1]]]], "max_depth"),
+                              ([1] * 100, "max_elements")]:
+        with pytest.raises(json_configparser.LimitExceededError) as e:
+            dispatcher.parse_json(write_json(value))
+        assert e.value.limit_name == limit_name
+
+    # A limits_obj given to the dispatcher replaces the limits of the schemas while decoding
+    dispatcher = json_configparser.SchemaDispatcher("kind", {"service": limited_v2, "batch": limited_batch},
+                                                    limits_obj=json_configparser.Limits(max_depth=2))
+    assert dispatcher.parse_json(write_json({"kind": "batch", "inputs": ["x"]})).args == {"inputs": ["x"]}
+    with pytest.raises(json_configparser.LimitExceededError):
+        dispatcher.parse_json(write_json({"kind": "batch", "inputs": [["x"]]}))
+
+    assert kind_dispatcher.limits_obj is None
+
+
+def test_dispatch_version(write_json):
+    result = version_dispatcher.parse_json(write_json({"version": 2, "hosts": ["a"], "retries": 1}))
+    assert result == (2, args_v2, {"version": 2, "hosts": ["a"], "retries": 1})
+    assert OptionsV2(**result.args).retries == 1
+
+    # Migrated from a version without a schema
+    result = version_dispatcher.parse_json(write_json({"version": 1, "host": "b"}))
+    assert result.discriminator_value == 2 and result.args == {"version": 2, "hosts": ["b"]}
+
+    # Equal ints and floats select the same schema or migration, as for choice arguments
+    result = version_dispatcher.parse_json(write_json({"version": 1.0, "host": "b"}))
+    assert result.discriminator_value == 2 and result.args == {"version": 2, "hosts": ["b"]}
+
+
+def test_dispatch_kind(write_json):
+    # The discriminator is removed when it is not an argument of the selected options class
+    result = kind_dispatcher.parse_json(write_json({"kind": "batch", "inputs": ["x"]}))
+    assert result.config_args is args_batch and result.args == {"inputs": ["x"]}
+
+    with pytest.raises(ValueError):
+        kind_dispatcher.parse_json(write_json({"kind": "service", "hosts": ["a"]}))
+
+
+@pytest.mark.parametrize("value,error", [({"hosts": ["a"]}, ValueError),
+                                         ({"version": 3, "hosts": ["a"]}, ValueError),
+                                         ({"version": True, "hosts": ["a"]}, ValueError),
+                                         ({"version": [2], "hosts": ["a"]}, ValueError),
+                                         ({"version": 2, "hosts": ["a"], "retries": -1}, ValueError),
+                                         ({"version": 2, "hosts": "a"}, TypeError),
+                                         ([{"version": 2}], TypeError)])
+def test_dispatch_errors(write_json, value, error):
+    with pytest.raises(error):
+        version_dispatcher.parse_json(write_json(value))
+
+
+def test_migration_loop():
+    dispatcher = json_configparser.SchemaDispatcher("version", {3: args_v2},
+                                                    migrations={1: lambda args: dict(args, version=2),
+                                                                2: lambda args: dict(args, version=1)})
+    with pytest.raises(ValueError, match="loop"):
+        dispatcher.select({"version": 1, "hosts": ["a"]})
@@ -0,0 +1,130 @@
+import pickle
+import threading
+import types
+from typing import NamedTuple, List, Dict
+
+import pytest
+
+import json_configparser
+from json_configparser import frozen_dict
+from .data import option_defs
+
+
+def test_freeze():
+    value = {"a": [1, [2, 3]], "b": {"c": {"d": [4]}}, "e": "abc"}
+    frozen = frozen_dict.freeze(value)
+
+    assert frozen == {"a": (1, (2, 3)), "b": {"c": {"d": (4,)}}, "e": "abc"}
+    assert frozen["a"] == (1, (2, 3))
+    assert isinstance(frozen["b"]["c"], json_configparser.FrozenDict)
+    assert frozen_dict.freeze(frozen) is frozen
+    assert hash(frozen) == hash(frozen_dict.freeze(value))
+
+
+def test_freeze_tuples_and_mappings():
+    value = ([1, 2], types.MappingProxyType({"a": [3]}), json_configparser.FrozenDict({"b": [4]}))
+    frozen = frozen_dict.freeze(value)
+
+    assert frozen == ((1, 2), {"a": (3,)}, {"b": (4,)})
+    assert isinstance(frozen[1], json_configparser.FrozenDict) and isinstance(frozen[2]["b"], tuple)
+    assert hash(frozen) == hash(frozen_dict.freeze(frozen))
+    assert frozen_dict.freeze(frozen) is frozen
+
+
+def test_frozen_results_from_tuples_and_mappings():
+    class OptionsNested(NamedTuple):
+        m: List[List[int]]
+        d: Dict[str, Dict[str, int]]
+
+    args_object = json_configparser.ConfigArgs(OptionsNested, frozen=True)
+    result = args_object.validate_dict({"m": ([1, 2], [3, 4]),
+                                        "d": types.MappingProxyType({"a": types.MappingProxyType({"b": 1})})})
+
+    assert result == {"m": ((1, 2), (3, 4)), "d": {"a": {"b": 1}}}
+    assert isinstance(result["d"]["a"], json_configparser.FrozenDict)
+    hash(result)
+
+
+def test_frozen_dict_immutable():
+    frozen = json_configparser.FrozenDict(a=1)
+
+    with pytest.raises(TypeError):
+        frozen["a"] = 2
+    with pytest.raises(AttributeError):
+        frozen.b = 2
+
+
+def test_frozen_dict_mapping():
+    frozen = json_configparser.FrozenDict({"a": 1, "b": 2})
+
+    assert len(frozen) == 2 and "a" in frozen and "c" not in frozen
+    assert list(frozen) == ["a", "b"]
+    assert frozen.get("c", 3) == 3
+    assert frozen == {"a": 1, "b": 2} and frozen != {"a": 1}
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert {frozen: 1}[json_configparser.FrozenDict({"b": 2, "a": 1})] == 1
+
+
+def test_frozen_results():
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsDefaults, frozen=True)
+    args_dict = args_object.parse_json("tests/data/empty.json")
+
+    assert isinstance(args_dict, json_configparser.FrozenDict)
+    assert args_dict["a5"] == (5, 5)
+    assert args_dict["a14"] == ({"a": 5, "b": 5}, {"a": 5, "b": 5})
+    assert args_dict == frozen_dict.freeze(option_defs.OptionsDefaults()._asdict())
+
+    # Defaults are shared between results, as they cannot be modified
+    assert args_object.parse_json("tests/data/empty.json")["a14"] is args_dict["a14"]
+
+    result = option_defs.OptionsDefaults(**args_dict)
+    assert hash(result) == hash(option_defs.OptionsDefaults(**args_object.parse_json("tests/data/empty.json")))
+
+
+def test_frozen_results_from_json():
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, frozen=True)
+    args_dict = args_object.parse_json("tests/data/valid.json")
+    mutable_args_dict = json_configparser.ConfigArgs(option_defs.OptionsOnly).parse_json("tests/data/valid.json")
+
+    assert args_dict == frozen_dict.freeze(mutable_args_dict)
+    assert args_dict["a16"]["a"] == (1, 2)
+    hash(args_dict)
+
+
+def test_frozen_extra_validations():
+    def extra_validations(args_dict):
+        return dict(args_dict, a5=[1, 2])
+
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, extra_validations=extra_validations,
+                                               frozen=True)
+
+    assert args_object.parse_json("tests/data/valid.json")["a5"] == (1, 2)
+
+
+def test_frozen_results_threads():
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, frozen=True)
+    args_dict = args_object.parse_json("tests/data/valid.json")
+    hashes = []
+
+    threads = [threading.Thread(target=lambda: hashes.append(hash(args_dict))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(hashes)) == 1
+
+
+def test_frozen_dump_json(tmp_path):
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsDefaults, frozen=True)
+    path_to_json = str(tmp_path / "args.json")
+    args_dict = args_object.parse_json("tests/data/valid.json")
+
+    args_object.dump_json(args_dict, path_to_json)
+
+    assert args_object.parse_json(path_to_json) == args_dict
+
+
+def test_invalid_frozen():
+    with pytest.raises(TypeError):
+        json_configparser.ConfigArgs(option_defs.OptionsOnly, frozen=1)
@@ -0,0 +1,149 @@
+import json
+import pickle
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, List
+
+import pytest
+
+import json_configparser
+from json_configparser import limits
+from .data import option_defs
+
+
+@pytest.mark.parametrize("kwargs", [{"max_file_bytes": 10},
+                                    {"max_elements": 1, "max_arg_elements": 1, "max_depth": 1},
+                                    {"time_budget": 1},
+                                    {"time_budget": 0.5}])
+def test_valid_creation(kwargs):
+    limits_obj = json_configparser.Limits(**kwargs)
+    for name, value in kwargs.items():
+        assert getattr(limits_obj, name) == value
+
+
+@pytest.mark.parametrize("kwargs", [{"max_file_bytes": 1.5},
+                                    {"max_elements": "1"},
+                                    {"max_arg_elements": True},
+                                    {"max_depth": [1]},
+                                    {"time_budget": "1"}])
+def test_wrong_types(kwargs):
+    with pytest.raises(TypeError):
+        json_configparser.Limits(**kwargs)
+
+
+@pytest.mark.parametrize("kwargs", [{"max_file_bytes": 0},
+                                    {"max_elements": -1},
+                                    {"max_depth": 0},
+                                    {"time_budget": 0}])
+def test_wrong_values(kwargs):
+    with pytest.raises(ValueError):
+        json_configparser.Limits(**kwargs)
+
+
+def test_invalid_limits_obj():
+    with pytest.raises(TypeError):
+        json_configparser.ConfigArgs(option_defs.OptionsOnly, limits_obj={"max_depth": 1})
+
+
+def test_within_limits():
+    limits_obj = json_configparser.Limits(max_file_bytes=10000, max_elements=100, max_arg_elements=10, max_depth=3,
+                                          time_budget=60)
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, limits_obj=limits_obj)
+
+    assert args_object.parse_json("tests/data/valid.json") == \
+        json_configparser.ConfigArgs(option_defs.OptionsOnly).parse_json("tests/data/valid.json")
+
+
+@pytest.mark.parametrize("limit_name,limit", [("max_file_bytes", 100),
+                                              ("max_elements", 30),
+                                              ("max_arg_elements", 5),
+                                              ("max_depth", 2),
+                                              ("time_budget", 1e-9)])
+def test_exceeded_limits(limit_name, limit):
+    limits_obj = json_configparser.Limits(**{limit_name: limit})
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, limits_obj=limits_obj)
+
+    with pytest.raises(json_configparser.LimitExceededError) as e:
+        args_object.parse_json("tests/data/valid.json")
+
+    assert e.value.limit_name == limit_name
+    assert e.value.limit == limit
+
+
+def test_max_depth_ignores_strings(write_json):
+    class Options(NamedTuple):
+        a: str
+        b: List[int]
+
+    limits_obj = json_configparser.Limits(max_depth=2)
+    args_object = json_configparser.ConfigArgs(Options, limits_obj=limits_obj)
+
+    assert args_object.parse_json(write_json({"a": "[[[{{{", "b": [1]})) == {"a": "[[[{{{", "b": [1]}
+
+
+def test_elements_counted_before_decoding(write_json, monkeypatch):
+    class Options(NamedTuple):
+        a: str
+        b: List[List[int]]
+
+    limits_obj = json_configparser.Limits(max_elements=5, max_arg_elements=5)
+    args_object = json_configparser.ConfigArgs(Options, limits_obj=limits_obj)
+    # Strings and empty containers add no elements, and the top-level object is not counted, as in validation
+    value = {"a": ",[1, 2], {}", "b": [[1, 2], [3]]}
+    assert args_object.parse_json(write_json(value)) == value
+
+    def fail_loads(*args, **kwargs):
+        raise AssertionError("The JSON document should not be decoded")
+
+    monkeypatch.setattr(json, "loads", fail_loads)
+    with pytest.raises(json_configparser.LimitExceededError) as e:
+        args_object.parse_json(write_json({"a": "", "b": [[1, 2], [3, 4]]}))
+    assert e.value.limit_name == "max_arg_elements"
+
+    # A top-level list is not an object of arguments, but is rejected before it is decoded
+    with pytest.raises(json_configparser.LimitExceededError) as e:
+        args_object.parse_json(write_json([1] * 100))
+    assert e.value.limit_name == "max_arg_elements"
+
+    args_object = json_configparser.ConfigArgs(Options, limits_obj=json_configparser.Limits(max_elements=5))
+    with pytest.raises(json_configparser.LimitExceededError) as e:
+        args_object.parse_json(write_json([1] * 100))
+    assert e.value.limit_name == "max_elements"
+
+
+def test_scan_does_not_copy_document():
+    text = json.dumps({"a": ["x" * 1000 + ',[\\"]'] * 2000, "b": [1] * 1000})
+    tracker = json_configparser.Limits(max_depth=3, max_arg_elements=3000).start()
+
+    tracemalloc.start()
+    try:
+        tracker.check_json_text(text)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < len(text) // 10
+
+
+def test_max_elements_with_executor():
+    limits_obj = json_configparser.Limits(max_elements=30)
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, limits_obj=limits_obj)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(json_configparser.LimitExceededError):
+            args_object.parse_json("tests/data/valid.json", executor=executor, parallel_min_size=2)
+
+
+def test_limits_per_jsonl_line():
+    limits_obj = json_configparser.Limits(max_arg_elements=5)
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, limits_obj=limits_obj)
+
+    for line_result in args_object.iter_jsonl("tests/data/mixed.jsonl"):
+        assert not line_result.ok
+
+
+def test_error_pickle():
+    error = limits.LimitExceededError("max_depth", 3, "too deep")
+    unpickled = pickle.loads(pickle.dumps(error))
+
+    assert isinstance(unpickled, ValueError)
+    assert (unpickled.limit_name, unpickled.limit, str(unpickled)) == ("max_depth", 3, "too deep")
@@ -0,0 +1,73 @@
+import array
+import json
+import sys
+import tracemalloc
+from typing import NamedTuple, List, Dict
+
+import pytest
+
+import json_configparser
+from json_configparser import memory
+
+
+class OptionsMemory(NamedTuple):
+    values: List[float]
+    names: Dict[str, str]
+    count: int = 1
+
+
+memory_args = {"values": [float(i) for i in range(1000)], "names": {"a": "first", "b": "second"}}
+
+
+def test_deep_sizeof():
+    assert memory.deep_sizeof(1.5) == sys.getsizeof(1.5)
+
+    shared = "x" * 100
+    value = [shared, shared]
+    assert memory.deep_sizeof(value) == sys.getsizeof(value) + sys.getsizeof(shared)
+    assert memory.deep_sizeof({"a": value}) > memory.deep_sizeof(value)
+
+    frozen = json_configparser.FrozenDict({"a": value})
+    assert memory.deep_sizeof(frozen) > memory.deep_sizeof({"a": value})
+
+    table = json_configparser.ColumnTable({"a": [1.5] * 1000})
+    assert memory.deep_sizeof(table) > sys.getsizeof(array.array("d", [1.5] * 1000))
+
+    seen = set()
+    first = memory.deep_sizeof(value, seen)
+    assert memory.deep_sizeof(value, seen) == 0 and first > 0
+
+
+def test_parse_json_memory(write_json):
+    was_tracing = tracemalloc.is_tracing()
+    args_object = json_configparser.ConfigArgs(OptionsMemory, extra_validations=lambda args: None)
+    result, report = args_object.parse_json_memory(write_json(memory_args))
+
+    assert result == memory_args
+    assert tracemalloc.is_tracing() == was_tracing
+    assert report.file_size == len(json.dumps(memory_args))
+    assert report.decode_peak > 0 and report.validation_peak > 0 and report.copy_peak > 0
+    assert report.peak == max(report.decode_peak, report.validation_peak, report.copy_peak)
+    assert set(report.argument_sizes) == {"values", "names"}
+    assert report.argument_sizes["values"] > report.argument_sizes["names"]
+    assert report.total_size >= report.argument_sizes["values"]
+    assert report.amplification > 1
+    assert "values" in report.summary()
+
+
+def test_parse_json_memory_frozen_without_copy(write_json):
+    args_object = json_configparser.ConfigArgs(OptionsMemory, frozen=True)
+    result, report = args_object.parse_json_memory(write_json(memory_args))
+
+    assert result["count"] == 1
+    assert report.copy_peak == 0
+    assert set(report.argument_sizes) == {"values", "names", "count"}
+
+
+def test_parse_json_memory_invalid(write_json):
+    was_tracing = tracemalloc.is_tracing()
+    args_object = json_configparser.ConfigArgs(OptionsMemory)
+
+    with pytest.raises(TypeError):
+        args_object.parse_json_memory(write_json(dict(memory_args, values="a")))
+    assert tracemalloc.is_tracing() == was_tracing
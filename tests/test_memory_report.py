@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+from json_configparser import memory_report
+
+
+def test_main(write_json, capsys):
+    path_to_json = write_json({"values": [float(i) for i in range(1000)], "names": {"a": "first"}})
+
+    assert memory_report.main(["tests.test_memory:OptionsMemory", path_to_json]) == 0
+    assert "validation peak" in capsys.readouterr().out
+    assert memory_report.main(["tests.test_memory:OptionsMemory", path_to_json, "--max-amplification", "1"]) == 1
+    assert "exceeds" in capsys.readouterr().err
+
+    path_to_json = write_json({"values": [1.0]})
+    assert memory_report.main(["tests.test_memory:OptionsMemory", path_to_json]) == 1
+    assert "ValueError" in capsys.readouterr().err
+
+
+def test_daemon_not_imported():
+    code = "import sys, json_configparser.memory_report; print('json_configparser.daemon' in sys.modules)"
+    output = subprocess.check_output([sys.executable, "-c", code], universal_newlines=True)
+
+    assert output.strip() == "False"
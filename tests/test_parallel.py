@@ -0,0 +1,24 @@
+from concurrent.futures import Executor
+
+import pytest
+
+from json_configparser import parallel
+
+
+@pytest.mark.parametrize("value,expected", [(5, 1),
+                                            ("abc", 1),
+                                            ([], 1),
+                                            ([1, 2, 3], 3),
+                                            ({"a": 1, "b": 2}, 2),
+                                            ([[1, 2], [3, 4], [5, 6]], 6),
+                                            ({"a": [{"a": 1, "b": 2}] * 4}, 8)])
+def test_estimate_size(value, expected):
+    assert parallel.estimate_size(value) == expected
+
+
+def test_create_executor():
+    executor = parallel.create_executor(max_workers=1)
+    try:
+        assert isinstance(executor, Executor)
+    finally:
+        executor.shutdown()
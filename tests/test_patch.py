@@ -0,0 +1,199 @@
+from typing import NamedTuple, List, Dict
+
+import pytest
+
+import json_configparser
+from json_configparser import collection_constraints
+from json_configparser import patch
+
+
+class OptionsRouting(NamedTuple):
+    routing: Dict[str, Dict[str, List[int]]]
+    ports: List[int]
+    name: str
+    limits: Dict[str, int] = {"cpu": 2}
+
+
+routing_args = {"routing": {"eu": {"weights": [1, 2], "hosts": [3]}, "us": {"weights": [4]}},
+                "ports": [80, 443], "name": "search"}
+bounds_lst = [json_configparser.Bounds("routing", lower_bound=0, lower_inclusive=True),
+              json_configparser.Bounds("ports", lower_bound=0, upper_bound=65536)]
+collection_constraints_lst = [json_configparser.CollectionConstraints("ports", unique=True, max_length=3)]
+str_constraints_lst = [json_configparser.StringConstraints("routing", pattern="[a-z]+", keys=True)]
+
+
+class OptionsSorted(NamedTuple):
+    levels: List[int]
+    limits: Dict[str, int]
+    extra: Dict[str, int] = None
+
+
+sorted_constraints_lst = [json_configparser.CollectionConstraints("levels", unique=True, sorted_order=True),
+                          json_configparser.CollectionConstraints("limits", required_keys=["cpu"], sorted_order=True)]
+sorted_args = {"levels": [1, 3, 5, 7], "limits": {"cpu": 2, "mem": 4}}
+
+
+def _args_object(**kwargs):
+    return json_configparser.ConfigArgs(OptionsRouting, bounds_lst, str_constraints_lst=str_constraints_lst,
+                                        collection_constraints_lst=collection_constraints_lst, **kwargs)
+
+
+@pytest.mark.parametrize("pointer,tokens", [("/a", ["a"]),
+                                            ("/a/0/b", ["a", "0", "b"]),
+                                            ("/a/b~1c/~0d", ["a", "b/c", "~d"]),
+                                            ("/a/", ["a", ""])])
+def test_parse_pointer(pointer, tokens):
+    assert patch.parse_pointer(pointer) == tokens
+
+
+@pytest.mark.parametrize("pointer", ["", "a/b", None])
+def test_invalid_pointer(pointer):
+    with pytest.raises(ValueError):
+        patch.parse_pointer(pointer)
+
+
+def test_apply_patch_shares_untouched_values():
+    args_object = _args_object()
+    result = args_object.validate_dict(routing_args)
+
+    patched = args_object.apply_patch(result, [{"op": "replace", "path": "/routing/eu/weights/0", "value": 5.0},
+                                               {"op": "add", "path": "/routing/eu/weights/-", "value": 6},
+                                               {"op": "add", "path": "/routing/asia", "value": {"weights": [7]}},
+                                               {"op": "remove", "path": "/routing/us"},
+                                               {"op": "replace", "path": "/name", "value": "index"}])
+
+    assert patched == {"routing": {"eu": {"weights": [5, 2, 6], "hosts": [3]}, "asia": {"weights": [7]}},
+                       "ports": [80, 443], "name": "index"}
+    assert type(patched["routing"]["eu"]["weights"][0]) is int
+    assert patched["ports"] is result["ports"]
+    assert patched["routing"]["eu"]["hosts"] is result["routing"]["eu"]["hosts"]
+
+    # The given result is not modified
+    assert result == routing_args
+
+
+def test_apply_patch_options_instance_and_defaults():
+    args_object = _args_object()
+    args = OptionsRouting(**args_object.validate_dict(routing_args))
+
+    patched = args_object.apply_patch(args, [{"op": "add", "path": "/limits/mem", "value": 4}])
+    assert patched["limits"] == {"cpu": 2, "mem": 4}
+    assert OptionsRouting._field_defaults["limits"] == {"cpu": 2}
+
+    patched = args_object.apply_patch(routing_args, [{"op": "replace", "path": "/limits/cpu", "value": 8}])
+    assert patched["limits"] == {"cpu": 8}
+    assert "limits" not in args_object.apply_patch(patched, [{"op": "remove", "path": "/limits"}])
+
+
+def test_apply_patch_frozen():
+    args_object = _args_object(frozen=True)
+    result = args_object.validate_dict(routing_args)
+
+    patched = args_object.apply_patch(result, [{"op": "add", "path": "/routing/eu/weights/0", "value": 0},
+                                               {"op": "replace", "path": "/limits/cpu", "value": 4}])
+
+    assert isinstance(patched, json_configparser.FrozenDict)
+    assert patched["routing"]["eu"]["weights"] == (0, 1, 2)
+    assert isinstance(patched["routing"]["eu"], json_configparser.FrozenDict)
+    assert patched["routing"]["us"] is result["routing"]["us"]
+    hash(patched)
+
+    assert args_object.apply_patch(patched, [{"op": "remove", "path": "/limits"}])["limits"] == {"cpu": 2}
+
+
+@pytest.mark.parametrize("operation,error", [({"op": "move", "path": "/name", "from": "/name"}, ValueError),
+                                             ({"op": "add", "path": "/name"}, ValueError),
+                                             ({"op": "add", "path": "/unknown", "value": 1}, ValueError),
+                                             ({"op": "remove", "path": "/name"}, ValueError),
+                                             ({"op": "replace", "path": "/name", "value": 1}, TypeError),
+                                             ({"op": "replace", "path": "/name/first", "value": "a"}, ValueError),
+                                             ({"op": "replace", "path": "/routing/asia/weights", "value": [1]},
+                                              ValueError),
+                                             ({"op": "replace", "path": "/ports/2", "value": 8080}, ValueError),
+                                             ({"op": "add", "path": "/ports/01", "value": 8080}, ValueError),
+                                             ({"op": "add", "path": "/ports/-", "value": -1}, ValueError),
+                                             ({"op": "add", "path": "/ports/-", "value": 80}, ValueError),
+                                             ({"op": "add", "path": "/routing/EU", "value": {"weights": [1]}},
+                                              ValueError),
+                                             ({"op": "add", "path": "/routing/eu/weights/0", "value": "a"},
+                                              TypeError),
+                                             ({"op": "remove", "path": "/routing/us/weights/0"}, TypeError),
+                                             ("remove", ValueError)])
+def test_apply_patch_errors(operation, error):
+    args_object = _args_object()
+    result = args_object.validate_dict(routing_args)
+
+    with pytest.raises(error):
+        args_object.apply_patch(result, [operation])
+    assert result == routing_args
+
+
+def test_apply_patch_collection_constraints():
+    args_object = _args_object()
+    result = args_object.validate_dict(routing_args)
+
+    assert args_object.apply_patch(result, [{"op": "add", "path": "/ports/0", "value": 22}])["ports"] == [22, 80, 443]
+    with pytest.raises(ValueError):
+        args_object.apply_patch(result, [{"op": "add", "path": "/ports/0", "value": 22},
+                                         {"op": "add", "path": "/ports/0", "value": 21}])
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("operations,error", [([{"op": "add", "path": "/levels/1", "value": 2}], None),
+                                              ([{"op": "add", "path": "/levels/1", "value": 4}], ValueError),
+                                              ([{"op": "replace", "path": "/levels/0", "value": 5}], ValueError),
+                                              ([{"op": "remove", "path": "/levels/0"},
+                                                {"op": "add", "path": "/levels/0", "value": 6}], ValueError),
+                                              ([{"op": "add", "path": "/levels/0", "value": 0},
+                                                {"op": "replace", "path": "/levels/1", "value": 2}], None),
+                                              ([{"op": "add", "path": "/levels/0", "value": 0},
+                                                {"op": "replace", "path": "/levels/2", "value": 6}], ValueError),
+                                              ([{"op": "remove", "path": "/levels/1"}], None),
+                                              ([{"op": "add", "path": "/limits/net", "value": 1}], None),
+                                              ([{"op": "add", "path": "/limits/a", "value": 1}], ValueError),
+                                              ([{"op": "remove", "path": "/limits/cpu"}], ValueError),
+                                              ([{"op": "replace", "path": "/limits/cpu", "value": 1}], None)])
+def test_apply_patch_checks_changed_elements(monkeypatch, frozen, operations, error):
+    args_object = json_configparser.ConfigArgs(OptionsSorted, frozen=frozen,
+                                               collection_constraints_lst=sorted_constraints_lst)
+    result = args_object.validate_dict(sorted_args)
+
+    # Only the changed elements are checked, rather than every element of the touched arguments
+    monkeypatch.setattr(collection_constraints.CollectionConstraints, "element_checker", None)
+    if error is None:
+        patched = args_object.apply_patch(result, operations)
+        monkeypatch.undo()
+        args_object.validate_dict({arg_name: patched[arg_name] for arg_name in sorted_args})
+    else:
+        with pytest.raises(error):
+            args_object.apply_patch(result, operations)
+
+
+def test_apply_patch_none_default():
+    args_object = json_configparser.ConfigArgs(OptionsSorted)
+
+    with pytest.raises(ValueError, match="/extra/x does not exist"):
+        args_object.apply_patch(sorted_args, [{"op": "add", "path": "/extra/x", "value": 1}])
+    assert args_object.apply_patch(sorted_args, [{"op": "add", "path": "/extra", "value": {"x": 1}}])["extra"] == \
+        {"x": 1}
+
+
+def test_apply_patch_extra_validations():
+    def check_name(args):
+        if args["name"] == "forbidden":
+            raise ValueError("Forbidden name")
+
+    args_object = _args_object(validators_lst=[json_configparser.Validator("name", check_name, ["name"])])
+    result = args_object.validate_dict(routing_args)
+
+    with pytest.raises(ValueError, match="Forbidden"):
+        args_object.apply_patch(result, [{"op": "replace", "path": "/name", "value": "forbidden"}])
+
+
+def test_apply_patch_invalid_arguments():
+    args_object = _args_object()
+
+    with pytest.raises(TypeError):
+        args_object.apply_patch([routing_args], [])
+    with pytest.raises(TypeError):
+        args_object.apply_patch(routing_args, {"op": "remove", "path": "/limits"})
@@ -0,0 +1,104 @@
+import enum
+from typing import NamedTuple, List, Dict
+
+import pytest
+
+import json_configparser
+
+
+class OptionsRouting(NamedTuple):
+    routing: Dict[str, Dict[str, List[int]]]
+    name: str
+    limits: Dict[str, int] = {"cpu": 2}
+
+
+routing_args = {"routing": {"eu": {"weights": [1, 2], "hosts": [3]}, "us": {"weights": [4]}}, "name": "search"}
+args_object = json_configparser.ConfigArgs(OptionsRouting)
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_lookups(frozen):
+    result = json_configparser.ConfigArgs(OptionsRouting, frozen=frozen).validate_dict(routing_args)
+    view = args_object.create_path_view(result)
+
+    assert view["routing.eu.weights"] == view[("routing", "eu", "weights")] == result["routing"]["eu"]["weights"]
+    assert view["routing.eu"] is result["routing"]["eu"]
+    assert view["name"] == "search"
+    assert view["limits.cpu"] == 2
+    assert view.get("routing.asia") is None and view.get("routing.asia", 1) == 1
+    assert "routing.us.weights" in view and "routing.us.hosts" not in view and 1 not in view
+    assert len(view) == 9
+
+    with pytest.raises(KeyError):
+        view["routing.asia"]
+    with pytest.raises(TypeError):
+        view[()]
+
+
+def test_dotted_keys():
+    view = args_object.create_path_view({"routing": {"eu.west": {"weights": [1]}}, "name": "search"})
+
+    assert view[("routing", "eu.west", "weights")] == [1]
+    assert "routing.eu.west.weights" not in view
+
+
+def test_check_path_and_getter():
+    view = args_object.create_path_view(routing_args)
+
+    assert view.check_path("routing.asia.weights") == List[int]
+    assert view.check_path("limits") == Dict[str, int]
+
+    for path in ["unknown", "routing.eu.weights.first", "name.first"]:
+        with pytest.raises(KeyError):
+            view.check_path(path)
+        with pytest.raises(KeyError):
+            view.getter(path)
+
+    weights = view.getter("routing.eu.weights")
+    assert weights() == [1, 2]
+    with pytest.raises(KeyError):
+        view.getter("routing.asia.weights")()
+
+
+def test_iter_prefix():
+    view = args_object.create_path_view(routing_args)
+
+    assert list(view.iter_prefix("routing")) == [(("routing", "eu", "weights"), [1, 2]),
+                                                 (("routing", "eu", "hosts"), [3]),
+                                                 (("routing", "us", "weights"), [4])]
+    assert list(view.iter_prefix("name")) == [(("name",), "search")]
+    with pytest.raises(KeyError):
+        list(view.iter_prefix("routing.asia"))
+
+
+def test_attrs():
+    view = args_object.create_path_view(OptionsRouting(**routing_args))
+
+    assert view.attrs.routing.eu.weights == [1, 2]
+    assert view.attrs.limits.cpu == 2
+    assert sorted(dir(view.attrs.routing)) == ["eu", "us"]
+    with pytest.raises(AttributeError):
+        view.attrs.routing.asia
+
+
+def test_invalid_result():
+    with pytest.raises(TypeError):
+        args_object.create_path_view([routing_args])
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"frozen": True}, {"fill_defaults": True}])
+def test_validated_defaults(kwargs):
+    class Color(enum.Enum):
+        RED = "red"
+
+    class OptionsDefaults(NamedTuple):
+        name: str
+        ratio: float = 1
+        color: Color = "red"
+        limits: Dict[str, int] = {"cpu": 2}
+
+    view = json_configparser.ConfigArgs(OptionsDefaults, **kwargs).create_path_view({"name": "search"})
+
+    assert view["ratio"] == 1.0 and type(view["ratio"]) is float
+    assert view["color"] is Color.RED
+    assert view["limits.cpu"] == 2
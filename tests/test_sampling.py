@@ -0,0 +1,89 @@
+from typing import NamedTuple, List, Dict
+
+import pytest
+
+import json_configparser
+from json_configparser import sampling
+
+
+class OptionsLarge(NamedTuple):
+    name: str
+    values: List[float]
+    weights: Dict[str, int]
+    small: List[int]
+
+
+def _large_args(n=100):
+    return {"name": "large", "values": list(range(n)), "weights": {str(i): i for i in range(n)}, "small": [1, 2]}
+
+
+@pytest.mark.parametrize("kwargs,error", [({"min_size": 10.0}, TypeError),
+                                          ({"sample_size": "2"}, TypeError),
+                                          ({"seed": 1.5}, TypeError),
+                                          ({"sample_size": 1}, ValueError),
+                                          ({"min_size": 10, "sample_size": 10}, ValueError)])
+def test_invalid_policy(kwargs, error):
+    with pytest.raises(error):
+        json_configparser.SamplingPolicy(**kwargs)
+
+
+@pytest.mark.parametrize("seed", [None, 7])
+def test_sample_indexes(seed):
+    policy = json_configparser.SamplingPolicy(min_size=10, sample_size=5, seed=seed)
+
+    assert policy.start().sample_indexes("small", 9) is None
+
+    sampler = policy.start()
+    indexes = sampler.sample_indexes("large", 100)
+    assert len(indexes) == 5 and indexes[0] == 0 and indexes[-1] == 99 and indexes == sorted(set(indexes))
+    assert policy.start().sample_indexes("large", 100) == indexes
+    assert sampler.report().containers == [sampling.SampledContainer("large", 100, 5)]
+
+    if seed is None:
+        assert indexes == [0, 25, 50, 74, 99]
+
+
+def test_parse_json_sampled(write_json):
+    args_object = json_configparser.ConfigArgs(OptionsLarge)
+    policy = json_configparser.SamplingPolicy(min_size=10, sample_size=4)
+
+    result, report = args_object.parse_json_sampled(write_json(_large_args()), policy)
+
+    assert result == _large_args()
+    assert report.policy is policy and not report.fully_validated
+    assert [container.name for container in report.containers] == ["values", "weights"]
+
+    # Only the sampled elements are converted
+    assert [type(result["values"][i]) for i in [0, 1, 33, 99]] == [float, int, float, float]
+
+
+def test_parse_json_sampled_errors(write_json):
+    args_object = json_configparser.ConfigArgs(OptionsLarge)
+    policy = json_configparser.SamplingPolicy(min_size=10, sample_size=4)
+
+    # Unsampled elements are not validated
+    args = _large_args()
+    args["values"][1] = "invalid"
+    assert args_object.parse_json_sampled(write_json(args), policy)[0]["values"][1] == "invalid"
+
+    # Sampled elements, small containers, and scalar arguments are
+    for arg_name, value in [("values", ["invalid"] + list(range(99))),
+                            ("weights", dict(_large_args()["weights"], **{"99": "invalid"})),
+                            ("small", [1, "invalid"]),
+                            ("name", 1)]:
+        with pytest.raises(TypeError):
+            args_object.parse_json_sampled(write_json(dict(_large_args(), **{arg_name: value})), policy)
+
+    with pytest.raises(ValueError):
+        args_object.parse_json_sampled(write_json(dict(_large_args(), unknown=1)), policy)
+    with pytest.raises(TypeError):
+        args_object.parse_json_sampled(write_json(_large_args()), None)
+
+
+def test_parse_json_sampled_fully_validated(write_json):
+    args_object = json_configparser.ConfigArgs(OptionsLarge)
+    policy = json_configparser.SamplingPolicy(min_size=1000, sample_size=4)
+
+    result, report = args_object.parse_json_sampled(write_json(_large_args()), policy)
+    assert report.fully_validated
+    assert result == args_object.parse_json(write_json(_large_args()))
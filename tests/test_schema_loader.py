@@ -0,0 +1,34 @@
+from typing import NamedTuple, List
+
+import pytest
+
+import json_configparser
+from json_configparser import schema_loader
+
+
+class OptionsSchema(NamedTuple):
+    name: str
+    ports: List[int]
+
+
+bounded_args = json_configparser.ConfigArgs(OptionsSchema, [json_configparser.Bounds("ports", lower_bound=0)])
+
+
+class Schemas(object):
+    bounded_args = bounded_args
+
+
+def test_load_schema():
+    assert schema_loader.load_schema("tests.test_schema_loader:OptionsSchema").options_class is OptionsSchema
+    assert schema_loader.load_schema("tests.test_schema_loader:bounded_args") is bounded_args
+    assert schema_loader.load_schema("tests.test_schema_loader:Schemas.bounded_args") is bounded_args
+
+
+@pytest.mark.parametrize("schema,error", [("tests.test_schema_loader", ValueError),
+                                          (":OptionsSchema", ValueError),
+                                          ("tests.test_schema_loader:bounded_args.frozen", TypeError),
+                                          ("tests.test_schema_loader:Unknown", AttributeError),
+                                          ("tests.unknown_module:OptionsSchema", ImportError)])
+def test_invalid_schema(schema, error):
+    with pytest.raises(error):
+        schema_loader.load_schema(schema)
@@ -0,0 +1,124 @@
+import enum
+import multiprocessing
+import pickle
+
+import pytest
+
+import json_configparser
+from json_configparser import shared_config
+from .data import option_defs
+
+
+requires_shared_memory = pytest.mark.skipif(shared_config.shared_memory is None,
+                                            reason="multiprocessing.shared_memory is not available")
+
+
+def _parse_valid():
+    return json_configparser.ConfigArgs(option_defs.OptionsOnly).parse_json("tests/data/valid.json")
+
+
+def _sum_shared_a5(name, queue):
+    with json_configparser.SharedConfig.attach(name) as shared:
+        queue.put((sum(shared.args["a5"]), shared.args["a3"]))
+
+
+@requires_shared_memory
+def test_publish_attach():
+    args_dict = _parse_valid()
+
+    with json_configparser.SharedConfig.publish(args_dict) as published:
+        attached = json_configparser.SharedConfig.attach(published.name)
+        args = attached.args
+
+        assert isinstance(args["a5"], memoryview) and args["a5"].readonly
+        assert list(args["a5"]) == args_dict["a5"]
+        assert list(args["a6"]) == args_dict["a6"]
+        assert args["a8"] == tuple(args_dict["a8"])
+        assert args["a15"] == args_dict["a15"] and isinstance(args["a15"]["a"], json_configparser.FrozenDict)
+        assert set(args) == set(args_dict)
+
+        # Nested lists of ints are shared buffers too
+        assert all(isinstance(el, memoryview) for el in args["a13"])
+        assert [list(el) for el in args["a13"]] == args_dict["a13"]
+        assert {key: list(el) for key, el in args["a16"].items()} == args_dict["a16"]
+
+        with pytest.raises(TypeError):
+            args["a5"][0] = 1
+        with pytest.raises(TypeError):
+            args["a1"] = 1
+        with pytest.raises(TypeError):
+            args["a15"]["a"]["a"] = 999
+        with pytest.raises(TypeError):
+            args["a16"]["a"][0] = 999
+
+        del args
+        attached.close()
+
+
+@requires_shared_memory
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="fork is not available")
+def test_attach_from_forked_worker():
+    args_dict = _parse_valid()
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+
+    with json_configparser.SharedConfig.publish(args_dict) as published:
+        worker = context.Process(target=_sum_shared_a5, args=(published.name, queue))
+        worker.start()
+        result = queue.get(timeout=10)
+        worker.join()
+
+    assert result == (sum(args_dict["a5"]), args_dict["a3"])
+
+
+@requires_shared_memory
+def test_publish_invalid_args():
+    with pytest.raises(TypeError):
+        json_configparser.SharedConfig.publish([1, 2])
+
+
+@requires_shared_memory
+def test_unlinked_after_close():
+    published = json_configparser.SharedConfig.publish(_parse_valid())
+    name = published.name
+    published.close()
+
+    with pytest.raises(FileNotFoundError):
+        json_configparser.SharedConfig.attach(name)
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+@requires_shared_memory
+def test_publish_non_json_values():
+    table = json_configparser.ColumnTable({"x": [1, 2], "y": ["a", "b"]})
+
+    with json_configparser.SharedConfig.publish({"color": _Color.RED, "rows": table}) as published:
+        attached = json_configparser.SharedConfig.attach(published.name)
+        assert attached.args["color"] == "red"
+        assert [dict(row) for row in attached.args["rows"]] == [{"x": 1, "y": "a"}, {"x": 2, "y": "b"}]
+        attached.close()
+
+    with pytest.raises(TypeError):
+        json_configparser.SharedConfig.publish({"a": object()})
+
+
+@requires_shared_memory
+@pytest.mark.parametrize("index", [pickle.dumps({"values": {}, "buffers": []}),
+                                   b'{"values": {"a": ["b", 0]}, "buffers": []}',
+                                   b'{"values": {"a": ["x", 0]}, "buffers": []}',
+                                   b'{"values": {}, "buffers": [[0, 1000000, "d"]]}',
+                                   b'{"values": {}, "buffers": [[0, 1, "O"]]}'])
+def test_attach_malformed_index(index):
+    with json_configparser.SharedConfig.publish({"a": "a" * 200}) as published:
+        # Another process could write anything in the block, which must never be unpickled
+        shm = published._shm
+        shared_config._HEADER.pack_into(shm.buf, 0, shared_config._MAGIC, len(index))
+        shm.buf[shared_config._HEADER.size:shared_config._HEADER.size + len(index)] = index
+
+        attached = json_configparser.SharedConfig.attach(published.name)
+        with pytest.raises(ValueError):
+            attached.args
+        attached.close()
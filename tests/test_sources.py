@@ -0,0 +1,216 @@
+import hashlib
+import http.server
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import zipfile
+
+import pytest
+
+import json_configparser
+from json_configparser import sources
+from .data import option_defs
+
+with open("tests/data/valid.json", "rb") as valid_file:
+    valid_json = valid_file.read()
+
+
+class _ConfigHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.requests.append(self.headers.get("If-None-Match", None))
+        etag = '"{}"'.format(hashlib.sha1(self.server.body).hexdigest())
+
+        if self.headers.get("If-None-Match", None) == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.server.body)))
+        self.end_headers()
+        self.wfile.write(self.server.body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ConfigServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _ConfigHandler)
+        self.body = valid_json
+        self.requests = []
+        self.connections = 0
+
+    def get_request(self):
+        self.connections += 1
+        return super().get_request()
+
+
+@pytest.fixture
+def config_server():
+    server = _ConfigServer()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    sources._connection_pool.clear()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def args_object():
+    return json_configparser.ConfigArgs(option_defs.OptionsOnly)
+
+
+def test_file_source(tmp_path, args_object):
+    path_to_json = tmp_path / "args.json"
+    path_to_json.write_bytes(valid_json)
+    source = json_configparser.FileSource(str(path_to_json))
+
+    first = args_object.parse_source(source)
+    assert first == json.loads(valid_json)
+
+    # Cached results are copied, so modifying a result does not change the next ones
+    first["a1"] = 7
+    first["a5"].append(-1)
+    second = args_object.parse_source(source)
+    assert second == json.loads(valid_json) and second is not first
+
+    path_to_json.write_text(json.dumps(dict(second, a1=7)))
+    os.utime(str(path_to_json), ns=(1, 1))
+    assert args_object.parse_source(source)["a1"] == 7
+
+
+def test_file_source_frozen(tmp_path):
+    path_to_json = tmp_path / "args.json"
+    path_to_json.write_bytes(valid_json)
+    source = json_configparser.FileSource(str(path_to_json))
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsOnly, frozen=True)
+
+    first = args_object.parse_source(source)
+    assert args_object.parse_source(source) is first
+
+
+def test_directory_source(tmp_path, args_object):
+    valid_dict = json.loads(valid_json)
+    (tmp_path / "01.json").write_text(json.dumps({k: v for k, v in valid_dict.items() if k < "a3"}))
+    (tmp_path / "02.json").write_text(json.dumps({k: v for k, v in valid_dict.items() if k >= "a3"}))
+    (tmp_path / "ignored.txt").write_text("not json")
+    source = json_configparser.DirectorySource(str(tmp_path))
+
+    first = args_object.parse_source(source)
+    assert first == valid_dict
+    assert args_object.parse_source(source) == first
+
+    (tmp_path / "03.json").write_text(json.dumps({"a1": 1}))
+    with pytest.raises(ValueError):
+        args_object.parse_source(source)
+
+
+def test_zip_member_source(tmp_path, args_object):
+    zip_path = str(tmp_path / "bundle.zip")
+    with zipfile.ZipFile(zip_path, "w") as zip_file:
+        zip_file.writestr("configs/args.json", valid_json)
+        zip_file.writestr("other.json", "{}")
+    source = json_configparser.ZipMemberSource(zip_path, "configs/args.json")
+
+    first = args_object.parse_source(source)
+    assert first == json.loads(valid_json)
+
+    # Rewriting the archive with the same member content keeps the cached result
+    with zipfile.ZipFile(zip_path, "w") as zip_file:
+        zip_file.writestr("configs/args.json", valid_json)
+    assert args_object.parse_source(source) == first
+
+
+def test_http_source(config_server, args_object):
+    url = "http://127.0.0.1:{}/configs/args.json".format(config_server.server_address[1])
+    source = json_configparser.HttpSource(url)
+
+    first = args_object.parse_source(source)
+    assert first == json.loads(valid_json)
+    assert args_object.parse_source(source) == first
+    assert config_server.requests[0] is None and config_server.requests[1] is not None
+
+    config_server.body = json.dumps(dict(first, a1=7)).encode("utf-8")
+    assert args_object.parse_source(source)["a1"] == 7
+
+    # All requests reused the same keep-alive connection
+    assert len(config_server.requests) == 3
+    assert config_server.connections == 1
+
+
+def test_http_source_error(config_server, args_object):
+    url = "http://127.0.0.1:{}/args.json".format(config_server.server_address[1])
+    config_server.body = b"[1, 2]"
+
+    with pytest.raises(TypeError):
+        args_object.parse_source(json_configparser.HttpSource(url))
+
+
+@pytest.mark.parametrize("url", ["ftp://host/args.json", "args.json"])
+def test_http_source_invalid_url(url):
+    with pytest.raises(ValueError):
+        json_configparser.HttpSource(url)
+
+
+def test_invalid_source(args_object):
+    with pytest.raises(TypeError):
+        args_object.parse_source("tests/data/valid.json")
+
+
+def test_abstract_source():
+    with pytest.raises(TypeError):
+        sources.ConfigSource()
+
+
+@pytest.mark.parametrize("error", [socket.timeout("timed out"), OSError("unreachable"), ConnectionResetError()])
+def test_http_source_closes_connection(config_server, monkeypatch, error):
+    url = "http://127.0.0.1:{}/configs/args.json".format(config_server.server_address[1])
+    connections = []
+
+    def request(connection, *args, **kwargs):
+        connections.append(connection)
+        connection.connect()
+        raise error
+
+    closed = []
+    close = http.client.HTTPConnection.close
+    monkeypatch.setattr(http.client.HTTPConnection, "request", request)
+    monkeypatch.setattr(http.client.HTTPConnection, "close",
+                        lambda connection: closed.append(connection) or close(connection))
+
+    with pytest.raises(type(error)):
+        json_configparser.HttpSource(url).fetch()
+
+    # Connection errors are retried once with a new connection, other errors are not
+    assert len(connections) == (2 if isinstance(error, ConnectionError) else 1)
+    assert all(connection in closed and connection.sock is None for connection in connections)
+
+
+class _NotModifiedSource(sources.ConfigSource):
+    def fetch(self, known_version=None):
+        return None
+
+
+def test_unchanged_source_never_parsed(args_object):
+    with pytest.raises(OSError):
+        args_object.parse_source(_NotModifiedSource())
+
+
+def test_source_modules_not_imported_with_package():
+    code = "import sys, json_configparser; print([name in sys.modules for name in ['http.client', 'zipfile']])"
+    output = subprocess.check_output([sys.executable, "-c", code], universal_newlines=True)
+
+    assert output.strip() == "[False, False]"
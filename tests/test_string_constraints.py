@@ -0,0 +1,119 @@
+from typing import NamedTuple, List, Dict
+
+import pytest
+
+import json_configparser
+from json_configparser import string_constraints
+
+
+class OptionsStrings(NamedTuple):
+    name: str
+    hosts: List[str]
+    routes: Dict[str, Dict[str, str]]
+    weights: Dict[str, int]
+    region: str = "eu-west"
+
+
+valid_strings = {"name": "search", "hosts": ["srv-01", "srv-02"],
+                 "routes": {"r-1": {"r-a": "srv-01"}, "r-2": {"r-b": "srv-02"}}, "weights": {"r-1": 1}}
+
+valid_constraints_lst = [json_configparser.StringConstraints("name", min_length=1, max_length=10),
+                         json_configparser.StringConstraints("hosts", pattern=r"srv-\d+", prefix="srv-"),
+                         json_configparser.StringConstraints("routes", pattern=r"srv-\d+"),
+                         json_configparser.StringConstraints("routes", prefix="r-", keys=True),
+                         json_configparser.StringConstraints("weights", pattern=r"r-\d", keys=True),
+                         json_configparser.StringConstraints("region", pattern=r"[a-z]+-[a-z]+")]
+
+
+@pytest.mark.parametrize("kwargs", [{"pattern": "a+"},
+                                    {"min_length": 0},
+                                    {"max_length": 5},
+                                    {"min_length": 5, "max_length": 5},
+                                    {"prefix": "a", "keys": True}])
+def test_valid_creation(kwargs):
+    json_configparser.StringConstraints("valid", **kwargs)
+
+
+@pytest.mark.parametrize("arg_name,kwargs", [(None, {"pattern": "a"}),
+                                             ("valid", {"pattern": 1}),
+                                             ("valid", {"min_length": 1.0}),
+                                             ("valid", {"max_length": True}),
+                                             ("valid", {"prefix": 1}),
+                                             ("valid", {"prefix": "a", "keys": 1})])
+def test_wrong_types(arg_name, kwargs):
+    with pytest.raises(TypeError):
+        json_configparser.StringConstraints(arg_name, **kwargs)
+
+
+@pytest.mark.parametrize("arg_name,kwargs", [("  ", {"pattern": "a"}),
+                                             ("valid", {}),
+                                             ("valid", {"pattern": "("}),
+                                             ("valid", {"min_length": -1}),
+                                             ("valid", {"min_length": 5, "max_length": 4})])
+def test_wrong_values(arg_name, kwargs):
+    with pytest.raises(ValueError):
+        json_configparser.StringConstraints(arg_name, **kwargs)
+
+
+@pytest.mark.parametrize("value,kwargs", [("abc", {"pattern": "[a-c]+"}),
+                                          ("abc", {"min_length": 3, "max_length": 3}),
+                                          ("abc", {"prefix": "ab"})])
+def test_valid_values(value, kwargs):
+    json_configparser.StringConstraints("valid", **kwargs).validate_value(value)
+
+
+@pytest.mark.parametrize("value,kwargs", [("abcd", {"pattern": "[a-c]+"}),
+                                          ("xabc", {"pattern": "[a-c]+"}),
+                                          ("ab", {"min_length": 3}),
+                                          ("abcd", {"max_length": 3}),
+                                          ("abc", {"prefix": "b"})])
+def test_invalid_values(value, kwargs):
+    with pytest.raises(ValueError):
+        json_configparser.StringConstraints("valid", **kwargs).validate_value(value)
+
+
+def test_shared_compiled_patterns():
+    first = json_configparser.StringConstraints("first", pattern=r"[a-z]{3}\d")
+    second = json_configparser.StringConstraints("second", pattern=r"[a-z]{3}\d")
+
+    assert first._compiled_pattern is second._compiled_pattern
+    assert string_constraints._compile_pattern.cache_info().maxsize == string_constraints.PATTERN_CACHE_SIZE
+
+
+def test_valid_config(write_json):
+    args_object = json_configparser.ConfigArgs(OptionsStrings, str_constraints_lst=valid_constraints_lst)
+    assert args_object.parse_json(write_json(valid_strings)) == valid_strings
+
+
+@pytest.mark.parametrize("arg_name,value", [("name", ""),
+                                            ("name", "a" * 11),
+                                            ("hosts", ["srv-01", "srv-x"]),
+                                            ("routes", {"r-1": {"r-a": "db-01"}}),
+                                            ("routes", {"r-1": {"a": "srv-01"}}),
+                                            ("routes", {"x-1": {"r-a": "srv-01"}}),
+                                            ("routes", {"r-1": {"r-a": "srv-01"}, "r-2": {"r-b": "srv"}}),
+                                            ("weights", {"r-10": 1})])
+def test_invalid_config(write_json, arg_name, value):
+    args_object = json_configparser.ConfigArgs(OptionsStrings, str_constraints_lst=valid_constraints_lst)
+
+    with pytest.raises(ValueError):
+        args_object.parse_json(write_json(dict(valid_strings, **{arg_name: value})))
+
+
+@pytest.mark.parametrize("constraints_lst,error", [([json_configparser.StringConstraints("unknown", prefix="a")],
+                                                    ValueError),
+                                                   ([json_configparser.StringConstraints("weights", prefix="a")],
+                                                    TypeError),
+                                                   ([json_configparser.StringConstraints("hosts", prefix="a",
+                                                                                         keys=True)],
+                                                    TypeError),
+                                                   ([json_configparser.StringConstraints("name", prefix="a"),
+                                                     json_configparser.StringConstraints("name", max_length=2)],
+                                                    ValueError),
+                                                   ([json_configparser.StringConstraints("region", prefix="us")],
+                                                    ValueError),
+                                                   (json_configparser.StringConstraints("name", prefix="a"),
+                                                    TypeError)])
+def test_invalid_constraints_lst(constraints_lst, error):
+    with pytest.raises(error):
+        json_configparser.ConfigArgs(OptionsStrings, str_constraints_lst=constraints_lst)
@@ -253,3 +253,20 @@ def test_int_value_float_arg(value, typedef, expected):
 def test_int_float_conversion_bound_check(value, typedef):
     with pytest.raises(ValueError):
         validations.validate_argument(value, typedef)
+
+
+@pytest.mark.parametrize("value,typedef", [([1, 2], default_list_int),
+                                           ([[1, 2], [3, 4]], default_list_list_int),
+                                           ({"a": {"a": 1}, "b": {"b": 2}}, default_dict_dict_int),
+                                           ({"a": 1.5, "b": 2.5}, default_dict_float)])
+def test_no_copy_without_conversion(value, typedef):
+    assert validations.validate_argument(value, typedef) is value
+
+
+def test_copy_only_converted_subtrees():
+    value = {"a": [1, 2], "b": [3, 4.0]}
+    validated = validations.validate_argument(value, default_dict_list_int)
+
+    assert validated == {"a": [1, 2], "b": [3, 4]} and type(validated["b"][1]) is int
+    assert validated is not value and validated["a"] is value["a"] and validated["b"] is not value["b"]
+    assert value == {"a": [1, 2], "b": [3, 4.0]} and type(value["b"][1]) is float
@@ -0,0 +1,186 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, List, Dict
+
+import pytest
+
+import json_configparser
+from json_configparser import validators
+
+
+class OptionsRouting(NamedTuple):
+    routes: Dict[str, List[str]]
+    replicas: int
+    debug: bool = False
+
+
+valid_routing = {"routes": {"a": ["b"], "b": ["c"], "c": ["a"]}, "replicas": 2}
+
+
+class _Recorder(object):
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def check_routes(self, args):
+        with self.lock:
+            self.calls.append(("routes", args))
+        for node, targets in args["routes"].items():
+            if node in targets:
+                raise ValueError("Route {} points to itself".format(node))
+
+    def check_replicas(self, args):
+        with self.lock:
+            self.calls.append(("replicas", args))
+        if args["replicas"] > len(args["routes"]):
+            raise ValueError("More replicas than routes")
+
+
+def _validators_lst(recorder):
+    return [json_configparser.Validator("routes", recorder.check_routes, ["routes"]),
+            json_configparser.Validator("replicas", recorder.check_replicas, ["replicas", "routes"])]
+
+
+@pytest.mark.parametrize("name,function,arg_names,error", [(None, len, ["a"], TypeError),
+                                                           ("  ", len, ["a"], ValueError),
+                                                           ("valid", 1, ["a"], TypeError),
+                                                           ("valid", lambda a, b: None, ["a"], ValueError),
+                                                           ("valid", len, "a", TypeError),
+                                                           ("valid", len, [1], TypeError),
+                                                           ("valid", len, [], ValueError),
+                                                           ("valid", len, ["a", "a"], ValueError)])
+def test_invalid_creation(name, function, arg_names, error):
+    with pytest.raises(error):
+        json_configparser.Validator(name, function, arg_names)
+
+
+@pytest.mark.parametrize("validators_lst,error", [(json_configparser.Validator("a", len, ["replicas"]), TypeError),
+                                                  ([len], TypeError),
+                                                  ([json_configparser.Validator("a", len, ["unknown"])], ValueError),
+                                                  ([json_configparser.Validator("a", len, ["replicas"]),
+                                                    json_configparser.Validator("a", len, ["routes"])], ValueError)])
+def test_invalid_validators_lst(validators_lst, error):
+    with pytest.raises(error):
+        json_configparser.ConfigArgs(OptionsRouting, validators_lst=validators_lst)
+
+
+def test_validators_receive_declared_args(write_json):
+    recorder = _Recorder()
+    args_object = json_configparser.ConfigArgs(OptionsRouting, validators_lst=_validators_lst(recorder))
+
+    assert args_object.parse_json(write_json(valid_routing)) == valid_routing
+    assert recorder.calls == [("routes", {"routes": valid_routing["routes"]}),
+                              ("replicas", {"replicas": 2, "routes": valid_routing["routes"]})]
+
+
+def test_validators_errors(write_json):
+    args_object = json_configparser.ConfigArgs(OptionsRouting, validators_lst=_validators_lst(_Recorder()))
+
+    with pytest.raises(ValueError, match="itself"):
+        args_object.parse_json(write_json(dict(valid_routing, routes={"a": ["a"]}, replicas=9)))
+    with pytest.raises(ValueError, match="replicas"):
+        args_object.parse_json(write_json(dict(valid_routing, replicas=9)))
+
+
+def test_validators_copy_args(write_json):
+    def mutate(args):
+        args["routes"]["a"].append("z")
+
+    args_object = json_configparser.ConfigArgs(OptionsRouting,
+                                               validators_lst=[json_configparser.Validator("m", mutate, ["routes"])])
+    assert args_object.parse_json(write_json(valid_routing)) == valid_routing
+
+
+def test_incremental_validators(write_json):
+    recorder = _Recorder()
+    args_object = json_configparser.ConfigArgs(OptionsRouting, frozen=True, validators_lst=_validators_lst(recorder))
+
+    args_object.parse_json(write_json(valid_routing))
+    assert [name for name, _ in recorder.calls] == ["routes", "replicas"]
+
+    # Unrelated argument changed
+    recorder.calls.clear()
+    args_object.parse_json(write_json(dict(valid_routing, debug=True)))
+    assert recorder.calls == []
+
+    recorder.calls.clear()
+    args_object.parse_json(write_json(dict(valid_routing, replicas=3)))
+    assert [name for name, _ in recorder.calls] == ["replicas"]
+
+    # A failed run is not remembered
+    recorder.calls.clear()
+    with pytest.raises(ValueError):
+        args_object.parse_json(write_json(dict(valid_routing, replicas=4)))
+    with pytest.raises(ValueError):
+        args_object.parse_json(write_json(dict(valid_routing, replicas=4)))
+    assert [name for name, _ in recorder.calls] == ["replicas", "replicas"]
+
+
+def test_validators_not_frozen(write_json):
+    recorder = _Recorder()
+    args_object = json_configparser.ConfigArgs(OptionsRouting, validators_lst=_validators_lst(recorder))
+
+    # Mutable arguments are not remembered, so every validator runs on every parse
+    args_object.parse_json(write_json(valid_routing))
+    args_object.parse_json(write_json(valid_routing))
+    assert [name for name, _ in recorder.calls] == ["routes", "replicas", "routes", "replicas"]
+
+
+def test_incremental_validators_source(tmp_path, write_json):
+    recorder = _Recorder()
+    args_object = json_configparser.ConfigArgs(OptionsRouting, frozen=True, validators_lst=_validators_lst(recorder))
+    path_to_json = write_json(valid_routing)
+    source = json_configparser.FileSource(path_to_json)
+
+    args_object.parse_source(source)
+    recorder.calls.clear()
+
+    (tmp_path / "args.json").write_text(json.dumps(dict(valid_routing, replicas=1, debug=True)) + " ")
+    assert args_object.parse_source(source)["replicas"] == 1
+    assert [name for name, _ in recorder.calls] == ["replicas"]
+
+
+def test_concurrent_validators(write_json):
+    recorder = _Recorder()
+    args_object = json_configparser.ConfigArgs(OptionsRouting, validators_lst=_validators_lst(recorder))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert args_object.parse_json(write_json(valid_routing), executor=executor) == valid_routing
+        assert sorted(name for name, _ in recorder.calls) == ["replicas", "routes"]
+
+        # The first failing validator, in the given order, is reported
+        with pytest.raises(ValueError, match="itself"):
+            args_object.parse_json(write_json(dict(valid_routing, routes={"a": ["a"]}, replicas=9)),
+                                   executor=executor)
+
+
+def test_validators_fingerprints(write_json, monkeypatch):
+    recorder = _Recorder()
+    args_object = json_configparser.ConfigArgs(OptionsRouting, frozen=True, validators_lst=_validators_lst(recorder))
+    result = args_object.parse_json(write_json(valid_routing))
+
+    hashed = []
+    monkeypatch.setattr(validators, "hash", lambda value: hashed.append(value) or hash(value), raising=False)
+
+    # The routes are shared with the previous result, so only the patched replicas are hashed
+    recorder.calls.clear()
+    args_object.apply_patch(result, [{"op": "replace", "path": "/replicas", "value": 3}])
+    assert hashed == [3]
+    assert [name for name, _ in recorder.calls] == ["replicas"]
+
+    # Equal values decoded again are hashed once per argument, and no validator runs
+    hashed.clear()
+    recorder.calls.clear()
+    args_object.parse_json(write_json(dict(valid_routing, replicas=3)))
+    assert [value for value in hashed if value == result["routes"]] == [result["routes"]]
+    assert recorder.calls == []
+
+
+def test_validators_unhashable_args():
+    calls = []
+    runner = validators.ValidatorRunner([json_configparser.Validator("a", calls.append, ["a"])], frozen=True)
+
+    runner.run({"a": [1]})
+    runner.run({"a": [1]})
+    assert len(calls) == 2
@@ -0,0 +1,140 @@
+import json
+import math
+import os
+import types
+
+import pytest
+
+import json_configparser
+from json_configparser import writer
+from .data import option_defs
+
+valid_dict = json_configparser.ConfigArgs(option_defs.OptionsOnly).parse_json("tests/data/valid.json")
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("chunk_size", [1, 10, writer.DEFAULT_CHUNK_SIZE])
+def test_write_json(tmp_path, indent, chunk_size):
+    path_to_json = str(tmp_path / "args.json")
+    writer.write_json(valid_dict, path_to_json, indent=indent, chunk_size=chunk_size)
+
+    with open(path_to_json, encoding="utf-8") as f:
+        assert json.load(f) == valid_dict
+    assert os.listdir(str(tmp_path)) == ["args.json"]
+
+
+def test_write_json_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(writer, "_BATCH_SIZE", 3)
+    value = {"a": list(range(10)), "b": {str(i): i for i in range(10)}, "c": (1, 2), "d": types.MappingProxyType({}),
+             "e": []}
+    path_to_json = str(tmp_path / "args.json")
+    writer.write_json(value, path_to_json)
+
+    with open(path_to_json, encoding="utf-8") as f:
+        assert json.load(f) == {"a": list(range(10)), "b": {str(i): i for i in range(10)}, "c": [1, 2], "d": {},
+                                "e": []}
+
+
+def test_write_json_sort_keys(tmp_path):
+    first_path, second_path = str(tmp_path / "first.json"), str(tmp_path / "second.json")
+    writer.write_json(valid_dict, first_path, sort_keys=True)
+    writer.write_json(dict(reversed(list(valid_dict.items()))), second_path, sort_keys=True)
+
+    with open(first_path, "rb") as first, open(second_path, "rb") as second:
+        assert first.read() == second.read()
+
+
+def test_write_json_keeps_existing_file_on_error(tmp_path):
+    path_to_json = tmp_path / "args.json"
+    path_to_json.write_text("{}")
+
+    with pytest.raises(TypeError):
+        writer.write_json({"a": object()}, str(path_to_json))
+
+    assert path_to_json.read_text() == "{}"
+    assert os.listdir(str(tmp_path)) == ["args.json"]
+
+
+@pytest.mark.parametrize("chunk_size", [0, "1", True])
+def test_write_json_invalid_chunk_size(tmp_path, chunk_size):
+    with pytest.raises(ValueError):
+        writer.write_json(valid_dict, str(tmp_path / "args.json"), chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_dump_json_round_trip(tmp_path, validate):
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsDefaults)
+    path_to_json = str(tmp_path / "args.json")
+
+    result = option_defs.OptionsDefaults(**args_object.parse_json("tests/data/valid.json"))
+    args_object.dump_json(result, path_to_json, validate=validate)
+
+    assert option_defs.OptionsDefaults(**args_object.parse_json(path_to_json)) == result
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("fill_defaults", [False, True])
+def test_dump_json_empty_default(tmp_path, frozen, fill_defaults):
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsEmptyDefaults, frozen=frozen,
+                                               fill_defaults=fill_defaults)
+    path_to_json = str(tmp_path / "args.json")
+
+    # Defaults are left out, since an empty list cannot be parsed again
+    result = args_object.validate_dict({"a1": 1})
+    args_object.dump_json(result, path_to_json)
+    with open(path_to_json, encoding="utf-8") as f:
+        assert json.load(f) == {"a1": 1}
+    assert args_object.parse_json(path_to_json) == result
+
+    args_object.dump_json(option_defs.OptionsEmptyDefaults(a1=1, a2=[2]), path_to_json)
+    with open(path_to_json, encoding="utf-8") as f:
+        assert json.load(f) == {"a1": 1, "a2": [2]}
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_dump_json_keeps_given_defaults(tmp_path, validate):
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsDefaults)
+    path_to_json = str(tmp_path / "args.json")
+
+    # Without fill_defaults, parsing does not add the defaults back, so they are written when given
+    result = {"a1": 1, "a3": "abc", "a5": [5, 5]}
+    args_object.dump_json(result, path_to_json, validate=validate)
+    assert args_object.parse_json(path_to_json) == result
+
+
+def test_dump_json_not_finite(tmp_path):
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsDefaults)
+    path_to_json = str(tmp_path / "args.json")
+
+    args_object.dump_json({"a2": float("inf"), "a6": [float("-inf")]}, path_to_json)
+    assert args_object.parse_json(path_to_json) == {"a2": float("inf"), "a6": [float("-inf")]}
+
+    args_object.dump_json({"a2": float("nan")}, path_to_json)
+    assert math.isnan(args_object.parse_json(path_to_json)["a2"])
+
+
+def test_dump_json_extra_validations(tmp_path):
+    def check_a2(args_dict):
+        if args_dict["a2"] > args_dict["a1"]:
+            raise ValueError("a2 should not exceed a1")
+
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsDefaults, extra_validations=check_a2, frozen=True)
+    path_to_json = str(tmp_path / "args.json")
+
+    # The extra validations receive every argument, including those equal to their default
+    result = args_object.validate_dict({"a1": 7})
+    args_object.dump_json(result, path_to_json)
+    assert args_object.parse_json(path_to_json) == result
+
+    with pytest.raises(ValueError):
+        args_object.dump_json(dict(result, a1=1), path_to_json)
+
+
+@pytest.mark.parametrize("result,error", [({"a1": "abc"}, TypeError),
+                                          ({"a1": 1, "unknown": 1}, ValueError),
+                                          ([1], TypeError)])
+def test_dump_json_invalid(tmp_path, result, error):
+    args_object = json_configparser.ConfigArgs(option_defs.OptionsEmptyDefaults)
+
+    with pytest.raises(error):
+        args_object.dump_json(result, str(tmp_path / "args.json"))